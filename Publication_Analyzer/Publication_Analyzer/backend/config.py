@@ -14,6 +14,12 @@ except ImportError:
     pass
 
 
+def _env_model_list(name: str, default: str) -> list[str]:
+    """Read a comma-separated model list from the environment (preferred model first)."""
+    models = [m.strip() for m in os.environ.get(name, "").split(",") if m.strip()]
+    return models or [default]
+
+
 class Config:
     """Application configuration."""
     
@@ -29,7 +35,24 @@ class Config:
     
     # Hugging Face configuration
     HF_TOKEN: Optional[str] = os.environ.get("HF_TOKEN") or os.environ.get("HUGGINGFACE_TOKEN")
-    HF_SUMMARY_MODEL: str = os.environ.get("HF_SUMMARY_MODEL", "HuggingFaceTB/SmolLM3-3B:hf-inference")
+    HF_SUMMARY_MODEL: str = os.environ.get("HF_SUMMARY_MODEL") or "HuggingFaceTB/SmolLM3-3B:hf-inference"
+    
+    # Task-specific model routes (comma-separated; the first model is preferred, the rest
+    # are alternatives the router shifts to when the preferred one is slow or failing)
+    HF_MODEL_ROUTES: dict[str, list[str]] = {
+        "scoring": _env_model_list("HF_SCORING_MODELS", HF_SUMMARY_MODEL),
+        "summary": _env_model_list("HF_SUMMARY_MODELS", HF_SUMMARY_MODEL),
+        "chat": _env_model_list("HF_CHAT_MODELS", HF_SUMMARY_MODEL),
+    }
+    # p95 latency (seconds) above which a model is considered degraded for that task
+    HF_MODEL_P95_LIMITS: dict[str, float] = {
+        "scoring": float(os.environ.get("HF_SCORING_P95_LIMIT", "10.0")),
+        "summary": float(os.environ.get("HF_SUMMARY_P95_LIMIT", "45.0")),
+        "chat": float(os.environ.get("HF_CHAT_P95_LIMIT", "20.0")),
+    }
+    HF_MODEL_ERROR_RATE_LIMIT: float = float(os.environ.get("HF_MODEL_ERROR_RATE_LIMIT", "0.25"))
+    HF_MODEL_MIN_SAMPLES: int = int(os.environ.get("HF_MODEL_MIN_SAMPLES", "5"))
+    HF_MODEL_STATS_WINDOW: int = int(os.environ.get("HF_MODEL_STATS_WINDOW", "50"))
     
     # Timeouts (in seconds)
     API_TIMEOUT: float = float(os.environ.get("API_TIMEOUT", "15.0"))
@@ -39,7 +62,96 @@ class Config:
     # Rate limiting
     MAX_BATCH_SIZE: int = int(os.environ.get("MAX_BATCH_SIZE", "50"))
     MAX_DASHBOARD_SIZE: int = int(os.environ.get("MAX_DASHBOARD_SIZE", "100"))
-    
+
+    # Chat sessions (idle TTL in seconds, turns replayed to the model)
+    CHAT_SESSION_TTL: float = float(os.environ.get("CHAT_SESSION_TTL", "1800"))
+    CHAT_MAX_TURNS: int = int(os.environ.get("CHAT_MAX_TURNS", "6"))
+    CHAT_MAX_SESSIONS: int = int(os.environ.get("CHAT_MAX_SESSIONS", "500"))
+
+    # Ranked-corpus mode for author works (whole corpus ranked once, pages served from cache)
+    RANKED_CORPUS_MAX_WORKS: int = int(os.environ.get("RANKED_CORPUS_MAX_WORKS", "500"))
+    RANKED_CORPUS_TTL: float = float(os.environ.get("RANKED_CORPUS_TTL", "3600"))
+    RANKED_CORPUS_CACHE_SIZE: int = int(os.environ.get("RANKED_CORPUS_CACHE_SIZE", "32"))
+    RANKED_CORPUS_CONCURRENCY: int = int(os.environ.get("RANKED_CORPUS_CONCURRENCY", "10"))
+    # Works (best first by the non-LLM components) that get an LLM evaluation per corpus
+    RANKED_CORPUS_LLM_TOP_N: int = int(os.environ.get("RANKED_CORPUS_LLM_TOP_N", "50"))
+
+    # Citation trajectories (per author; fresh for CITATION_TRAJECTORY_TTL seconds, then
+    # served stale for up to CITATION_TRAJECTORY_STALE_TTL more while refreshed)
+    CITATION_TRAJECTORY_TTL: float = float(os.environ.get("CITATION_TRAJECTORY_TTL", "21600"))
+    CITATION_TRAJECTORY_STALE_TTL: float = float(os.environ.get("CITATION_TRAJECTORY_STALE_TTL", "86400"))
+    CITATION_TRAJECTORY_MAX_WORKS: int = int(os.environ.get("CITATION_TRAJECTORY_MAX_WORKS", "5000"))
+
+    # Locally computed author metrics (h, i10, g, m-quotient for any publication window):
+    # each author's citation arrays are cached for AUTHOR_METRICS_TTL seconds, so changing
+    # the window does not refetch works
+    AUTHOR_METRICS_TTL: float = float(os.environ.get("AUTHOR_METRICS_TTL", "3600"))
+    AUTHOR_METRICS_MAX_WORKS: int = int(os.environ.get("AUTHOR_METRICS_MAX_WORKS", "5000"))
+    DEPARTMENT_METRICS_MAX_AUTHORS: int = int(os.environ.get("DEPARTMENT_METRICS_MAX_AUTHORS", "200"))
+
+    # Author search races Google Scholar and OpenAlex: after the first source with results,
+    # the other gets SEARCH_HEDGE_GRACE more seconds; no search waits past SEARCH_HEDGE_BUDGET
+    SEARCH_HEDGE_GRACE: float = float(os.environ.get("SEARCH_HEDGE_GRACE", "1.5"))
+    SEARCH_HEDGE_BUDGET: float = float(os.environ.get("SEARCH_HEDGE_BUDGET", "20.0"))
+
+    # Author and topic search results, keyed by normalized query: fresh for SEARCH_CACHE_TTL
+    # seconds, then served stale for up to SEARCH_CACHE_STALE_TTL more while refreshed
+    SEARCH_CACHE_TTL: float = float(os.environ.get("SEARCH_CACHE_TTL", "300"))
+    SEARCH_CACHE_STALE_TTL: float = float(os.environ.get("SEARCH_CACHE_STALE_TTL", "1800"))
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", "512"))
+
+    # Batch faculty endpoints: OpenAlex lookups run concurrently, at most this many at once
+    BATCH_CONCURRENCY: int = int(os.environ.get("BATCH_CONCURRENCY", "8"))
+    # Distinct names resolved from one uploaded roster CSV
+    ROSTER_MAX_NAMES: int = int(os.environ.get("ROSTER_MAX_NAMES", "5000"))
+
+    # Author autocomplete (local prefix index, OpenAlex autocomplete on a miss)
+    AUTHOR_INDEX_MAX_ENTRIES: int = int(os.environ.get("AUTHOR_INDEX_MAX_ENTRIES", "50000"))
+    AUTOCOMPLETE_TIMEOUT: float = float(os.environ.get("AUTOCOMPLETE_TIMEOUT", "3.0"))
+
+    # Google Scholar (dedicated thread pool for blocking scholarly calls; jobs beyond
+    # SCHOLAR_MAX_IN_FLIGHT queued or running are rejected and search falls back to OpenAlex)
+    SCHOLAR_MAX_WORKERS: int = int(os.environ.get("SCHOLAR_MAX_WORKERS", "4"))
+    SCHOLAR_MAX_IN_FLIGHT: int = int(os.environ.get("SCHOLAR_MAX_IN_FLIGHT", "16"))
+    GOOGLE_SCHOLAR_TIMEOUT: float = float(os.environ.get("GOOGLE_SCHOLAR_TIMEOUT", "30.0"))
+    SCHOLAR_ENRICHMENT_TTL: float = float(os.environ.get("SCHOLAR_ENRICHMENT_TTL", "600"))
+
+    # PDF reports render in PDF_WORKERS processes; beyond PDF_MAX_IN_FLIGHT queued or
+    # rendering reports, requests are rejected with 503
+    PDF_WORKERS: int = int(os.environ.get("PDF_WORKERS", "2"))
+    PDF_MAX_IN_FLIGHT: int = int(os.environ.get("PDF_MAX_IN_FLIGHT", "8"))
+
+    # Local data directory for persisted caches
+    DATA_DIR: Path = Path(os.environ.get("DATA_DIR") or Path(__file__).resolve().parent.parent / "data")
+
+    # Google Scholar profile cache (per-section TTLs in seconds)
+    SCHOLAR_CACHE_FILE: Path = Path(os.environ.get("SCHOLAR_CACHE_FILE") or DATA_DIR / "scholar_profiles.json")
+    SCHOLAR_CACHE_MAX_PROFILES: int = int(os.environ.get("SCHOLAR_CACHE_MAX_PROFILES", "2000"))
+    SCHOLAR_CACHE_SAVE_DELAY: float = float(os.environ.get("SCHOLAR_CACHE_SAVE_DELAY", "5"))
+    SCHOLAR_TTL_BASICS: float = float(os.environ.get("SCHOLAR_TTL_BASICS", "604800"))
+    SCHOLAR_TTL_INDICES: float = float(os.environ.get("SCHOLAR_TTL_INDICES", "86400"))
+    SCHOLAR_TTL_PUBLICATIONS: float = float(os.environ.get("SCHOLAR_TTL_PUBLICATIONS", "259200"))
+
+    # Background batch jobs (large rosters): persisted under JOB_STORE_DIR, processed
+    # JOB_CHUNK_SIZE names at a time by JOB_WORKERS workers, kept JOB_RETENTION seconds
+    JOB_STORE_DIR: Path = Path(os.environ.get("JOB_STORE_DIR") or DATA_DIR / "jobs")
+    JOB_WORKERS: int = int(os.environ.get("JOB_WORKERS", "2"))
+    JOB_CHUNK_SIZE: int = int(os.environ.get("JOB_CHUNK_SIZE", "50"))
+    JOB_MAX_ITEMS: int = int(os.environ.get("JOB_MAX_ITEMS", "5000"))
+    JOB_RETENTION: float = float(os.environ.get("JOB_RETENTION", "604800"))
+
+    # Remembered batch name -> author choices (per roster and institution)
+    DISAMBIGUATION_FILE: Path = Path(os.environ.get("DISAMBIGUATION_FILE") or DATA_DIR / "disambiguation.json")
+
+    # Similar-author search: topic vectors of every OpenAlex author fetched, kept in memory
+    # and saved to AUTHOR_TOPICS_FILE on shutdown
+    AUTHOR_TOPICS_FILE: Path = Path(os.environ.get("AUTHOR_TOPICS_FILE") or DATA_DIR / "author_topics.json")
+    SIMILAR_AUTHORS_MAX_ENTRIES: int = int(os.environ.get("SIMILAR_AUTHORS_MAX_ENTRIES", "20000"))
+
+    # Related-works search: hashed TF-IDF vectors of fetched works' titles and abstracts (in memory)
+    RELATED_WORKS_MAX_ENTRIES: int = int(os.environ.get("RELATED_WORKS_MAX_ENTRIES", "50000"))
+    RELATED_WORKS_FEATURES: int = int(os.environ.get("RELATED_WORKS_FEATURES", "262144"))
+
     # Application settings
     DEBUG: bool = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
     
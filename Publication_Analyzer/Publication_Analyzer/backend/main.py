@@ -3,18 +3,15 @@ Publications Summary Generator - Backend API
 Uses OpenAlex for author search and works (publications).
 AI summaries via Hugging Face Inference API (free; set HF_TOKEN or HUGGINGFACE_TOKEN).
 """
+import asyncio
+import itertools
+from collections.abc import Iterable
+import json
 import os
 import re
+import secrets
 from pathlib import Path
-from io import BytesIO
-from datetime import datetime
 
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
 # Load .env from project root so HF_TOKEN is set even when server is started via uvicorn --reload
 try:
@@ -24,7 +21,7 @@ try:
 except ImportError:
     pass
 
-from fastapi import FastAPI, Query, HTTPException, Body
+from fastapi import FastAPI, Query, HTTPException, Body, File, Form, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, StreamingResponse
@@ -33,8 +30,35 @@ import httpx
 
 # Import integrity analysis services
 from backend.services.integrity_analyzer import analyze_paper_integrity, batch_analyze_integrity
-from backend.services.llm_quality import evaluate_paper_llm, batch_evaluate_llm
-from backend.services.ranking_engine import rank_papers, get_top_papers, get_papers_by_risk
+from backend.services.llm_quality import evaluate_paper_llm, batch_evaluate_llm, get_evaluation_stats
+from backend.services.ranking_engine import (
+    rank_papers,
+    rerank_papers,
+    get_top_papers,
+    get_papers_by_risk,
+    component_matrix_from_papers,
+    parse_weights,
+    resolve_weights,
+    DEFAULT_WEIGHTS,
+    WEIGHT_PROFILES,
+)
+from backend.services.chat_sessions import chat_sessions
+from backend.services.model_router import model_router
+from backend.services.ttl_cache import TTLCache
+from backend.services.scholar_jobs import scholar_jobs
+from backend.services.scholar_cache import SECTIONS as SCHOLAR_SECTIONS, scholar_profiles
+from backend.services.author_index import author_index
+from backend.services.search_cache import SearchResultCache, author_search_cache, topic_search_cache
+from backend.services.job_queue import job_queue
+from backend.services.roster import RosterReader
+from backend.services.disambiguation import disambiguation_memory
+from backend.services.streaming_stats import StreamingSummary
+from backend.services.similar_authors import author_topic_index
+from backend.services.related_works import related_works
+from backend.services.pdf_report import PdfBusy, pdf_renderer
+from backend.services.citation_metrics import CitationTrajectoryBuilder, batch_metrics, metrics_rows, stack_works
+from backend.config import Config
+from backend.utils import merge_author_results, normalize_name, normalize_query, sanitize_author_id
 
 # Import scholarly for Google Scholar (lazy import to avoid startup delay)
 try:
@@ -48,10 +72,8 @@ except ImportError:
     GOOGLE_SCHOLAR_AVAILABLE = False
     scholarly = None
 
-# New Hugging Face router (api-inference.huggingface.co is deprecated)
-HF_ROUTER_URL = "https://router.huggingface.co/v1/chat/completions"
-# Default: HF Inference provider (often enabled by default). Override with HF_SUMMARY_MODEL env.
-HF_SUMMARY_MODEL = os.environ.get("HF_SUMMARY_MODEL") or "HuggingFaceTB/SmolLM3-3B:hf-inference"
+# Hugging Face router calls go through model_router, which picks a model per task
+# (scoring / summary / chat) from Config.HF_MODEL_ROUTES based on live latency.
 
 OPENALEX_BASE = "https://api.openalex.org"
 FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
@@ -98,6 +120,50 @@ def _log_hf_config():
     print("=" * 50)
 
 
+@app.on_event("startup")
+def _index_cached_authors():
+    """Seed the autocomplete index with cached Google Scholar profiles."""
+    for author in scholar_profiles.cached_authors():
+        author_index.add(
+            author["scholar_id"],
+            author.get("name"),
+            institution=author.get("affiliation"),
+            cited_by_count=author.get("citedby"),
+            source="Google Scholar",
+        )
+
+
+@app.on_event("shutdown")
+def _shutdown_scholar_jobs():
+    scholar_jobs.shutdown()
+
+
+@app.on_event("shutdown")
+def _flush_scholar_profiles():
+    scholar_profiles.flush()
+
+
+@app.on_event("startup")
+async def _start_job_queue():
+    """Start the batch job workers, resuming jobs left unfinished by the last run."""
+    await job_queue.start()
+
+
+@app.on_event("shutdown")
+async def _stop_job_queue():
+    await job_queue.stop()
+
+
+@app.on_event("shutdown")
+def _save_author_topics():
+    author_topic_index.save()
+
+
+@app.on_event("shutdown")
+def _shutdown_pdf_workers():
+    pdf_renderer.shutdown()
+
+
 def _hf_token() -> str | None:
     """Return HF token if set (from HF_TOKEN or HUGGINGFACE_TOKEN)."""
     return os.environ.get("HF_TOKEN") or os.environ.get("HUGGINGFACE_TOKEN") or None
@@ -127,78 +193,321 @@ async def health_check():
         "status": "healthy",
         "frontend_dir_exists": FRONTEND_DIR.exists(),
         "google_scholar_available": GOOGLE_SCHOLAR_AVAILABLE,
+        "scholar_queue_depth": scholar_jobs.snapshot()["queue_depth"],
         "ai_available": bool(_hf_token())
     }
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """Runtime counters for monitoring (LLM evaluation outcomes, per-model latency, Scholar jobs, search and trajectory caches, batch jobs, PDF workers)."""
+    return {
+        "llm_evaluation": get_evaluation_stats(),
+        "model_router": model_router.snapshot(),
+        "scholar_jobs": scholar_jobs.snapshot(),
+        "search_cache": {
+            "authors": author_search_cache.snapshot(),
+            "topics": topic_search_cache.snapshot(),
+        },
+        "citation_trajectories": _trajectory_cache.snapshot(),
+        "jobs": job_queue.snapshot(),
+        "pdf_renderer": pdf_renderer.snapshot(),
+    }
+
+
+def _scholar_search_result(author: dict) -> dict:
+    """Format a Google Scholar hit as an /api/search result."""
+    return {
+        "id": author.get("scholar_id", ""),
+        "display_name": author.get("name", ""),
+        "works_count": None,  # Not available in search
+        "cited_by_count": author.get("citations", 0),
+        "h_index": author.get("h_index"),
+        "i10_index": author.get("i10_index"),
+        "institution": author.get("affiliation"),
+        "country_code": None,
+        "photo_url": author.get("photo_url"),
+        "email": author.get("email"),
+        "interests": author.get("interests", []),
+        "profile_url": author.get("profile_url"),
+        "source": "Google Scholar",
+    }
+
+
+def _index_authors(results: list[dict]) -> None:
+    """Add author search results or profiles to the autocomplete index."""
+    for author in results:
+        institution = author.get("institution")
+        if institution is None and author.get("last_known_institutions"):
+            institution = author["last_known_institutions"][0].get("display_name")
+        author_index.add(
+            author.get("id"),
+            author.get("display_name"),
+            institution=institution,
+            cited_by_count=author.get("cited_by_count"),
+            source=author.get("source", "OpenAlex"),
+        )
+
+
+def _index_topics(authors: list[dict]) -> None:
+    """Add raw OpenAlex author objects to the similar-author topic index."""
+    for author in authors:
+        author_topic_index.add_author(author)
+
+
+async def _search_scholar_authors(q: str, progressive: bool) -> dict:
+    """Google Scholar side of author search: formatted results, plus an enrichment id when progressive."""
+    if progressive:
+        hits = await scholar_jobs.run(_scholar_search_hits, q, 10, timeout=Config.GOOGLE_SCHOLAR_TIMEOUT)
+        if not hits:
+            return {"results": []}
+        return {
+            "results": [_scholar_search_result(_format_scholar_hit(hit)) for hit in hits],
+            "enrichment_id": _start_scholar_enrichment(hits),
+        }
+    gs_results = await _search_google_scholar_multiple(q, limit=10)
+    return {"results": [_scholar_search_result(author) for author in gs_results]}
+
+
+async def _search_openalex_authors(q: str) -> dict:
+    """OpenAlex side of author search."""
+    async with httpx.AsyncClient(timeout=15.0) as client:
+        r = await client.get(
+            f"{OPENALEX_BASE}/authors",
+            params={"search": q, "per_page": 25},
+        )
+        r.raise_for_status()
+        data = r.json()
+    _index_topics(data.get("results", []))
+    
+    results = []
+    for author in data.get("results", []):
+        inst = (author.get("last_known_institutions") or [None])[0]
+        results.append({
+            "id": author.get("id", "").replace("https://openalex.org/", ""),
+            "display_name": author.get("display_name", ""),
+            "works_count": author.get("works_count", 0),
+            "cited_by_count": author.get("cited_by_count", 0),
+            "h_index": (author.get("summary_stats") or {}).get("h_index"),
+            "i10_index": (author.get("summary_stats") or {}).get("i10_index"),
+            "institution": inst.get("display_name") if inst else None,
+            "country_code": inst.get("country_code") if inst else None,
+            "photo_url": None,  # OpenAlex doesn't provide photos
+            "email": None,
+            "interests": [],
+            "profile_url": author.get("id", ""),
+            "source": "OpenAlex",
+        })
+    return {"results": results}
+
+
+async def _hedged_search(searches: dict, grace: float, budget: float) -> tuple[dict, dict]:
+    """
+    Run source searches concurrently and stop shortly after the first usable one.
+    
+    Once a source returns results, the others get `grace` more seconds; nothing waits
+    past `budget`. Unfinished searches are cancelled.
+    
+    Args:
+        searches: Source name -> coroutine returning {"results": [...], ...}
+    
+    Returns:
+        (source -> finished response, source -> exception)
+    """
+    loop = asyncio.get_running_loop()
+    tasks = {asyncio.ensure_future(coro): source for source, coro in searches.items()}
+    deadline = loop.time() + budget
+    responses, errors = {}, {}
+    pending = set(tasks)
+    
+    while pending:
+        done, pending = await asyncio.wait(
+            pending,
+            timeout=max(0.0, deadline - loop.time()),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if not done:
+            break
+        for task in done:
+            source = tasks[task]
+            try:
+                responses[source] = task.result()
+            except Exception as e:
+                errors[source] = e
+                continue
+            if responses[source].get("results"):
+                deadline = min(deadline, loop.time() + grace)
+    
+    for task in pending:
+        task.cancel()
+    return responses, errors
+
+
 @app.get("/api/search")
-async def search_authors(q: str = Query(..., min_length=2)):
+async def search_authors(
+    q: str = Query(..., min_length=2),
+    progressive: bool = Query(False, description="Return Scholar hits before their profiles are filled; poll enrichment_id for the rest"),
+):
     """
-    Search authors by name using Google Scholar (primary) with OpenAlex fallback.
-    Returns a list of matching faculty with profile photos and detailed info.
+    Search authors by name on Google Scholar and OpenAlex at the same time.
+    
+    Returns shortly after the first source with results answers; whatever the other
+    source returned by then is merged in, with duplicates (same name and affiliation)
+    combined. Returns a list of matching faculty with profile photos and detailed info.
+    
+    Results are cached per normalized query (stale-while-revalidate). When a source
+    failed or ran out of time the response carries "partial": true, and an empty
+    partial response is not cached.
     """
-    results = []
+    key = (normalize_query(q), progressive)
+    cached, _ = await author_search_cache.get(
+        key,
+        lambda: _run_author_search(q, progressive),
+        cacheable=lambda response: bool(response["results"]) or not response.get("partial"),
+    )
+    return {**_settle_cached_enrichment(cached), "query": q}
+
+
+def _settle_cached_enrichment(response: dict) -> dict:
+    """Fold a finished (or expired) progressive enrichment into a cached search response."""
+    enrichment_id = response.get("enrichment_id")
+    if not enrichment_id:
+        return response
+    enrichment = _scholar_enrichments.get(enrichment_id)
+    if enrichment is not None and enrichment["status"] == "pending":
+        return response
     
-    # Try Google Scholar first (if available)
+    settled = {k: v for k, v in response.items() if k != "enrichment_id"}
+    if enrichment is not None and enrichment["status"] == "done":
+        results = merge_author_results(enrichment.get("results") or [], enrichment.get("extra_results") or [])
+        settled.update(results=results, count=len(results))
+    return settled
+
+
+async def _run_author_search(q: str, progressive: bool) -> dict:
+    """Run the hedged Scholar/OpenAlex author search and merge the results."""
+    searches = {}
     if GOOGLE_SCHOLAR_AVAILABLE:
-        try:
-            gs_results = await _search_google_scholar_multiple(q, limit=10)
-            
-            if gs_results:
-                # Format Google Scholar results
-                for author in gs_results:
-                    results.append({
-                        "id": author.get("scholar_id", ""),
-                        "display_name": author.get("name", ""),
-                        "works_count": None,  # Not available in search
-                        "cited_by_count": author.get("citations", 0),
-                        "h_index": author.get("h_index"),
-                        "i10_index": author.get("i10_index"),
-                        "institution": author.get("affiliation"),
-                        "country_code": None,
-                        "photo_url": author.get("photo_url"),
-                        "email": author.get("email"),
-                        "interests": author.get("interests", []),
-                        "profile_url": author.get("profile_url"),
-                        "source": "Google Scholar",
-                    })
-                
-                return {"query": q, "count": len(results), "results": results, "source": "Google Scholar"}
-        except Exception:
-            pass  # Fall through to OpenAlex
+        searches["Google Scholar"] = _search_scholar_authors(q, progressive)
+    searches["OpenAlex"] = _search_openalex_authors(q)
+    
+    responses, errors = await _hedged_search(
+        searches,
+        grace=Config.SEARCH_HEDGE_GRACE,
+        budget=Config.SEARCH_HEDGE_BUDGET,
+    )
+    if "OpenAlex" in errors and not any(r.get("results") for r in responses.values()):
+        raise HTTPException(status_code=500, detail=f"Search failed: {str(errors['OpenAlex'])}")
+    if not responses and not errors:
+        raise HTTPException(status_code=504, detail="Search timed out; no source answered in time")
     
-    # Fallback to OpenAlex if Google Scholar fails or is unavailable
+    # Scholar entries first (photos, interests); OpenAlex fills gaps and adds the rest
+    scholar = responses.get("Google Scholar") or {}
+    openalex = responses.get("OpenAlex") or {}
+    results = merge_author_results(scholar.get("results") or [], openalex.get("results") or [])
+    _index_authors(results)
+    sources = [source for source in searches if (responses.get(source) or {}).get("results")]
+    
+    response = {
+        "query": q,
+        "count": len(results),
+        "results": results,
+        "source": " + ".join(sources) or "OpenAlex",
+    }
+    if len(responses) < len(searches):
+        response["partial"] = True  # A source failed or was cut off by the budget
+    if scholar.get("enrichment_id"):
+        # The enrichment merges the filled Scholar profiles with these OpenAlex results
+        _attach_enrichment_results(scholar["enrichment_id"], openalex.get("results") or [])
+        response["enrichment_id"] = scholar["enrichment_id"]
+    return response
+
+
+def _ranking_weights(profile: str | None, weights: str | None) -> dict:
+    """Resolve ranking profile/custom weight query params, as a 400 on bad input."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            r = await client.get(
-                f"{OPENALEX_BASE}/authors",
-                params={"search": q, "per_page": 25},
-            )
+        custom = parse_weights(weights) if weights else None
+        return resolve_weights(profile, custom)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/api/search/enrichment/{enrichment_id}")
+async def get_search_enrichment(enrichment_id: str):
+    """Filled Scholar profiles for a progressive search (status: pending, done or failed)."""
+    enrichment = _scholar_enrichments.get(enrichment_id)
+    if enrichment is None:
+        raise HTTPException(status_code=404, detail="Enrichment not found or expired")
+    extra = enrichment.get("extra_results") or []
+    sources = ["Google Scholar"] + (["OpenAlex"] if extra else [])
+    return {
+        "enrichment_id": enrichment_id,
+        "status": enrichment["status"],
+        "results": merge_author_results(enrichment.get("results") or [], extra),
+        "source": " + ".join(sources),
+        **({"error": enrichment["error"]} if "error" in enrichment else {}),
+    }
+
+
+# OpenAlex autocomplete answers, briefly cached per normalized prefix
+_autocomplete_cache = TTLCache(ttl=300, max_entries=2048)
+
+
+async def _openalex_autocomplete(q: str) -> list[dict]:
+    """Author suggestions from OpenAlex's autocomplete API (empty on error or timeout)."""
+    key = normalize_name(q)
+    cached = _autocomplete_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        async with httpx.AsyncClient(timeout=Config.AUTOCOMPLETE_TIMEOUT) as client:
+            r = await client.get(f"{OPENALEX_BASE}/autocomplete/authors", params={"q": q})
             r.raise_for_status()
             data = r.json()
-        
-        for author in data.get("results", []):
-            inst = (author.get("last_known_institutions") or [None])[0]
-            results.append({
-                "id": author.get("id", "").replace("https://openalex.org/", ""),
-                "display_name": author.get("display_name", ""),
-                "works_count": author.get("works_count", 0),
-                "cited_by_count": author.get("cited_by_count", 0),
-                "h_index": (author.get("summary_stats") or {}).get("h_index"),
-                "i10_index": (author.get("summary_stats") or {}).get("i10_index"),
-                "institution": inst.get("display_name") if inst else None,
-                "country_code": inst.get("country_code") if inst else None,
-                "photo_url": None,  # OpenAlex doesn't provide photos
-                "email": None,
-                "interests": [],
-                "profile_url": author.get("id", ""),
-                "source": "OpenAlex",
-            })
-        
-        return {"query": q, "count": len(results), "results": results, "source": "OpenAlex"}
+    except Exception:
+        return []
+    suggestions = [
+        {
+            "id": (a.get("id") or "").replace("https://openalex.org/", ""),
+            "display_name": a.get("display_name", ""),
+            "institution": a.get("hint"),
+            "cited_by_count": a.get("cited_by_count"),
+            "source": "OpenAlex",
+        }
+        for a in data.get("results") or []
+        if a.get("id") and a.get("display_name")
+    ]
+    _autocomplete_cache.set(key, suggestions)
+    return suggestions
+
+
+@app.get("/api/autocomplete")
+async def autocomplete_authors(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(8, ge=1, le=20),
+):
+    """
+    Author name suggestions for typeahead.
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+    Served from the local prefix index of every author seen so far; OpenAlex
+    autocomplete fills in when the index has too few matches.
+    """
+    results = author_index.search(q, limit)
+    source = "local"
+    if len(results) < limit and len(q.strip()) >= 2:
+        remote = await _openalex_autocomplete(q)
+        if remote:
+            _index_authors(remote)
+            seen = {r["id"] for r in results}
+            results += [r for r in remote if r["id"] not in seen][:limit - len(results)]
+            source = "local+openalex" if seen else "openalex"
+    return {"query": q, "results": results, "source": source}
+
+
+@app.get("/api/ranking/profiles")
+async def get_ranking_profiles():
+    """List the named ranking weight profiles."""
+    return {"default": "balanced", "profiles": WEIGHT_PROFILES}
 
 
 @app.get("/api/search/papers")
@@ -210,6 +519,8 @@ async def search_papers_by_topic(
     year_to: int | None = Query(None, ge=2100, description="Filter by end year"),
     enable_llm: bool = Query(True, description="Enable LLM quality evaluation"),
     enable_integrity: bool = Query(True, description="Enable integrity analysis"),
+    profile: str = Query("balanced", description="Ranking weight profile (see /api/ranking/profiles)"),
+    weights: str | None = Query(None, description="Custom weights overriding the profile, e.g. citation:0.4,llm:0.3"),
 ):
     """
     Search research papers by topic with integrity analysis and smart ranking.
@@ -217,8 +528,35 @@ async def search_papers_by_topic(
     This endpoint allows users to search for papers on any topic and get ranked results
     based on quality, integrity, citations, and relevance.
     
+    Results are cached per normalized topic, filters and page (stale-while-revalidate);
+    other weight profiles re-rank the cached analysis.
+    
     Example: /api/search/papers?topic=machine learning&per_page=10
     """
+    ranking_weights = _ranking_weights(profile, weights)
+    llm_active = bool(enable_llm and _hf_token())
+    key = (normalize_query(topic), per_page, page, year_from, year_to, llm_active, enable_integrity)
+    cached, _ = await topic_search_cache.get(
+        key,
+        lambda: _run_topic_search(topic, per_page, page, year_from, year_to, llm_active, enable_integrity),
+    )
+    
+    response = {**cached, "query": topic, "weights": ranking_weights}
+    if ranking_weights != DEFAULT_WEIGHTS and cached["results"]:
+        response["results"] = rerank_papers(cached["results"], ranking_weights)
+    return response
+
+
+async def _run_topic_search(
+    topic: str,
+    per_page: int,
+    page: int,
+    year_from: int | None,
+    year_to: int | None,
+    enable_llm: bool,
+    enable_integrity: bool,
+) -> dict:
+    """Fetch, analyze and rank one page of topic search results (default weights)."""
     # Search OpenAlex for papers matching the topic
     filters = []
     if year_from is not None:
@@ -286,6 +624,8 @@ async def search_papers_by_topic(
                 "open_access_status": (w.get("open_access") or {}).get("oa_status"),
             })
         
+        related_works.add_works(works)
+        
         if not works:
             return {
                 "query": topic,
@@ -308,7 +648,7 @@ async def search_papers_by_topic(
                 }
         
         # Run LLM evaluation if enabled and token available
-        if enable_llm and _hf_token():
+        if enable_llm:
             llm_results = await batch_evaluate_llm(works, query=topic, max_concurrent=3)
             for paper, llm in zip(works, llm_results):
                 paper["llm"] = llm
@@ -335,7 +675,7 @@ async def search_papers_by_topic(
                 "count": meta.get("count", 0),
             },
             "analysis_enabled": enable_integrity,
-            "llm_enabled": enable_llm and _hf_token() is not None,
+            "llm_enabled": enable_llm,
         }
     
     except Exception as e:
@@ -351,49 +691,33 @@ async def get_author(author_id: str):
     # Check if it's a Google Scholar ID (doesn't start with 'A')
     if not author_id.startswith("A") and GOOGLE_SCHOLAR_AVAILABLE:
         try:
-            # Fetch from Google Scholar
-            import asyncio
-            
-            loop = asyncio.get_event_loop()
-            
-            def _get_scholar_profile():
-                try:
-                    from scholarly import scholarly
-                    author = scholarly.search_author_id(author_id)
-                    if not author:
-                        return None
-                    author_filled = scholarly.fill(author, sections=['basics', 'indices', 'publications'])
-                    
-                    return {
-                        "id": author_filled.get('scholar_id'),
-                        "display_name": author_filled.get('name'),
-                        "display_name_alternatives": [],
-                        "works_count": len(author_filled.get('publications', [])),
-                        "cited_by_count": author_filled.get('citedby', 0),
-                        "summary_stats": {
-                            "h_index": author_filled.get('hindex'),
-                            "i10_index": author_filled.get('i10index'),
-                        },
-                        "orcid": None,
-                        "last_known_institutions": [
-                            {"display_name": author_filled.get('affiliation'), "country_code": None}
-                        ] if author_filled.get('affiliation') else [],
-                        "works_api_url": None,
-                        "photo_url": author_filled.get('url_picture'),
-                        "email": author_filled.get('email'),
-                        "interests": author_filled.get('interests', []),
-                        "source": "Google Scholar",
-                    }
-                except Exception:
-                    return None
-            
-            result = await asyncio.wait_for(
-                loop.run_in_executor(None, _get_scholar_profile),
-                timeout=20.0
-            )
-            
-            if result:
-                return result
+            # Basics and indices come from the profile cache when fresh; publications are
+            # only filled when the works tab asks for them
+            author_filled = await _scholar_profile(author_id, ["basics", "indices"], timeout=20.0)
+            if author_filled:
+                cached_publications = scholar_profiles.get(author_id, ["publications"])
+                profile = {
+                    "id": author_filled.get('scholar_id'),
+                    "display_name": author_filled.get('name'),
+                    "display_name_alternatives": [],
+                    "works_count": len(cached_publications["publications"]) if cached_publications else None,
+                    "cited_by_count": author_filled.get('citedby', 0),
+                    "summary_stats": {
+                        "h_index": author_filled.get('hindex'),
+                        "i10_index": author_filled.get('i10index'),
+                    },
+                    "orcid": None,
+                    "last_known_institutions": [
+                        {"display_name": author_filled.get('affiliation'), "country_code": None}
+                    ] if author_filled.get('affiliation') else [],
+                    "works_api_url": None,
+                    "photo_url": author_filled.get('url_picture'),
+                    "email": author_filled.get('email'),
+                    "interests": author_filled.get('interests', []),
+                    "source": "Google Scholar",
+                }
+                _index_authors([profile])
+                return profile
         except Exception:
             pass  # Fall through to OpenAlex
     
@@ -405,8 +729,9 @@ async def get_author(author_id: str):
             raise HTTPException(status_code=404, detail="Author not found")
         r.raise_for_status()
         author = r.json()
+    _index_topics([author])
     insts = author.get("last_known_institutions") or []
-    return {
+    profile = {
         "id": author.get("id", "").replace("https://openalex.org/", ""),
         "display_name": author.get("display_name", ""),
         "display_name_alternatives": author.get("display_name_alternatives", []),
@@ -424,6 +749,110 @@ async def get_author(author_id: str):
         "interests": [],
         "source": "OpenAlex",
     }
+    _index_authors([profile])
+    return profile
+
+
+# Authors fetched for /similar that had no topics; answered 422 without refetching for a while
+_authors_without_topics = TTLCache(ttl=600, max_entries=2048)
+
+
+@app.get("/api/author/{author_id}/similar")
+async def get_similar_authors(author_id: str, k: int = Query(10, ge=1, le=50)):
+    """
+    Researchers with the most similar topic mix (cosine similarity of topic vectors).
+    
+    Searches every OpenAlex author the app has fetched so far, in memory; an author
+    not yet indexed is fetched once first. Authors without topics (or legacy
+    concepts) can't be compared and get a 422.
+    """
+    try:
+        aid = sanitize_author_id(author_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if aid in _authors_without_topics:
+        raise HTTPException(status_code=422, detail="Author has no topic profile")
+    if aid not in author_topic_index:
+        async with httpx.AsyncClient(timeout=15.0) as client:
+            r = await client.get(f"{OPENALEX_BASE}/authors/{aid}")
+            if r.status_code == 404:
+                raise HTTPException(status_code=404, detail="Author not found")
+            r.raise_for_status()
+            author = r.json()
+        _index_authors([{**author, "id": aid}])
+        if not author_topic_index.add_author(author):
+            _authors_without_topics.set(aid, True)
+            raise HTTPException(status_code=422, detail="Author has no topic profile")
+    
+    return {
+        "author_id": aid,
+        "similar": author_topic_index.similar(aid, k) or [],
+        "indexed_authors": len(author_topic_index),
+    }
+
+
+def _scholar_work(pub: dict) -> dict:
+    """Format a cached Scholar publication like an OpenAlex work summary."""
+    bib = pub.get("bib") or {}
+    try:
+        year = int(bib.get("pub_year"))
+    except (TypeError, ValueError):
+        year = None
+    return {
+        "id": pub.get("author_pub_id") or "",
+        "title": bib.get("title", ""),
+        "publication_year": year,
+        "publication_date": None,
+        "cited_by_count": pub.get("num_citations", 0),
+        "doi": None,
+        "type": None,
+        "venue": bib.get("citation") or bib.get("venue") or bib.get("journal"),
+        "is_oa": None,
+        "open_access_status": None,
+    }
+
+
+async def _get_scholar_works(
+    scholar_id: str,
+    page: int,
+    per_page: int,
+    sort_by: str,
+    sort_order: str,
+    year_from: int | None,
+    year_to: int | None,
+    min_citations: int | None,
+) -> dict:
+    """Works tab for a Google Scholar profile: publications are filled on first use, then cached."""
+    try:
+        profile = await _scholar_profile(scholar_id, ["publications"], timeout=Config.GOOGLE_SCHOLAR_TIMEOUT)
+    except Exception:
+        profile = None
+    if profile is None:
+        raise HTTPException(status_code=502, detail="Google Scholar publications are unavailable right now")
+    
+    works = [_scholar_work(pub) for pub in profile.get("publications") or []]
+    if year_from is not None:
+        works = [w for w in works if w["publication_year"] and w["publication_year"] >= year_from]
+    if year_to is not None:
+        works = [w for w in works if w["publication_year"] and w["publication_year"] <= year_to]
+    if min_citations:
+        works = [w for w in works if (w["cited_by_count"] or 0) >= min_citations]
+    
+    if sort_by == "title":
+        sort_key = lambda w: (w["title"] or "").lower()
+    elif sort_by == "cited_by_count":
+        sort_key = lambda w: w["cited_by_count"] or 0
+    else:
+        sort_key = lambda w: w["publication_year"] or 0  # Scholar only has the year
+    works.sort(key=sort_key, reverse=sort_order == "desc")
+    
+    start = (page - 1) * per_page
+    return {
+        "results": works[start:start + per_page],
+        "meta": {"page": page, "per_page": per_page, "count": len(works)},
+        "source": "Google Scholar",
+    }
 
 
 @app.get("/api/author/{author_id}/works")
@@ -438,6 +867,9 @@ async def get_author_works(
     min_citations: int | None = Query(None, ge=0),
 ):
     """Get publications (works) for an author. Paginated, with optional sort and filters."""
+    if not author_id.startswith("A") and GOOGLE_SCHOLAR_AVAILABLE:
+        return await _get_scholar_works(author_id, page, per_page, sort_by, sort_order, year_from, year_to, min_citations)
+    
     aid = author_id if author_id.startswith("A") else f"A{author_id}"
     sort_field = "publication_date" if sort_by == "publication_date" else "cited_by_count" if sort_by == "cited_by_count" else "title"
     sort_param = f"{sort_field}:{sort_order}"
@@ -479,6 +911,7 @@ async def get_author_works(
             "is_oa": (w.get("open_access") or {}).get("is_oa"),
             "open_access_status": (w.get("open_access") or {}).get("oa_status"),
         })
+    related_works.add_works(works)
     return {
         "results": works,
         "meta": {
@@ -489,6 +922,172 @@ async def get_author_works(
     }
 
 
+def _parse_ranked_work(w: dict) -> dict:
+    """Flatten an OpenAlex work into the paper dict used by integrity/LLM analysis and ranking."""
+    loc = w.get("primary_location") or {}
+    src = loc.get("source") or {}
+    
+    # Get authors
+    authors = []
+    for auth in (w.get("authorships") or [])[:5]:  # Limit to first 5 authors
+        author_info = auth.get("author") or {}
+        if author_info.get("display_name"):
+            authors.append(author_info.get("display_name"))
+    
+    # Abstract feeds local query relevance and the LLM evaluation prompt
+    abstract_inv = w.get("abstract_inverted_index")
+    abstract = _abstract_from_inverted_index(abstract_inv) if isinstance(abstract_inv, dict) else ""
+    
+    return {
+        "id": (w.get("id") or "").replace("https://openalex.org/", ""),
+        "title": w.get("title", ""),
+        "abstract": abstract[:500] if abstract else "",  # Limit abstract length
+        "year": w.get("publication_year"),
+        "publication_year": w.get("publication_year"),
+        "publication_date": w.get("publication_date"),
+        "cited_by_count": w.get("cited_by_count", 0),
+        "doi": (w.get("ids") or {}).get("doi"),
+        "type": w.get("type"),
+        "venue": src.get("display_name"),
+        "authors": authors,
+        "is_oa": (w.get("open_access") or {}).get("is_oa"),
+        "open_access_status": (w.get("open_access") or {}).get("oa_status"),
+    }
+
+
+async def _analyze_works(
+    works: list[dict],
+    enable_llm: bool,
+    query: str | None,
+    max_concurrent: int | None = None,
+) -> None:
+    """Attach integrity and LLM analysis to each work in place."""
+    # Run integrity analysis (batch for efficiency)
+    integrity_results = await batch_analyze_integrity(works, max_concurrent=max_concurrent)
+    for paper, integrity in zip(works, integrity_results):
+        paper["integrity"] = integrity
+    
+    # Run LLM evaluation if enabled and token available
+    if enable_llm and _hf_token():
+        llm_results = await batch_evaluate_llm(works, query=query, max_concurrent=3)
+        for paper, llm in zip(works, llm_results):
+            paper["llm"] = llm
+    else:
+        # Add default LLM scores
+        for paper in works:
+            paper["llm"] = {
+                "quality_score": 5,
+                "credibility_score": 5,
+                "relevance_score": 5,
+                "suspicious": False,
+                "reason": "LLM evaluation disabled or unavailable",
+            }
+
+
+async def _fetch_author_for_ranking(aid: str) -> dict | None:
+    """Fetch author info for reputation scoring (None if unavailable)."""
+    try:
+        async with httpx.AsyncClient(timeout=15.0) as client:
+            author_response = await client.get(f"{OPENALEX_BASE}/authors/{aid}")
+            author_response.raise_for_status()
+            author = author_response.json()
+            _index_topics([author])
+            return author
+    except Exception:
+        return None
+
+
+# Ranked author corpora: (author, filters, llm, query) -> ranked works, served page by page
+_ranked_corpus_cache = TTLCache(ttl=Config.RANKED_CORPUS_TTL, max_entries=Config.RANKED_CORPUS_CACHE_SIZE)
+_ranked_corpus_builds: dict[tuple, asyncio.Task] = {}
+
+
+async def _build_ranked_corpus(aid: str, filters: list[str], enable_llm: bool, query: str | None) -> dict:
+    """Fetch all of an author's works (cursor paging), analyze and rank them once."""
+    author_data = await _fetch_author_for_ranking(aid)
+    
+    works = []
+    total_count = 0
+    cursor = "*"
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        while cursor and len(works) < Config.RANKED_CORPUS_MAX_WORKS:
+            r = await client.get(
+                f"{OPENALEX_BASE}/works",
+                params={
+                    "filter": ",".join(filters),
+                    "per_page": 200,
+                    "cursor": cursor,
+                    "sort": "cited_by_count:desc",
+                },
+            )
+            if r.status_code == 404:
+                raise HTTPException(status_code=404, detail="Not found")
+            r.raise_for_status()
+            data = r.json()
+            results = data.get("results") or []
+            meta = data.get("meta") or {}
+            total_count = meta.get("count", total_count)
+            works.extend(_parse_ranked_work(w) for w in results)
+            cursor = meta.get("next_cursor") if results else None
+    works = works[:Config.RANKED_CORPUS_MAX_WORKS]
+    related_works.add_works(works)
+    
+    llm_evaluated, llm_degraded = 0, False
+    if works:
+        # Integrity for every work; LLM evaluation only for the works that rank highest
+        # without it, so a large corpus costs at most RANKED_CORPUS_LLM_TOP_N model calls
+        await _analyze_works(works, False, query, max_concurrent=Config.RANKED_CORPUS_CONCURRENCY)
+        if enable_llm and _hf_token():
+            for paper in works:
+                paper["llm"]["reason"] = f"Not evaluated (outside the top {Config.RANKED_CORPUS_LLM_TOP_N} works)"
+            top = rank_papers(works, author=author_data, query=query, top_k=Config.RANKED_CORPUS_LLM_TOP_N)
+            llm_results = await batch_evaluate_llm(top, query=query, max_concurrent=3)
+            for paper, llm in zip(top, llm_results):
+                paper["llm"] = llm
+            llm_evaluated = len(top)
+            llm_degraded = any(llm.get("evaluated") is False for llm in llm_results)
+    ranked = rank_papers(works, author=author_data, query=query)
+    return {
+        "works": ranked,
+        # Component vectors kept alongside so other weight profiles re-rank without re-analysis
+        "matrix": component_matrix_from_papers(ranked),
+        "count": total_count,
+        "truncated": total_count > len(ranked),
+        "llm_evaluated": llm_evaluated,
+        "llm_degraded": llm_degraded,
+    }
+
+
+async def _get_ranked_corpus(aid: str, filters: list[str], enable_llm: bool, query: str | None) -> dict:
+    """
+    Return the cached ranked corpus, building it at most once per key concurrently.
+    
+    A corpus whose LLM evaluations failed (credits, timeouts) is returned but not
+    cached, so neutral fallback scores aren't served for RANKED_CORPUS_TTL.
+    """
+    llm_active = bool(enable_llm and _hf_token())
+    key = (aid, tuple(filters), llm_active, (query or "").strip().lower())
+    corpus = _ranked_corpus_cache.get(key)
+    if corpus is not None:
+        return corpus
+    
+    task = _ranked_corpus_builds.get(key)
+    if task is None:
+        async def _build():
+            try:
+                built = await _build_ranked_corpus(aid, filters, llm_active, query)
+                if not built["llm_degraded"]:
+                    _ranked_corpus_cache.set(key, built)
+                return built
+            finally:
+                _ranked_corpus_builds.pop(key, None)
+        
+        task = asyncio.ensure_future(_build())
+        _ranked_corpus_builds[key] = task
+    # Shield so a client timeout doesn't cancel a build other requests (or a retry) will use
+    return await asyncio.shield(task)
+
+
 @app.get("/api/author/{author_id}/works/ranked")
 async def get_author_works_ranked(
     author_id: str,
@@ -499,23 +1098,23 @@ async def get_author_works_ranked(
     min_citations: int | None = Query(None, ge=0),
     enable_llm: bool = Query(True, description="Enable LLM quality evaluation"),
     query: str | None = Query(None, description="Search query for relevance scoring"),
+    corpus: bool = Query(False, description="Rank the author's whole corpus once and serve pages from the cached ranking"),
+    profile: str = Query("balanced", description="Ranking weight profile (see /api/ranking/profiles)"),
+    weights: str | None = Query(None, description="Custom weights overriding the profile, e.g. citation:0.4,llm:0.3"),
 ):
     """
     Get publications with integrity analysis and smart ranking.
     Returns papers sorted by quality score combining citations, integrity, and LLM evaluation.
+    
+    By default only the requested OpenAlex page is ranked. With corpus=true all works
+    (up to RANKED_CORPUS_MAX_WORKS) are ranked together and cached, so every page
+    comes from one global ordering; only the RANKED_CORPUS_LLM_TOP_N works ranked
+    highest on the other components get an LLM evaluation. Switching profile/weights on a cached corpus
+    only re-weights the stored score components.
     """
-    # Fetch author info for reputation scoring
+    ranking_weights = _ranking_weights(profile, weights)
     aid = author_id if author_id.startswith("A") else f"A{author_id}"
     
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            author_response = await client.get(f"{OPENALEX_BASE}/authors/{aid}")
-            author_response.raise_for_status()
-            author_data = author_response.json()
-    except Exception:
-        author_data = None
-    
-    # Fetch works (same as regular endpoint)
     filters = [f"author.id:{aid}"]
     if year_from is not None:
         filters.append(f"from_publication_date:{year_from}-01-01")
@@ -524,6 +1123,38 @@ async def get_author_works_ranked(
     if min_citations is not None and min_citations > 0:
         filters.append(f"cited_by_count:>={min_citations}")
     
+    if corpus:
+        ranked_corpus = await _get_ranked_corpus(aid, filters, enable_llm, query)
+        start = (page - 1) * per_page
+        if ranking_weights == DEFAULT_WEIGHTS:
+            page_works = ranked_corpus["works"][start:start + per_page]
+        else:
+            page_works = rerank_papers(
+                ranked_corpus["works"],
+                ranking_weights,
+                top_k=start + per_page,
+                matrix=ranked_corpus["matrix"],
+            )[start:]
+        return {
+            "results": page_works,
+            "meta": {
+                "page": page,
+                "per_page": per_page,
+                "count": len(ranked_corpus["works"]),
+                "corpus_count": ranked_corpus["count"],
+                "corpus_truncated": ranked_corpus["truncated"],
+                "llm_evaluated": ranked_corpus["llm_evaluated"],
+                "llm_degraded": ranked_corpus["llm_degraded"],
+            },
+            "analysis_enabled": True,
+            "llm_enabled": enable_llm and _hf_token() is not None,
+            "ranked_corpus": True,
+            "weights": ranking_weights,
+        }
+    
+    # Fetch author info for reputation scoring
+    author_data = await _fetch_author_for_ranking(aid)
+    
     async with httpx.AsyncClient(timeout=20.0) as client:
         r = await client.get(
             f"{OPENALEX_BASE}/works",
@@ -540,33 +1171,8 @@ async def get_author_works_ranked(
         data = r.json()
     
     meta = data.get("meta", {})
-    works = []
-    
-    for w in data.get("results", []):
-        loc = w.get("primary_location") or {}
-        src = loc.get("source") or {}
-        
-        # Get authors
-        authors = []
-        for auth in (w.get("authorships") or [])[:5]:  # Limit to first 5 authors
-            author_info = auth.get("author") or {}
-            if author_info.get("display_name"):
-                authors.append(author_info.get("display_name"))
-        
-        works.append({
-            "id": (w.get("id") or "").replace("https://openalex.org/", ""),
-            "title": w.get("title", ""),
-            "year": w.get("publication_year"),
-            "publication_year": w.get("publication_year"),
-            "publication_date": w.get("publication_date"),
-            "cited_by_count": w.get("cited_by_count", 0),
-            "doi": (w.get("ids") or {}).get("doi"),
-            "type": w.get("type"),
-            "venue": src.get("display_name"),
-            "authors": authors,
-            "is_oa": (w.get("open_access") or {}).get("is_oa"),
-            "open_access_status": (w.get("open_access") or {}).get("oa_status"),
-        })
+    works = [_parse_ranked_work(w) for w in data.get("results", [])]
+    related_works.add_works(works)
     
     if not works:
         return {
@@ -575,31 +1181,10 @@ async def get_author_works_ranked(
             "analysis_enabled": True,
         }
     
-    # Run integrity analysis (batch for efficiency)
-    integrity_results = await batch_analyze_integrity(works)
-    
-    # Attach integrity results
-    for paper, integrity in zip(works, integrity_results):
-        paper["integrity"] = integrity
-    
-    # Run LLM evaluation if enabled and token available
-    if enable_llm and _hf_token():
-        llm_results = await batch_evaluate_llm(works, query=query, max_concurrent=3)
-        for paper, llm in zip(works, llm_results):
-            paper["llm"] = llm
-    else:
-        # Add default LLM scores
-        for paper in works:
-            paper["llm"] = {
-                "quality_score": 5,
-                "credibility_score": 5,
-                "relevance_score": 5,
-                "suspicious": False,
-                "reason": "LLM evaluation disabled or unavailable",
-            }
+    await _analyze_works(works, enable_llm, query)
     
     # Rank papers using smart ranking engine
-    ranked_works = rank_papers(works, author=author_data, query=query)
+    ranked_works = rank_papers(works, author=author_data, query=query, weights=ranking_weights)
     
     return {
         "results": ranked_works,
@@ -610,6 +1195,7 @@ async def get_author_works_ranked(
         },
         "analysis_enabled": True,
         "llm_enabled": enable_llm and _hf_token() is not None,
+        "weights": ranking_weights,
     }
 
 
@@ -800,120 +1386,174 @@ async def _fetch_google_scholar(name: str) -> dict | None:
         return None
     
     try:
-        import asyncio
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 15.0
+        hits = await scholar_jobs.run(_scholar_search_hits, name, 1, timeout=15.0)
+        if not hits:
+            return None
         
-        loop = asyncio.get_event_loop()
+        # Fill author details (only sections missing from the profile cache)
+        author_filled = await _scholar_profile(
+            hits[0].get('scholar_id'),
+            list(SCHOLAR_SECTIONS),
+            timeout=max(0.0, deadline - loop.time()),
+            base=hits[0],
+        )
+        if not author_filled:
+            return None
         
-        def _search_scholar():
-            try:
-                # Search for author
-                search_query = scholarly.search_author(name)
-                author = next(search_query, None)
-                
-                if not author:
-                    return None
-                
-                # Fill author details
-                author_filled = scholarly.fill(author, sections=['basics', 'indices', 'publications'])
-                
-                # Extract publications (limit to 5)
-                publications = []
-                for pub in (author_filled.get('publications', []) or [])[:5]:
-                    pub_data = {
-                        "title": pub.get('bib', {}).get('title'),
-                        "year": pub.get('bib', {}).get('pub_year'),
-                        "venue": pub.get('bib', {}).get('venue') or pub.get('bib', {}).get('journal'),
-                        "citations": pub.get('num_citations', 0),
-                    }
-                    if pub_data["title"]:
-                        publications.append(pub_data)
-                
-                return {
-                    "name": author_filled.get('name'),
-                    "affiliation": author_filled.get('affiliation'),
-                    "email": author_filled.get('email'),
-                    "interests": author_filled.get('interests', [])[:5],
-                    "citations": author_filled.get('citedby'),
-                    "h_index": author_filled.get('hindex'),
-                    "i10_index": author_filled.get('i10index'),
-                    "publications_count": len(author_filled.get('publications', [])),
-                    "sample_publications": publications,
-                    "url": author_filled.get('url_picture', '').replace('/citations?user=', '/citations?hl=en&user=').split('&')[0] if author_filled.get('scholar_id') else f"https://scholar.google.com/citations?hl=en&user={author_filled.get('scholar_id', '')}",
-                    "scholar_id": author_filled.get('scholar_id'),
-                    "source": "Google Scholar",
-                }
-            except (StopIteration, Exception):
-                return None
+        # Extract publications (limit to 5)
+        publications = []
+        for pub in (author_filled.get('publications', []) or [])[:5]:
+            pub_data = {
+                "title": pub.get('bib', {}).get('title'),
+                "year": pub.get('bib', {}).get('pub_year'),
+                "venue": pub.get('bib', {}).get('venue') or pub.get('bib', {}).get('journal'),
+                "citations": pub.get('num_citations', 0),
+            }
+            if pub_data["title"]:
+                publications.append(pub_data)
         
-        # Run with timeout
-        result = await asyncio.wait_for(
-            loop.run_in_executor(None, _search_scholar),
-            timeout=15.0
-        )
-        return result
+        return {
+            "name": author_filled.get('name'),
+            "affiliation": author_filled.get('affiliation'),
+            "email": author_filled.get('email'),
+            "interests": (author_filled.get('interests') or [])[:5],
+            "citations": author_filled.get('citedby'),
+            "h_index": author_filled.get('hindex'),
+            "i10_index": author_filled.get('i10index'),
+            "publications_count": len(author_filled.get('publications', [])),
+            "sample_publications": publications,
+            "url": (author_filled.get('url_picture') or '').replace('/citations?user=', '/citations?hl=en&user=').split('&')[0] if author_filled.get('scholar_id') else f"https://scholar.google.com/citations?hl=en&user={author_filled.get('scholar_id', '')}",
+            "scholar_id": author_filled.get('scholar_id'),
+            "source": "Google Scholar",
+        }
         
     except (asyncio.TimeoutError, Exception):
         return None
 
 
-async def _search_google_scholar_multiple(name: str, limit: int = 10) -> list[dict]:
-    """Search Google Scholar for multiple authors matching the name."""
+def _scholar_search_hits(job, name: str, limit: int) -> list:
+    """Scholar job: first `limit` search hits (un-filled, as returned by the search pages)."""
+    hits = []
+    for author in itertools.islice(scholarly.search_author(name), limit):
+        hits.append(author)
+        job.check()  # Result pages are fetched lazily while iterating
+    return hits
+
+
+def _fill_scholar_profile(job, scholar_id: str, sections: list[str], base: dict | None = None) -> dict | None:
+    """Scholar job: fill `sections` of a profile (looked up by id unless a search hit is given)."""
+    author = base or scholarly.search_author_id(scholar_id)
+    if not author:
+        return None
+    job.check()
+    return scholarly.fill(author, sections=sections)
+
+
+async def _scholar_profile(
+    scholar_id: str,
+    sections: list[str],
+    timeout: float,
+    base: dict | None = None,
+) -> dict | None:
+    """Scholar author fields for `sections`, filling only the sections missing from the cache."""
+    missing = scholar_profiles.missing(scholar_id, sections)
+    if missing:
+        filled = await scholar_jobs.run(_fill_scholar_profile, scholar_id, missing, base, timeout=timeout)
+        if not filled:
+            return None
+        scholar_profiles.put(scholar_id, filled, missing)
+    return scholar_profiles.get(scholar_id, sections)
+
+
+def _format_scholar_hit(author: dict) -> dict:
+    """Summary of a Scholar author (filled or not; h/i10 indices need a fill)."""
+    return {
+        "scholar_id": author.get('scholar_id'),
+        "name": author.get('name'),
+        "affiliation": author.get('affiliation'),
+        "email": author.get('email'),
+        "interests": (author.get('interests') or [])[:5],
+        "citations": author.get('citedby', 0),
+        "h_index": author.get('hindex'),
+        "i10_index": author.get('i10index'),
+        "photo_url": author.get('url_picture'),
+        "profile_url": f"https://scholar.google.com/citations?hl=en&user={author.get('scholar_id', '')}",
+    }
+
+
+async def _fill_scholar_hits(hits: list, timeout: float) -> list[dict]:
+    """
+    Fill search hits in parallel as Scholar jobs (cached profiles need no job).
+    
+    Hits whose fill fails, is rejected or misses the deadline keep their search-page data.
+    """
+    filled = await asyncio.gather(
+        *(_scholar_profile(hit.get('scholar_id'), ["basics", "indices"], timeout, base=hit) for hit in hits),
+        return_exceptions=True,
+    )
+    return [
+        _format_scholar_hit(hit if isinstance(result, BaseException) or not result else result)
+        for hit, result in zip(hits, filled)
+    ]
+
+
+async def _search_google_scholar_multiple(name: str, limit: int = 10, fill: bool = True) -> list[dict]:
+    """
+    Search Google Scholar for multiple authors matching the name.
+    
+    With fill=False the search hits are returned as-is (no per-profile requests);
+    otherwise profiles are filled in parallel within the remaining time budget.
+    """
     if not GOOGLE_SCHOLAR_AVAILABLE:
         return []
     
     try:
-        import asyncio
-        
-        loop = asyncio.get_event_loop()
-        
-        def _search_multiple():
-            try:
-                results = []
-                search_query = scholarly.search_author(name)
-                
-                # Get multiple results
-                for i, author in enumerate(search_query):
-                    if i >= limit:
-                        break
-                    
-                    try:
-                        # Fill basic info only (faster)
-                        author_filled = scholarly.fill(author, sections=['basics', 'indices'])
-                        
-                        # Extract profile photo URL
-                        photo_url = author_filled.get('url_picture')
-                        
-                        result = {
-                            "scholar_id": author_filled.get('scholar_id'),
-                            "name": author_filled.get('name'),
-                            "affiliation": author_filled.get('affiliation'),
-                            "email": author_filled.get('email'),
-                            "interests": author_filled.get('interests', [])[:5],
-                            "citations": author_filled.get('citedby', 0),
-                            "h_index": author_filled.get('hindex'),
-                            "i10_index": author_filled.get('i10index'),
-                            "photo_url": photo_url,
-                            "profile_url": f"https://scholar.google.com/citations?hl=en&user={author_filled.get('scholar_id', '')}",
-                        }
-                        results.append(result)
-                    except Exception:
-                        continue
-                
-                return results
-            except (StopIteration, Exception):
-                return []
-        
-        # Run with timeout
-        results = await asyncio.wait_for(
-            loop.run_in_executor(None, _search_multiple),
-            timeout=30.0
-        )
-        return results
-        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + Config.GOOGLE_SCHOLAR_TIMEOUT
+        hits = await scholar_jobs.run(_scholar_search_hits, name, limit, timeout=Config.GOOGLE_SCHOLAR_TIMEOUT)
+        if not fill:
+            return [_format_scholar_hit(hit) for hit in hits]
+        return await _fill_scholar_hits(hits, timeout=max(0.0, deadline - loop.time()))
     except (asyncio.TimeoutError, Exception):
         return []
 
 
+# Progressive search: un-filled hits are returned at once and filled in the background
+_scholar_enrichments = TTLCache(ttl=Config.SCHOLAR_ENRICHMENT_TTL, max_entries=256)
+_scholar_enrichment_tasks: set[asyncio.Task] = set()
+
+
+async def _enrich_scholar_hits(enrichment_id: str, hits: list) -> None:
+    """Background task: fill hits and publish the enriched search results."""
+    entry = _scholar_enrichments.get(enrichment_id) or {}
+    try:
+        filled = await _fill_scholar_hits(hits, timeout=Config.GOOGLE_SCHOLAR_TIMEOUT)
+        entry.update(status="done", results=[_scholar_search_result(author) for author in filled])
+        _index_authors(entry["results"])
+    except Exception as e:
+        entry.update(status="failed", error=str(e), results=[])
+    _scholar_enrichments.set(enrichment_id, entry)
+
+
+def _attach_enrichment_results(enrichment_id: str, results: list[dict]) -> None:
+    """Keep other sources' search results with an enrichment so polls return the merged list."""
+    entry = _scholar_enrichments.get(enrichment_id)
+    if entry is not None:
+        entry["extra_results"] = results
+
+
+def _start_scholar_enrichment(hits: list) -> str:
+    """Schedule background fills for search hits; returns the id to poll."""
+    enrichment_id = secrets.token_urlsafe(12)
+    _scholar_enrichments.set(enrichment_id, {"status": "pending", "results": []})
+    task = asyncio.create_task(_enrich_scholar_hits(enrichment_id, hits))
+    _scholar_enrichment_tasks.add(task)
+    task.add_done_callback(_scholar_enrichment_tasks.discard)
+    return enrichment_id
+
+
 @app.get("/api/author/{author_id}/external-sources")
 async def get_author_external_sources(author_id: str):
     """Fetch data from 6 external sources: Semantic Scholar, ORCID, CrossRef, OpenAIRE, Europe PMC, Google Scholar."""
@@ -984,7 +1624,7 @@ async def get_work(work_id: str):
         abstract = _abstract_from_inverted_index(abstract)
     elif not isinstance(abstract, str):
         abstract = ""
-    return {
+    work = {
         "id": (w.get("id") or "").replace("https://openalex.org/", ""),
         "title": w.get("title", ""),
         "abstract": abstract,
@@ -995,6 +1635,21 @@ async def get_work(work_id: str):
         "cited_by_count": w.get("cited_by_count", 0),
         "doi": (w.get("ids") or {}).get("doi"),
     }
+    related_works.add_work(work)
+    return work
+
+
+@app.get("/api/works/{work_id}/related")
+async def get_related_works(work_id: str, k: int = Query(10, ge=1, le=50)):
+    """
+    Related papers among the works the app has already fetched (TF-IDF cosine over
+    titles and abstracts). Answered locally; no upstream call is made.
+    """
+    wid = work_id if work_id.upper().startswith("W") else f"W{work_id}"
+    results = related_works.related(wid, k)
+    if results is None:
+        raise HTTPException(status_code=404, detail="Work not indexed yet; open it or list its author's works first")
+    return {"work_id": wid, "related": results, "indexed_works": len(related_works)}
 
 
 class SummarizeRequest(BaseModel):
@@ -1071,6 +1726,15 @@ async def summarize_work(body: SummarizeRequest = Body(...)):
     year = w.get("publication_year")
     venue = src.get("display_name") or ""
     type_ = w.get("type") or ""
+    related_works.add_work({
+        "id": wid,
+        "title": w.get("title"),
+        "abstract": abstract,
+        "publication_year": year,
+        "venue": src.get("display_name"),
+        "cited_by_count": w.get("cited_by_count", 0),
+        "doi": (w.get("ids") or {}).get("doi"),
+    })
 
     if not abstract and not title:
         raise HTTPException(status_code=422, detail="No title or abstract available to summarize.")
@@ -1079,14 +1743,11 @@ async def summarize_work(body: SummarizeRequest = Body(...)):
 
     try:
         async with httpx.AsyncClient(timeout=90.0) as client:
-            r = await client.post(
-                HF_ROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": HF_SUMMARY_MODEL,
+            r = await model_router.post(
+                client,
+                "summary",
+                token,
+                {
                     "messages": [
                         {"role": "system", "content": "You write assessment summaries for university committees. Include: (1) bullet points for key research points, (2) how the author interprets the topic, (3) a short assessment of the researcher. Use professional language. Output only the summary—no <think> tags."},
                         {"role": "user", "content": user_message},
@@ -1124,10 +1785,14 @@ async def summarize_work(body: SummarizeRequest = Body(...)):
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"AI service error: {str(e)}")
 
+    # Open a chat session with the prepared paper context so follow-up questions skip the refetch
+    session = chat_sessions.create("work", _work_chat_system_prompt(title, abstract), meta={"work_id": wid})
+
     return {
         "work_id": wid,
         "title": title,
         "summary": summary,
+        "session_id": session.id,
     }
 
 
@@ -1203,14 +1868,11 @@ Use professional language. Output only the assessment—no <think> tags."""
 
     try:
         async with httpx.AsyncClient(timeout=90.0) as client:
-            r = await client.post(
-                HF_ROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": HF_SUMMARY_MODEL,
+            r = await model_router.post(
+                client,
+                "summary",
+                token,
+                {
                     "messages": [
                         {
                             "role": "system",
@@ -1251,62 +1913,78 @@ Use professional language. Output only the assessment—no <think> tags."""
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"AI service error: {str(e)}")
 
+    session = chat_sessions.create(
+        "compare",
+        _compare_chat_system_prompt(assessment),
+        meta={"author_id_1": a1_id, "author_id_2": a2_id},
+    )
+
     return {
         "author_1": {"id": a1_id, "display_name": n1, "works_count": w1, "cited_by_count": c1, "h_index": h1, "i10_index": i1, "institutions": inst1},
         "author_2": {"id": a2_id, "display_name": n2, "works_count": w2, "cited_by_count": c2, "h_index": h2, "i10_index": i2, "institutions": inst2},
         "assessment": assessment,
+        "session_id": session.id,
     }
 
 
 class ChatCompareRequest(BaseModel):
-    author_id_1: str
-    author_id_2: str
-    assessment: str
     message: str
+    session_id: str | None = None
+    author_id_1: str | None = None
+    author_id_2: str | None = None
+    assessment: str | None = None
+
+
+def _compare_chat_system_prompt(assessment: str) -> str:
+    """System prompt for comparison chat: instructions plus the comparison assessment."""
+    return f"""You answer questions about a faculty comparison. Here is the comparison assessment:
+
+{assessment}
+
+The two faculty were compared by their publication counts, citations, h-index, and i10-index. Answer the user's question based only on this assessment and the metrics it refers to. If the question cannot be answered from the comparison, say so. Be concise. Do not use <think> tags—output only your answer."""
 
 
 @app.post("/api/chat-compare")
 async def chat_compare(body: ChatCompareRequest = Body(...)):
-    """Answer a follow-up question about a faculty comparison (chatbot)."""
+    """
+    Answer a follow-up question about a faculty comparison (chatbot).
+    With a live session_id only the message is needed; otherwise send the author IDs and assessment.
+    """
     token = _hf_token()
     if not token:
         raise HTTPException(
             status_code=503,
             detail="Chat requires a Hugging Face token. Use: set HF_TOKEN=hf_xxxxxxxx",
         )
-    a1_id = (body.author_id_1 or "").strip()
-    a2_id = (body.author_id_2 or "").strip()
-    assessment = (body.assessment or "").strip()
     message = (body.message or "").strip()
-    if not a1_id or not a2_id:
-        raise HTTPException(status_code=400, detail="author_id_1 and author_id_2 required")
-    if not assessment:
-        raise HTTPException(status_code=400, detail="assessment required")
     if not message:
         raise HTTPException(status_code=400, detail="message required")
 
-    context = f"""You are helping a user understand a faculty comparison. Here is the comparison assessment:
-
-{assessment}
-
-The two faculty were compared by their publication counts, citations, h-index, and i10-index. Answer the user's question based only on this assessment and the metrics it refers to. If the question cannot be answered from the comparison, say so. Be concise. Do not use <think> tags—output only your answer.
-
-User question: {message}"""
+    session = chat_sessions.get(body.session_id, kind="compare")
+    if session is None:
+        a1_id = (body.author_id_1 or "").strip()
+        a2_id = (body.author_id_2 or "").strip()
+        assessment = (body.assessment or "").strip()
+        if body.session_id and not assessment:
+            raise HTTPException(status_code=404, detail="Chat session expired. Resend the assessment to start a new one.")
+        if not a1_id or not a2_id:
+            raise HTTPException(status_code=400, detail="author_id_1 and author_id_2 required")
+        if not assessment:
+            raise HTTPException(status_code=400, detail="assessment required")
+        session = chat_sessions.create(
+            "compare",
+            _compare_chat_system_prompt(assessment),
+            meta={"author_id_1": a1_id, "author_id_2": a2_id},
+        )
 
     try:
         async with httpx.AsyncClient(timeout=60.0) as client:
-            r = await client.post(
-                HF_ROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": HF_SUMMARY_MODEL,
-                    "messages": [
-                        {"role": "system", "content": "You answer questions about a faculty comparison. Use only the provided assessment. Be concise. No <think> tags."},
-                        {"role": "user", "content": context},
-                    ],
+            r = await model_router.post(
+                client,
+                "chat",
+                token,
+                {
+                    "messages": session.build_messages(message),
                     "max_tokens": 1024,
                 },
             )
@@ -1338,100 +2016,226 @@ User question: {message}"""
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"AI service error: {str(e)}")
 
-    return {"answer": answer or "No response generated."}
+    answer = answer or "No response generated."
+    session.add_turn(message, answer)
+    return {"answer": answer, "session_id": session.id}
 
 
 class BatchFacultyRequest(BaseModel):
     names: list[str]
+    roster: str | None = None  # Roster or department whose remembered choices apply
+    institution: str | None = None
+
+
+def _batch_client(timeout: float) -> httpx.AsyncClient:
+    """One pooled OpenAlex client for a whole batch, sized to the lookup concurrency."""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=Config.BATCH_CONCURRENCY,
+            max_keepalive_connections=Config.BATCH_CONCURRENCY,
+        ),
+    )
+
+
+async def _gather_bounded(coros: list, limit: int) -> list:
+    """Await coroutines concurrently, at most `limit` at a time; results keep input order."""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def _run(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(_run(coro) for coro in coros))
+
+
+async def _as_completed_bounded(fn, items: Iterable, limit: int):
+    """
+    Yield (index, result) as fn(item) calls finish, at most `limit` running at once.
+    
+    Items are pulled lazily (a generator over an uploaded file works), only `limit`
+    tasks exist at a time, and unfinished ones are cancelled if the consumer stops
+    early (e.g. a streaming client disconnects).
+    """
+    queued = iter(enumerate(items))
+    running: dict[asyncio.Task, int] = {}
+    
+    def _start_next() -> None:
+        for index, item in queued:
+            running[asyncio.ensure_future(fn(item))] = index
+            return
+    
+    try:
+        for _ in range(limit):
+            _start_next()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = running.pop(task)
+                _start_next()
+                yield index, task.result()
+    finally:
+        for task in running:
+            task.cancel()
+
+
+def _ndjson(record: dict) -> str:
+    return json.dumps(record, default=str) + "\n"
+
+
+def _batch_author_row(name: str, author: dict | None) -> dict:
+    """Summary-table row for a batch lookup (all None when the name was not found)."""
+    if author is None:
+        return {
+            "name_requested": name,
+            "found": False,
+            "author_id": None,
+            "display_name": None,
+            "works_count": None,
+            "cited_by_count": None,
+            "h_index": None,
+            "i10_index": None,
+            "institution": None,
+        }
+    inst = (author.get("last_known_institutions") or [None])[0]
+    stats = author.get("summary_stats") or {}
+    return {
+        "name_requested": name,
+        "found": True,
+        "author_id": author.get("id", "").replace("https://openalex.org/", ""),
+        "display_name": author.get("display_name"),
+        "works_count": author.get("works_count"),
+        "cited_by_count": author.get("cited_by_count"),
+        "h_index": stats.get("h_index"),
+        "i10_index": stats.get("i10_index"),
+        "institution": inst.get("display_name") if inst else None,
+    }
+
+
+async def _lookup_batch_faculty(client: httpx.AsyncClient, name: str) -> dict:
+    """Resolve one batch name: {"result": row}, or {"needs_selection": ...} when ambiguous."""
+    try:
+        r = await client.get(
+            f"{OPENALEX_BASE}/authors",
+            params={"search": name, "per_page": 10},  # Get up to 10 matches
+        )
+        r.raise_for_status()
+        authors = r.json().get("results") or []
+    except Exception:
+        return {"result": _batch_author_row(name, None)}
+    _index_topics(authors)
+    
+    if not authors:
+        return {"result": _batch_author_row(name, None)}
+    
+    # If multiple matches found, the user picks one
+    if len(authors) > 1:
+        options = []
+        for author in authors:
+            row = _batch_author_row(name, author)
+            options.append({key: row[key] for key in row if key not in ("name_requested", "found")})
+        return {"needs_selection": {"name_requested": name, "options": options}}
+    
+    # Single match - add directly to results
+    return {"result": _batch_author_row(name, authors[0])}
+
+
+async def _fetch_authors_by_id(client: httpx.AsyncClient, author_ids: list[str]) -> dict[str, dict]:
+    """OpenAlex authors by id, 50 per request (ids that no longer resolve are left out)."""
+    authors = {}
+    for start in range(0, len(author_ids), 50):
+        r = await client.get(
+            f"{OPENALEX_BASE}/authors",
+            params={"filter": "openalex:" + "|".join(author_ids[start:start + 50]), "per_page": 50},
+        )
+        r.raise_for_status()
+        results = r.json().get("results") or []
+        _index_topics(results)
+        for author in results:
+            authors[author.get("id", "").replace("https://openalex.org/", "")] = author
+    return authors
+
+
+async def _iter_batch_lookups(client: httpx.AsyncClient, names: Iterable[str], scope: str):
+    """
+    Yield (index, lookup) for batch names as they resolve, 50 names at a time.
+    
+    Names with a remembered choice in `scope` are fetched by id in one request per
+    chunk; the rest (and remembered ids that no longer resolve) are searched
+    concurrently and may come back as needs_selection.
+
+    Chunks run one after another: the next chunk starts only when the slowest search
+    in the current one finishes. This bounds memory and OpenAlex load for long
+    rosters (uploads, batch jobs) at the cost of some idle time per chunk.
+    """
+    names = iter(names)
+    offset = 0
+    while chunk := list(itertools.islice(names, 50)):
+        choices = {i: disambiguation_memory.get(scope, name) for i, name in enumerate(chunk)}
+        choices = {i: choice for i, choice in choices.items() if choice}
+        known = {}
+        if choices:
+            try:
+                known = await _fetch_authors_by_id(client, sorted({c["author_id"] for c in choices.values()}))
+            except Exception:
+                known = {}  # Search them like new names instead
+        
+        search = []
+        for i, name in enumerate(chunk):
+            author = known.get(choices[i]["author_id"]) if i in choices else None
+            if author is None:
+                search.append(i)
+                continue
+            row = _batch_author_row(name, author)
+            row["remembered"] = True
+            yield offset + i, {"result": row}
+        
+        lookups = _as_completed_bounded(
+            lambda i: _lookup_batch_faculty(client, chunk[i]), search, Config.BATCH_CONCURRENCY
+        )
+        async for position, lookup in lookups:
+            yield offset + search[position], lookup
+        offset += len(chunk)
+
+
+async def _collect_batch_lookups(names: list[str], scope: str) -> list[dict]:
+    """Batch lookups for `names`, in input order."""
+    lookups = [None] * len(names)
+    async with _batch_client(timeout=20.0) as client:
+        async for index, lookup in _iter_batch_lookups(client, names, scope):
+            lookups[index] = lookup
+    return lookups
 
 
 @app.post("/api/batch-faculty")
-async def batch_faculty(body: BatchFacultyRequest = Body(...)):
-    """Look up multiple faculty by name and return a summary table (for search committees)."""
+async def batch_faculty(
+    body: BatchFacultyRequest = Body(...),
+    stream: bool = Query(False, description="Stream NDJSON lines as each name is resolved"),
+):
+    """
+    Look up multiple faculty by name and return a summary table (for search committees).
+    
+    With stream=true the response is NDJSON: one {"type": "result"} or
+    {"type": "needs_selection"} line per name (with its input "index") in completion
+    order, then a {"type": "summary"} line.
+    
+    Names whose match was chosen earlier for this roster and institution (see
+    /api/batch-faculty/selections) resolve to that author without a search;
+    their rows carry "remembered": true.
+    """
     names = [n.strip() for n in (body.names or []) if n and n.strip()]
     if not names:
         raise HTTPException(status_code=400, detail="names list required (one name per entry)")
     if len(names) > 50:
         raise HTTPException(status_code=400, detail="Maximum 50 names per request")
-
-    results = []
-    needs_selection = []
     
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        for name in names:
-            try:
-                r = await client.get(
-                    f"{OPENALEX_BASE}/authors",
-                    params={"search": name, "per_page": 10},  # Get up to 10 matches
-                )
-                r.raise_for_status()
-                data = r.json()
-                authors = data.get("results") or []
-                
-                if not authors:
-                    results.append({
-                        "name_requested": name,
-                        "found": False,
-                        "author_id": None,
-                        "display_name": None,
-                        "works_count": None,
-                        "cited_by_count": None,
-                        "h_index": None,
-                        "i10_index": None,
-                        "institution": None,
-                    })
-                    continue
-                
-                # If multiple matches found, add to needs_selection
-                if len(authors) > 1:
-                    options = []
-                    for author in authors:
-                        aid = author.get("id", "").replace("https://openalex.org/", "")
-                        inst = (author.get("last_known_institutions") or [None])[0]
-                        stats = author.get("summary_stats") or {}
-                        options.append({
-                            "author_id": aid,
-                            "display_name": author.get("display_name"),
-                            "works_count": author.get("works_count"),
-                            "cited_by_count": author.get("cited_by_count"),
-                            "h_index": stats.get("h_index"),
-                            "i10_index": stats.get("i10_index"),
-                            "institution": inst.get("display_name") if inst else None,
-                        })
-                    needs_selection.append({
-                        "name_requested": name,
-                        "options": options
-                    })
-                    continue
-                
-                # Single match - add directly to results
-                author = authors[0]
-                aid = author.get("id", "").replace("https://openalex.org/", "")
-                inst = (author.get("last_known_institutions") or [None])[0]
-                stats = author.get("summary_stats") or {}
-                results.append({
-                    "name_requested": name,
-                    "found": True,
-                    "author_id": aid,
-                    "display_name": author.get("display_name"),
-                    "works_count": author.get("works_count"),
-                    "cited_by_count": author.get("cited_by_count"),
-                    "h_index": stats.get("h_index"),
-                    "i10_index": stats.get("i10_index"),
-                    "institution": inst.get("display_name") if inst else None,
-                })
-            except Exception:
-                results.append({
-                    "name_requested": name,
-                    "found": False,
-                    "author_id": None,
-                    "display_name": None,
-                    "works_count": None,
-                    "cited_by_count": None,
-                    "h_index": None,
-                    "i10_index": None,
-                    "institution": None,
-                })
+    scope = disambiguation_memory.scope(body.roster, body.institution)
+    if stream:
+        return StreamingResponse(_stream_batch_faculty(names, scope=scope), media_type="application/x-ndjson")
+
+    lookups = await _collect_batch_lookups(names, scope)
+    results = [lookup["result"] for lookup in lookups if "result" in lookup]
+    needs_selection = [lookup["needs_selection"] for lookup in lookups if "needs_selection" in lookup]
     
     return {
         "count": len(results),
@@ -1440,61 +2244,128 @@ async def batch_faculty(body: BatchFacultyRequest = Body(...)):
     }
 
 
+async def _stream_batch_faculty(names: Iterable[str], roster_stats: dict | None = None, scope: str = "|"):
+    counts = {"result": 0, "needs_selection": 0}
+    async with _batch_client(timeout=20.0) as client:
+        async for index, lookup in _iter_batch_lookups(client, names, scope):
+            kind = "result" if "result" in lookup else "needs_selection"
+            counts[kind] += 1
+            yield _ndjson({"type": kind, "index": index, kind: lookup[kind]})
+    summary = {"type": "summary", "count": counts["result"], "needs_selection_count": counts["needs_selection"]}
+    if roster_stats is not None:
+        summary["roster"] = roster_stats
+    yield _ndjson(summary)
+
+
+class BatchSelection(BaseModel):
+    name_requested: str
+    author_id: str
+    display_name: str | None = None
+    institution: str | None = None
+
+
+class BatchSelectionRequest(BaseModel):
+    selections: list[BatchSelection]
+    roster: str | None = None
+    institution: str | None = None
+
+
+@app.post("/api/batch-faculty/selections")
+async def remember_batch_selections(body: BatchSelectionRequest):
+    """Remember the authors chosen for ambiguous batch names (per roster and institution)."""
+    try:
+        author_ids = [sanitize_author_id(selection.author_id) for selection in body.selections]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    scope = disambiguation_memory.scope(body.roster, body.institution)
+    disambiguation_memory.remember_many(scope, [
+        {
+            "name": selection.name_requested,
+            "author_id": author_id,
+            "display_name": selection.display_name,
+            "institution": selection.institution,
+        }
+        for selection, author_id in zip(body.selections, author_ids)
+    ])
+    return {"remembered": len(body.selections)}
+
+
+@app.delete("/api/batch-faculty/selections")
+async def forget_batch_selections(
+    roster: str | None = Query(None),
+    institution: str | None = Query(None),
+    name: str | None = Query(None, description="Forget one name (default: every choice for the roster)"),
+):
+    """Forget remembered batch choices, so those names are searched and asked about again."""
+    scope = disambiguation_memory.scope(roster, institution)
+    return {"forgotten": disambiguation_memory.forget(scope, name)}
+
+
 class ChatRequest(BaseModel):
-    work_id: str
+    work_id: str | None = None
     message: str
+    session_id: str | None = None
+
+
+def _work_chat_system_prompt(title: str, abstract: str) -> str:
+    """System prompt for paper chat: instructions plus the paper context."""
+    context = f"Title: {title}\n\nAbstract:\n{abstract if abstract else '(No abstract available.)'}"
+    return (
+        "You are a helpful assistant. Answer questions based ONLY on the following research paper. "
+        "Use the title and abstract below. If the answer is not in the paper or you are unsure, say so. "
+        "Be concise and accurate. Do not use <think> tags—output only your answer.\n\n"
+        f"{context}"
+    )
 
 
 @app.post("/api/chat")
 async def chat_about_work(body: ChatRequest = Body(...)):
-    """Answer a question about a specific research paper using its title and abstract."""
+    """
+    Answer a question about a specific research paper using its title and abstract.
+    Pass the returned session_id on follow-up questions to reuse the prepared context.
+    """
     token = _hf_token()
     if not token:
         raise HTTPException(
             status_code=503,
             detail="Chat requires a Hugging Face token. Use: set HF_TOKEN=hf_xxxxxxxx",
         )
-    work_id = body.work_id.strip()
     message = (body.message or "").strip()
-    if not work_id:
-        raise HTTPException(status_code=400, detail="work_id required")
     if not message:
         raise HTTPException(status_code=400, detail="message required")
-    wid = work_id if work_id.upper().startswith("W") else f"W{work_id}"
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        r = await client.get(f"{OPENALEX_BASE}/works/{wid}")
-        if r.status_code == 404:
-            raise HTTPException(status_code=404, detail="Work not found")
-        r.raise_for_status()
-        w = r.json()
-    title = w.get("title") or "Untitled"
-    abstract_inv = w.get("abstract_inverted_index")
-    if isinstance(abstract_inv, dict):
-        abstract = _abstract_from_inverted_index(abstract_inv)
-    else:
-        abstract = ""
-    context = f"Title: {title}\n\nAbstract:\n{abstract if abstract else '(No abstract available.)'}"
-    system_content = (
-        "You are a helpful assistant. Answer questions based ONLY on the following research paper. "
-        "Use the title and abstract below. If the answer is not in the paper or you are unsure, say so. "
-        "Be concise and accurate. Do not use <think> tags—output only your answer."
-    )
-    user_content = f"{context}\n\n---\nQuestion: {message}"
+
+    session = chat_sessions.get(body.session_id, kind="work")
+    if session is None:
+        work_id = (body.work_id or "").strip()
+        if not work_id:
+            raise HTTPException(status_code=400, detail="work_id required")
+        wid = work_id if work_id.upper().startswith("W") else f"W{work_id}"
+        async with httpx.AsyncClient(timeout=15.0) as client:
+            r = await client.get(f"{OPENALEX_BASE}/works/{wid}")
+            if r.status_code == 404:
+                raise HTTPException(status_code=404, detail="Work not found")
+            r.raise_for_status()
+            w = r.json()
+        title = w.get("title") or "Untitled"
+        abstract_inv = w.get("abstract_inverted_index")
+        if isinstance(abstract_inv, dict):
+            abstract = _abstract_from_inverted_index(abstract_inv)
+        else:
+            abstract = ""
+        session = chat_sessions.create(
+            "work", _work_chat_system_prompt(title, abstract), meta={"work_id": wid}
+        )
+    wid = session.meta["work_id"]
 
     try:
         async with httpx.AsyncClient(timeout=60.0) as client:
-            r = await client.post(
-                HF_ROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": HF_SUMMARY_MODEL,
-                    "messages": [
-                        {"role": "system", "content": system_content},
-                        {"role": "user", "content": user_content},
-                    ],
+            r = await model_router.post(
+                client,
+                "chat",
+                token,
+                {
+                    "messages": session.build_messages(message),
                     "max_tokens": 1024,
                 },
             )
@@ -1526,7 +2397,9 @@ async def chat_about_work(body: ChatRequest = Body(...)):
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"AI service error: {str(e)}")
 
-    return {"work_id": wid, "answer": answer or "No response generated."}
+    answer = answer or "No response generated."
+    session.add_turn(message, answer)
+    return {"work_id": wid, "answer": answer, "session_id": session.id}
 
 
 @app.post("/api/generate-pdf")
@@ -1537,228 +2410,581 @@ async def generate_pdf(
     cited_by_count: int = Body(0, embed=True),
     h_index: int = Body(None, embed=True),
 ):
-    """Generate an accreditation report PDF for a faculty member."""
+    """
+    Generate an accreditation report PDF for a faculty member.
+    
+    Rendering runs in the PDF worker pool, off the event loop; when too many reports
+    are already in progress the request is rejected with 503.
+    """
     try:
-        # Create PDF in memory
-        pdf_buffer = BytesIO()
-        doc = SimpleDocTemplate(pdf_buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#3b82f6'),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#1e40af'),
-            spaceAfter=10,
-            spaceBefore=10,
-            fontName='Helvetica-Bold'
-        )
-        
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontSize=11,
-            spaceAfter=8,
-            alignment=TA_LEFT
-        )
-        
-        # Build PDF content
-        content = []
-        
-        # Header
-        content.append(Paragraph("FACULTY ACCREDITATION REPORT", title_style))
-        content.append(Spacer(1, 0.3*inch))
-        
-        # Faculty Info
-        content.append(Paragraph(f"<b>Faculty Member:</b> {author_name}", normal_style))
-        content.append(Paragraph(f"<b>Author ID:</b> {author_id}", normal_style))
-        content.append(Paragraph(f"<b>Report Generated:</b> {datetime.now().strftime('%B %d, %Y')}", normal_style))
-        content.append(Spacer(1, 0.2*inch))
-        
-        # Research Statistics
-        content.append(Paragraph("RESEARCH STATISTICS", heading_style))
-        
-        stats_data = [
-            ['Metric', 'Value'],
-            ['Total Publications', str(works_count)],
-            ['Citations Received', str(cited_by_count)],
-            ['H-Index', str(h_index) if h_index else 'N/A'],
-        ]
-        
-        stats_table = Table(stats_data, colWidths=[2.5*inch, 2*inch])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 11),
-        ]))
-        
-        content.append(stats_table)
-        content.append(Spacer(1, 0.3*inch))
-        
-        # Assessment Summary
-        content.append(Paragraph("ASSESSMENT SUMMARY", heading_style))
-        
-        assessment_text = f"""
-        The faculty member {author_name} has demonstrated significant academic productivity with {works_count} publications 
-        and {cited_by_count} total citations. This report provides a comprehensive overview of research impact and scholarly achievement 
-        for use in hiring, promotion, tenure, and accreditation decisions.
-        """
-        content.append(Paragraph(assessment_text, normal_style))
-        content.append(Spacer(1, 0.2*inch))
-        
-        # Footer
-        content.append(Paragraph("---", normal_style))
-        content.append(Spacer(1, 0.1*inch))
-        content.append(Paragraph(
-            "Data source: <i>OpenAlex</i>. Generated by Publications Summary System.",
-            ParagraphStyle('footer', parent=styles['Normal'], fontSize=9, textColor=colors.grey)
-        ))
-        
-        # Build PDF
-        doc.build(content)
-        pdf_buffer.seek(0)
-        
-        return StreamingResponse(
-            iter([pdf_buffer.getvalue()]),
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename=accreditation_{author_id}.pdf"}
+        pdf = await pdf_renderer.render(
+            author_id=author_id,
+            author_name=author_name,
+            works_count=works_count,
+            cited_by_count=cited_by_count,
+            h_index=h_index,
         )
-    
+    except PdfBusy as e:
+        raise HTTPException(status_code=503, detail=f"{e}; please retry shortly")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF generation error: {str(e)}")
+    
+    return StreamingResponse(
+        iter([pdf]),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename=accreditation_{author_id}.pdf"}
+    )
 
 
 @app.get("/api/author/{author_id}/research-fingerprint")
 async def get_research_fingerprint(author_id: str):
-    """Analyze research areas and publication types for a faculty member."""
+    """
+    Analyze research areas and publication types for a faculty member.
+    
+    Counts come from OpenAlex group_by aggregations over the author's entire corpus
+    (publication types and topics, fetched concurrently), not from downloaded works.
+    """
     aid = author_id if author_id.startswith("A") else f"A{author_id}"
     
     try:
         async with httpx.AsyncClient(timeout=30.0) as client:
+            (type_groups, total_works), (topic_groups, _) = await asyncio.gather(
+                _openalex_group_by(client, f"author.id:{aid}", "type"),
+                _openalex_group_by(client, f"author.id:{aid}", "topics.id"),
+            )
+        
+        # Groups come back largest first
+        return {
+            "author_id": aid.replace("A", ""),
+            "publication_types": {group["name"]: group["count"] for group in type_groups[:6]},
+            "top_research_areas": {group["name"]: group["count"] for group in topic_groups[:8]},
+            "total_works": total_works,
+        }
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Fingerprint analysis error: {str(e)}")
+
+
+async def _openalex_group_by(client: httpx.AsyncClient, filter_expr: str, field: str) -> tuple[list[dict], int]:
+    """
+    Aggregate works matching `filter_expr` by `field` on the OpenAlex side.
+    
+    Works without a value ("unknown") are left out. For multi-valued fields such as
+    topics.id a work counts once under every one of its topics, so group counts can
+    sum to more than the total; there is no relevance cut-off like the old 0.1
+    concept-score threshold.
+    
+    Returns:
+        ([{"key", "name", "count"}, ...] sorted by count descending, total matching works)
+    """
+    r = await client.get(
+        f"{OPENALEX_BASE}/works",
+        params={"filter": filter_expr, "group_by": field},
+    )
+    r.raise_for_status()
+    data = r.json()
+    groups = [
+        {
+            "key": group.get("key"),
+            "name": group.get("key_display_name") or str(group.get("key") or "Other").rsplit("/", 1)[-1],
+            "count": group.get("count", 0),
+        }
+        for group in data.get("group_by") or []
+        if group.get("key") not in (None, "unknown")
+    ]
+    groups.sort(key=lambda group: group["count"], reverse=True)
+    return groups, (data.get("meta") or {}).get("count", 0)
+
+
+# Citation trajectories per author, served stale while refreshed so trend charts load at once
+_trajectory_cache = SearchResultCache(
+    ttl=Config.CITATION_TRAJECTORY_TTL,
+    stale_ttl=Config.CITATION_TRAJECTORY_STALE_TTL,
+    max_entries=256,
+)
+
+
+@app.get("/api/author/{author_id}/citation-trajectory")
+async def get_citation_trajectory(author_id: str):
+    """
+    Citation trajectory for an author: citations per year, year-over-year growth,
+    citation velocity and h-indices over the last 5 and 10 years.
+    
+    Every work's counts_by_year is streamed through cursor paging; results are cached
+    per author (stale-while-revalidate).
+    """
+    try:
+        aid = sanitize_author_id(author_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        trajectory, _ = await _trajectory_cache.get(aid, lambda: _build_citation_trajectory(aid))
+        return trajectory
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Citation trajectory error: {str(e)}")
+
+
+async def _build_citation_trajectory(aid: str) -> dict:
+    """Fetch the author and page through their works, one page in memory at a time."""
+    builder = CitationTrajectoryBuilder()
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        r = await client.get(f"{OPENALEX_BASE}/authors/{aid}")
+        if r.status_code == 404:
+            raise HTTPException(status_code=404, detail="Author not found")
+        r.raise_for_status()
+        author = r.json()
+        _index_topics([author])
+        
+        total_count = 0
+        cursor = "*"
+        while cursor and builder.works < Config.CITATION_TRAJECTORY_MAX_WORKS:
             r = await client.get(
                 f"{OPENALEX_BASE}/works",
                 params={
                     "filter": f"author.id:{aid}",
-                    "per_page": 100,
+                    "select": "id,publication_year,cited_by_count,counts_by_year",
+                    "per_page": 200,
+                    "cursor": cursor,
                 },
             )
             r.raise_for_status()
             data = r.json()
+            results = data.get("results") or []
+            meta = data.get("meta") or {}
+            total_count = meta.get("count", total_count)
+            builder.add_works(results)
+            cursor = meta.get("next_cursor") if results else None
+    
+    return {
+        "author_id": aid,
+        "display_name": author.get("display_name"),
+        **builder.result(author.get("counts_by_year")),
+        "total_works": total_count,
+        "truncated": total_count > builder.works,
+    }
+
+
+# Per-author citation counts and publication years, reused across publication windows
+_citation_arrays_cache = TTLCache(ttl=Config.AUTHOR_METRICS_TTL, max_entries=1024)
+
+
+async def _author_citation_arrays(client: httpx.AsyncClient, aid: str) -> dict:
+    """Citation counts and publication years of all of an author's works (cursor paging, cached)."""
+    cached = _citation_arrays_cache.get(aid)
+    if cached is not None:
+        return cached
+    
+    citations, years = [], []
+    total_count = 0
+    cursor = "*"
+    while cursor and len(citations) < Config.AUTHOR_METRICS_MAX_WORKS:
+        r = await client.get(
+            f"{OPENALEX_BASE}/works",
+            params={
+                "filter": f"author.id:{aid}",
+                "select": "publication_year,cited_by_count",
+                "per_page": 200,
+                "cursor": cursor,
+            },
+        )
+        r.raise_for_status()
+        data = r.json()
+        results = data.get("results") or []
+        meta = data.get("meta") or {}
+        total_count = meta.get("count", total_count)
+        citations.extend(w.get("cited_by_count") or 0 for w in results)
+        years.extend(w.get("publication_year") or 0 for w in results)
+        cursor = meta.get("next_cursor") if results else None
+    
+    arrays = {"citations": citations, "years": years, "truncated": total_count > len(citations)}
+    _citation_arrays_cache.set(aid, arrays)
+    return arrays
+
+
+async def _window_metrics(author_ids: list[str], year_from: int | None, year_to: int | None) -> list[dict]:
+    """
+    Metrics for each author over a publication window, in input order.
+    
+    Works are fetched concurrently per author, then all authors are computed in one
+    vectorized pass. Authors whose works could not be fetched get an "error" row.
+    """
+    async with _batch_client(timeout=30.0) as client:
+        async def _fetch(aid):
+            try:
+                return await _author_citation_arrays(client, aid)
+            except Exception as e:
+                return e
         
-        # Analyze publication types and topics
-        type_counts = {}
-        topic_counts = {}
-        
-        for work in data.get("results", []):
-            # Count by work type
-            work_type = work.get("type", "Other")
-            type_counts[work_type] = type_counts.get(work_type, 0) + 1
-            
-            # Count by topics from concepts
-            concepts = work.get("concepts", [])
-            for concept in concepts:
-                if concept.get("score", 0) > 0.1:  # High confidence only
-                    topic = concept.get("display_name", "")
-                    if topic:
-                        topic_counts[topic] = topic_counts.get(topic, 0) + 1
-        
-        # Get top topics
-        top_topics = sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)[:8]
+        async def _profiles():
+            try:
+                return await _fetch_authors_by_id(client, author_ids)
+            except Exception:
+                return {}  # Names are a convenience; metrics don't depend on them
         
-        return {
-            "author_id": aid.replace("A", ""),
-            "publication_types": dict(sorted(type_counts.items(), key=lambda x: x[1], reverse=True)[:6]),
-            "top_research_areas": {topic: count for topic, count in top_topics},
-            "total_works": len(data.get("results", [])),
+        arrays, profiles = await asyncio.gather(
+            _gather_bounded([_fetch(aid) for aid in author_ids], Config.BATCH_CONCURRENCY),
+            _profiles(),
+        )
+    
+    owners, citations, years = stack_works([
+        (a["citations"], a["years"]) if isinstance(a, dict) else None for a in arrays
+    ])
+    rows = metrics_rows(batch_metrics(owners, citations, years, len(author_ids), year_from, year_to))
+    
+    results = []
+    for aid, row, works in zip(author_ids, rows, arrays):
+        profile = profiles.get(aid) or {}
+        base = {
+            "author_id": aid,
+            "display_name": profile.get("display_name"),
+            # OpenAlex's own (whole-career, possibly stale) h-index, for comparison
+            "openalex_h_index": (profile.get("summary_stats") or {}).get("h_index"),
         }
+        if isinstance(works, Exception):
+            results.append({**base, "error": str(works)})
+        else:
+            results.append({**base, **row, "truncated": works["truncated"]})
+    return results
+
+
+def _metrics_window(year_from: int | None, year_to: int | None) -> dict:
+    if year_from is not None and year_to is not None and year_from > year_to:
+        raise HTTPException(status_code=400, detail="year_from must not be after year_to")
+    return {"year_from": year_from, "year_to": year_to}
+
+
+@app.get("/api/author/{author_id}/metrics")
+async def get_author_metrics(
+    author_id: str,
+    year_from: int | None = Query(None, ge=1900, le=2100),
+    year_to: int | None = Query(None, ge=1900, le=2100),
+):
+    """
+    h-index, i10-index, g-index and m-quotient recomputed from the author's works,
+    counting only works published in [year_from, year_to] (e.g. a promotion window).
+    """
+    try:
+        aid = sanitize_author_id(author_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    window = _metrics_window(year_from, year_to)
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Fingerprint analysis error: {str(e)}")
+    (row,) = await _window_metrics([aid], year_from, year_to)
+    if "error" in row:
+        raise HTTPException(status_code=502, detail=f"Metrics error: {row['error']}")
+    return {**row, "window": window}
+
+
+class DepartmentMetricsRequest(BaseModel):
+    author_ids: list[str]
+    year_from: int | None = None
+    year_to: int | None = None
+
+
+@app.post("/api/department/metrics")
+async def department_metrics(body: DepartmentMetricsRequest):
+    """
+    Publication-window metrics for a whole department in one call.
+    
+    Each author's works are fetched once (and cached), then h, i10, g and m-quotient
+    are computed for every author in a single vectorized pass.
+    """
+    try:
+        author_ids = list(dict.fromkeys(sanitize_author_id(a) for a in body.author_ids if a and a.strip()))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not author_ids:
+        raise HTTPException(status_code=400, detail="author_ids list required")
+    if len(author_ids) > Config.DEPARTMENT_METRICS_MAX_AUTHORS:
+        raise HTTPException(status_code=400, detail=f"Maximum {Config.DEPARTMENT_METRICS_MAX_AUTHORS} authors per request")
+    window = _metrics_window(body.year_from, body.year_to)
+    
+    return {"window": window, "authors": await _window_metrics(author_ids, body.year_from, body.year_to)}
 
 
 class BatchFacultyRequest(BaseModel):
     faculty_names: list[str]
 
 
+async def _analyze_faculty_member(client: httpx.AsyncClient, name: str) -> dict | None:
+    """Dashboard row for one faculty name (None when OpenAlex has no match)."""
+    try:
+        r = await client.get(
+            f"{OPENALEX_BASE}/authors",
+            params={"search": name, "per_page": 1},
+        )
+        r.raise_for_status()
+        data = r.json()
+    except Exception:
+        return {
+            "name": name,
+            "works_count": 0,
+            "cited_by_count": 0,
+            "h_index": None,
+            "i10_index": None,
+            "id": None,
+            "error": "Not found"
+        }
+    
+    if not data.get("results"):
+        return None
+    author = data["results"][0]
+    _index_topics([author])
+    return {
+        "name": author.get("display_name", name),
+        "works_count": author.get("works_count", 0),
+        "cited_by_count": author.get("cited_by_count", 0),
+        "h_index": (author.get("summary_stats") or {}).get("h_index"),
+        "i10_index": (author.get("summary_stats") or {}).get("i10_index"),
+        "id": author.get("id", "").replace("https://openalex.org/", ""),
+    }
+
+
+class _DepartmentTotals:
+    """
+    Running department aggregates with quantile sketches, so memory stays constant
+    however many faculty rows stream through.
+    """
+    
+    # Row field -> name of its distribution in department_stats
+    METRICS = {"works_count": "works", "cited_by_count": "citations", "h_index": "h_index", "i10_index": "i10_index"}
+    
+    def __init__(self):
+        self.total_faculty = 0
+        self.faculty_found = 0
+        self.total_works = 0
+        self.total_citations = 0
+        self.total_h_index = 0
+        self.distributions = {field: StreamingSummary() for field in self.METRICS}
+    
+    def add(self, row: dict) -> None:
+        self.total_faculty += 1
+        if "error" in row:
+            return
+        self.faculty_found += 1
+        self.total_works += row["works_count"]
+        self.total_citations += row["cited_by_count"]
+        self.total_h_index += row["h_index"] or 0
+        for field, summary in self.distributions.items():
+            summary.add(row.get(field))
+    
+    def stats(self) -> dict:
+        found = self.faculty_found or 1
+        return {
+            "total_faculty": self.total_faculty,
+            "faculty_found": self.faculty_found,
+            "avg_publications": round(self.total_works / found, 2),
+            "avg_citations": round(self.total_citations / found, 2),
+            "avg_h_index": round(self.total_h_index / found, 2),
+            "total_publications": self.total_works,
+            "total_citations": self.total_citations,
+            # count, mean, std, min, max, p10, p25, median, p75, p90 (quantiles are P² estimates)
+            "distributions": {
+                name: self.distributions[field].summary() for field, name in self.METRICS.items()
+            },
+        }
+
+
+def _department_stats(results) -> dict:
+    """Departmental aggregates over batch analysis rows (rows with an error count as not found)."""
+    totals = _DepartmentTotals()
+    for row in results:
+        totals.add(row)
+    return totals.stats()
+
+
 @app.post("/api/batch-faculty-analysis")
-async def batch_faculty_analysis(request: BatchFacultyRequest):
-    """Analyze multiple faculty members for department dashboard."""
+async def batch_faculty_analysis(
+    request: BatchFacultyRequest,
+    stream: bool = Query(False, description="Stream NDJSON lines as each faculty member is analyzed"),
+):
+    """
+    Analyze multiple faculty members for department dashboard.
+    
+    With stream=true the response is NDJSON: one {"type": "faculty"} line per
+    matched name (with its input "index") in completion order, then a
+    {"type": "summary"} line with faculty_count and department_stats.
+    
+    department_stats includes "distributions" (count, mean, std, min, max and
+    p10/p25/median/p75/p90) of works, citations, h-index and i10-index, updated
+    per row in constant memory.
+    """
+    if stream:
+        return StreamingResponse(
+            _stream_faculty_analysis(request.faculty_names[:50]),  # Max 50
+            media_type="application/x-ndjson",
+        )
     try:
-        results = []
-        for name in request.faculty_names[:50]:  # Max 50
-            try:
-                async with httpx.AsyncClient(timeout=15.0) as client:
-                    r = await client.get(
-                        f"{OPENALEX_BASE}/authors",
-                        params={"search": name, "per_page": 1},
-                    )
-                    r.raise_for_status()
-                    data = r.json()
-                
-                if data.get("results"):
-                    author = data["results"][0]
-                    results.append({
-                        "name": author.get("display_name", name),
-                        "works_count": author.get("works_count", 0),
-                        "cited_by_count": author.get("cited_by_count", 0),
-                        "h_index": (author.get("summary_stats") or {}).get("h_index"),
-                        "i10_index": (author.get("summary_stats") or {}).get("i10_index"),
-                        "id": author.get("id", "").replace("https://openalex.org/", ""),
-                    })
-            except Exception:
-                results.append({
-                    "name": name,
-                    "works_count": 0,
-                    "cited_by_count": 0,
-                    "h_index": None,
-                    "i10_index": None,
-                    "id": None,
-                    "error": "Not found"
-                })
-        
-        # Calculate departmental statistics
-        valid_results = [r for r in results if "error" not in r]
-        if valid_results:
-            avg_works = sum(r["works_count"] for r in valid_results) / len(valid_results)
-            avg_citations = sum(r["cited_by_count"] for r in valid_results) / len(valid_results)
-            avg_h_index = sum(r["h_index"] or 0 for r in valid_results) / len(valid_results)
-            total_works = sum(r["works_count"] for r in valid_results)
-            total_citations = sum(r["cited_by_count"] for r in valid_results)
-        else:
-            avg_works = avg_citations = avg_h_index = total_works = total_citations = 0
+        async with _batch_client(timeout=15.0) as client:
+            analyses = await _gather_bounded(
+                [_analyze_faculty_member(client, name) for name in request.faculty_names[:50]],  # Max 50
+                Config.BATCH_CONCURRENCY,
+            )
+        results = [analysis for analysis in analyses if analysis is not None]
         
         return {
             "faculty_count": len(results),
             "faculty": results,
-            "department_stats": {
-                "total_faculty": len(results),
-                "faculty_found": len(valid_results),
-                "avg_publications": round(avg_works, 2),
-                "avg_citations": round(avg_citations, 2),
-                "avg_h_index": round(avg_h_index, 2),
-                "total_publications": total_works,
-                "total_citations": total_citations,
-            }
+            "department_stats": _department_stats(results),
         }
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Batch analysis error: {str(e)}")
 
+
+async def _stream_faculty_analysis(names: Iterable[str], roster_stats: dict | None = None):
+    totals = _DepartmentTotals()
+    async with _batch_client(timeout=15.0) as client:
+        analyses = _as_completed_bounded(
+            lambda name: _analyze_faculty_member(client, name), names, Config.BATCH_CONCURRENCY
+        )
+        async for index, row in analyses:
+            if row is None:
+                continue
+            totals.add(row)
+            yield _ndjson({"type": "faculty", "index": index, "faculty": row})
+    summary = {"type": "summary", "faculty_count": totals.total_faculty, "department_stats": totals.stats()}
+    if roster_stats is not None:
+        summary["roster"] = roster_stats
+    yield _ndjson(summary)
+
+
+@app.post("/api/batch-faculty/upload")
+async def upload_faculty_roster(
+    file: UploadFile = File(..., description="Roster CSV, one faculty member per row"),
+    name_column: str | None = Form(None, description="Header name or 0-based index of the name column"),
+    kind: str = Form("batch-faculty-analysis", description="batch-faculty (lookup table) or batch-faculty-analysis (dashboard)"),
+    roster: str | None = Form(None, description="Roster or department whose remembered choices apply (batch-faculty)"),
+    institution: str | None = Form(None),
+):
+    """
+    Upload a roster CSV and stream its analysis as NDJSON.
+    
+    The file is parsed row by row; blank and duplicate names are skipped and at most
+    ROSTER_MAX_NAMES distinct names are resolved, concurrently, as they are read.
+    Lines are those of the matching endpoint with stream=true; the summary line also
+    carries "roster" counts (rows, names, duplicates, blank, truncated).
+    """
+    if kind not in ("batch-faculty", "batch-faculty-analysis"):
+        raise HTTPException(status_code=400, detail=f"Unknown kind: {kind}")
+    try:
+        names = RosterReader(file.file, name_column, max_names=Config.ROSTER_MAX_NAMES)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if kind == "batch-faculty":
+        scope = disambiguation_memory.scope(roster, institution)
+        stream = _stream_batch_faculty(names, names.stats, scope=scope)
+    else:
+        stream = _stream_faculty_analysis(names, names.stats)
+    return StreamingResponse(stream, media_type="application/x-ndjson")
+
+
+async def _batch_faculty_job(names: list[str], context: dict) -> list[dict]:
+    """Job handler: /api/batch-faculty lookups for one chunk of a roster."""
+    scope = disambiguation_memory.scope(context.get("roster"), context.get("institution"))
+    return await _collect_batch_lookups(names, scope)
+
+
+async def _batch_analysis_job(names: list[str], context: dict) -> list[dict]:
+    """Job handler: dashboard rows for one chunk of a roster (unmatched names are kept as not found)."""
+    async with _batch_client(timeout=15.0) as client:
+        rows = await _gather_bounded(
+            [_analyze_faculty_member(client, name) for name in names],
+            Config.BATCH_CONCURRENCY,
+        )
+    return [
+        row if row is not None else {
+            "name": name,
+            "works_count": 0,
+            "cited_by_count": 0,
+            "h_index": None,
+            "i10_index": None,
+            "id": None,
+            "error": "Not found",
+        }
+        for name, row in zip(names, rows)
+    ]
+
+
+job_queue.register("batch-faculty", _batch_faculty_job)
+job_queue.register("batch-faculty-analysis", _batch_analysis_job)
+
+
+class BatchJobRequest(BaseModel):
+    names: list[str]
+    kind: str = "batch-faculty"
+    roster: str | None = None
+    institution: str | None = None
+
+
+@app.post("/api/jobs")
+async def submit_batch_job(body: BatchJobRequest):
+    """
+    Queue a large faculty roster for background processing.
+    
+    kind is "batch-faculty" (lookup table with needs_selection) or
+    "batch-faculty-analysis" (dashboard rows and department stats). Poll
+    /api/jobs/{job_id} for progress and page through /api/jobs/{job_id}/results.
+    """
+    names = [n.strip() for n in body.names if n and n.strip()]
+    if not names:
+        raise HTTPException(status_code=400, detail="names list required (one name per entry)")
+    if len(names) > Config.JOB_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Maximum {Config.JOB_MAX_ITEMS} names per job")
+    try:
+        return job_queue.submit(body.kind, names, context={"roster": body.roster, "institution": body.institution})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_batch_job(job_id: str):
+    """Status (queued, running, done, failed or cancelled) and progress of a batch job."""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_batch_job(job_id: str):
+    """Cancel a queued or running batch job (results so far are kept)."""
+    if job_queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return {"job_id": job_id, "cancelled": job_queue.cancel(job_id)}
+
+
+@app.get("/api/jobs/{job_id}/results")
+async def get_batch_job_results(
+    job_id: str,
+    page: int = Query(1, ge=1),
+    per_page: int = Query(100, ge=1, le=1000),
+):
+    """
+    One page of a batch job's results, available while the job is still running.
+    
+    Finished analysis jobs also return department_stats over the whole roster.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    
+    rows = job_queue.results(job_id, offset=(page - 1) * per_page, limit=per_page)
+    response = {
+        "job_id": job_id,
+        "kind": job["kind"],
+        "status": job["status"],
+        "meta": {"page": page, "per_page": per_page, "count": job["completed"], "total": job["total"]},
+    }
+    if job["kind"] == "batch-faculty":
+        response["results"] = [row["result"] for row in rows if "result" in row]
+        response["needs_selection"] = [row["needs_selection"] for row in rows if "needs_selection" in row] or None
+    else:
+        response["faculty"] = rows
+        if job["status"] == "done":
+            response["department_stats"] = _department_stats(job_queue.iter_results(job_id))
+    return response
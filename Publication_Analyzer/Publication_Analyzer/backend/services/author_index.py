@@ -0,0 +1,151 @@
+"""
+Author Prefix Index
+In-memory prefix trie over the names of every author the app has resolved or cached,
+so typeahead suggestions come back without an upstream round-trip.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from backend.config import Config
+from backend.utils import normalize_name
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: List[str] = []  # Best-known authors under this prefix, highest citations first
+
+
+class AuthorPrefixIndex:
+    """
+    Prefix trie keyed by every token of an author's normalized name, so "doe"
+    and "jane d" both find "Jane Doe".
+
+    Each node keeps only its `node_capacity` most-cited authors, which bounds memory
+    and makes a lookup O(prefix length) regardless of index size. The index is a
+    best-effort cache, so this has known limits:
+
+    - An author pushed out of a full node is not restored when the authors above it
+      are evicted or refreshed (no backfill), so crowded prefixes can under-report.
+    - A multi-token query only considers the authors kept at each token's node; a
+      lesser-cited "John Smith" under crowded "john" and "smith" nodes is missed.
+
+    Callers should treat a short result list as incomplete (/api/autocomplete falls
+    through to OpenAlex). Nodes left empty by evictions are pruned.
+
+    Args:
+        max_entries: Authors kept; the least recently added are evicted beyond this
+        node_capacity: Authors remembered per trie node
+    """
+
+    def __init__(self, max_entries: int = 50000, node_capacity: int = 50):
+        self.max_entries = max_entries
+        self.node_capacity = node_capacity
+        self._root = _TrieNode()
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _score(self, author_id: str) -> int:
+        return self._entries[author_id].get("cited_by_count") or 0
+
+    def _nodes(self, name: str):
+        """Every trie node along every token of `name` (created as needed)."""
+        for token in set(name.split()):
+            node = self._root
+            for char in token:
+                node = node.children.setdefault(char, _TrieNode())
+                yield node
+
+    def _find(self, prefix: str) -> Optional[_TrieNode]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _unlink(self, author_id: str) -> None:
+        entry = self._entries.pop(author_id)
+        for token in set(entry["_key"].split()):
+            path = [self._root]
+            for char in token:
+                node = path[-1].children.get(char)
+                if node is None:
+                    break
+                path.append(node)
+                if author_id in node.ids:
+                    node.ids.remove(author_id)
+            # Prune nodes that no longer hold anyone, deepest first
+            for depth in range(len(path) - 1, 0, -1):
+                node = path[depth]
+                if node.ids or node.children:
+                    break
+                del path[depth - 1].children[token[depth - 1]]
+
+    def add(
+        self,
+        author_id: str,
+        display_name: str,
+        institution: Optional[str] = None,
+        cited_by_count: Optional[int] = None,
+        source: str = "OpenAlex",
+    ) -> None:
+        """Add or refresh an author."""
+        key = normalize_name(display_name)
+        if not author_id or not key:
+            return
+        with self._lock:
+            if author_id in self._entries:
+                self._unlink(author_id)
+            self._entries[author_id] = {
+                "id": author_id,
+                "display_name": display_name,
+                "institution": institution,
+                "cited_by_count": cited_by_count,
+                "source": source,
+                "_key": key,
+            }
+            score = cited_by_count or 0
+            for node in self._nodes(key):
+                ids = node.ids
+                if len(ids) >= self.node_capacity and score <= self._score(ids[-1]):
+                    continue
+                position = next((i for i, other in enumerate(ids) if self._score(other) < score), len(ids))
+                ids.insert(position, author_id)
+                del ids[self.node_capacity:]
+            while len(self._entries) > self.max_entries:
+                self._unlink(next(iter(self._entries)))
+
+    def search(self, query: str, limit: int = 8) -> List[Dict]:
+        """
+        Authors whose name tokens start with every token of `query`, most cited first.
+
+        Every query token is a prefix, since users type partial names and initials ("j doe").
+        Candidates are the authors kept at each token's node (see the class notes).
+        """
+        tokens = normalize_name(query).split()
+        if not tokens:
+            return []
+        with self._lock:
+            nodes = [self._find(token) for token in set(tokens)]
+            if any(node is None for node in nodes):
+                return []
+            matches = []
+            for author_id in dict.fromkeys(author_id for node in nodes for author_id in node.ids):
+                entry = self._entries.get(author_id)
+                if entry is None:
+                    continue
+                name_tokens = entry["_key"].split()
+                if all(any(t.startswith(q) for t in name_tokens) for q in tokens):
+                    matches.append(entry)
+            matches.sort(key=lambda entry: entry.get("cited_by_count") or 0, reverse=True)
+            return [{k: v for k, v in entry.items() if k != "_key"} for entry in matches[:limit]]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+author_index = AuthorPrefixIndex(max_entries=Config.AUTHOR_INDEX_MAX_ENTRIES)
@@ -0,0 +1,79 @@
+"""
+Chat Sessions
+Server-side chat sessions that keep the prepared LLM context and a bounded
+turn history, so follow-up questions don't refetch or resend the context.
+"""
+import secrets
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from backend.config import Config
+from backend.services.ttl_cache import TTLCache
+
+
+class ChatSession:
+    """
+    A single conversation about a paper ("work") or a faculty comparison ("compare").
+
+    The system prompt holds the prepared context (title/abstract or assessment);
+    only the last `max_turns` question/answer pairs are replayed to the model.
+    """
+
+    def __init__(self, kind: str, system_prompt: str, meta: Optional[Dict] = None, max_turns: int = 6):
+        self.id = secrets.token_urlsafe(16)
+        self.kind = kind
+        self.system_prompt = system_prompt
+        self.meta = meta or {}
+        self.history: deque = deque(maxlen=max_turns)
+        self.created_at = time.time()
+
+    def build_messages(self, question: str) -> List[Dict]:
+        """Build chat-completion messages: context, recent turns, then the new question."""
+        messages = [{"role": "system", "content": self.system_prompt}]
+        for q, a in self.history:
+            messages.append({"role": "user", "content": q})
+            messages.append({"role": "assistant", "content": a})
+        messages.append({"role": "user", "content": question})
+        return messages
+
+    def add_turn(self, question: str, answer: str) -> None:
+        """Record a completed turn (oldest turns are dropped past the limit)."""
+        self.history.append((question, answer))
+
+
+class ChatSessionStore:
+    """Holds chat sessions in memory with an idle TTL."""
+
+    def __init__(self, ttl: float, max_sessions: int = 500, max_turns: int = 6):
+        self.max_turns = max_turns
+        self._sessions = TTLCache(ttl=ttl, max_entries=max_sessions, sliding=True)
+
+    def create(self, kind: str, system_prompt: str, meta: Optional[Dict] = None) -> ChatSession:
+        """Create and register a new session."""
+        session = ChatSession(kind, system_prompt, meta=meta, max_turns=self.max_turns)
+        self._sessions.set(session.id, session)
+        return session
+
+    def get(self, session_id: Optional[str], kind: Optional[str] = None) -> Optional[ChatSession]:
+        """Return a live session (refreshing its idle timer), or None if unknown/expired."""
+        if not session_id:
+            return None
+        session = self._sessions.get(session_id)
+        if session is None or (kind and session.kind != kind):
+            return None
+        return session
+
+    def delete(self, session_id: str) -> bool:
+        """End a session. Returns True if it existed."""
+        return self._sessions.pop(session_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+chat_sessions = ChatSessionStore(
+    ttl=Config.CHAT_SESSION_TTL,
+    max_sessions=Config.CHAT_MAX_SESSIONS,
+    max_turns=Config.CHAT_MAX_TURNS,
+)
@@ -0,0 +1,251 @@
+"""
+Citation Metrics
+Citation indicators computed with NumPy arrays: h-index, i10-index, g-index and
+m-quotient for any publication window (for many authors in one vectorized pass), and
+citation trajectories (yearly citations, year-over-year growth, velocity and
+time-windowed h-indices) built from OpenAlex `counts_by_year`, accumulated one page
+of works at a time.
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Trailing windows (in years, current year included) for windowed h-indices
+DEFAULT_WINDOWS = (5, 10)
+
+
+def h_index(citations: Iterable[int]) -> int:
+    """Largest h such that h works have at least h citations each."""
+    counts = np.sort(np.asarray(list(citations), dtype=np.int64))[::-1]
+    return int(np.count_nonzero(counts >= np.arange(1, counts.size + 1)))
+
+
+def batch_metrics(
+    owners: Sequence[int],
+    citations: Sequence[int],
+    years: Sequence[int],
+    n_authors: int,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    current_year: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Publication-window metrics for many authors in one vectorized pass.
+
+    Works are flat parallel arrays (owning author's index, citations, publication year).
+    Works published in [year_from, year_to] are sorted once by (author, citations
+    descending); each work's rank within its author comes from the author's offset in
+    the sorted array, and every indicator is a per-author count of ranks meeting its
+    condition. The m-quotient divides the window h-index by the years the author was
+    publishing within the window (career start = earliest publication year overall).
+
+    Args:
+        owners: Author index (0..n_authors-1) of each work
+        citations: Citation count of each work
+        years: Publication year of each work (0 when unknown)
+        n_authors: Number of authors (authors without works get zeros)
+        year_from, year_to: Inclusive publication window (None = open-ended)
+        current_year: End of an open window (default: this year)
+
+    Returns:
+        Arrays of length n_authors: works, citations, h_index, i10_index, g_index,
+        m_quotient (NaN when no publication year is known) and first_year (0 when unknown)
+    """
+    owners = np.asarray(owners, dtype=np.int64)
+    citations = np.asarray(citations, dtype=np.int64)
+    years = np.asarray(years, dtype=np.int64)
+    current_year = current_year or datetime.now().year
+
+    dated = years > 0
+    first_year = np.full(n_authors, np.iinfo(np.int64).max)
+    np.minimum.at(first_year, owners[dated], years[dated])
+    first_year[first_year == np.iinfo(np.int64).max] = 0
+
+    in_window = np.ones(owners.size, dtype=bool)
+    if year_from is not None:
+        in_window &= years >= year_from
+    if year_to is not None:
+        in_window &= years <= year_to
+    owners, citations = owners[in_window], citations[in_window]
+
+    order = np.lexsort((-citations, owners))
+    owners, citations = owners[order], citations[order]
+    works = np.bincount(owners, minlength=n_authors)
+    offsets = (np.cumsum(works) - works)[owners]
+    ranks = np.arange(1, owners.size + 1) - offsets
+    cumulative = np.cumsum(citations)
+    # Citations of each author's top-`rank` works: running total minus everything before the author
+    top_totals = cumulative - np.concatenate(([0], cumulative))[offsets]
+
+    def _per_author(condition: np.ndarray) -> np.ndarray:
+        return np.bincount(owners, weights=condition, minlength=n_authors).astype(np.int64)
+
+    h = _per_author(citations >= ranks)
+    start = np.maximum(first_year, year_from or 0)
+    end = min(year_to or current_year, current_year)
+    active_years = end - start + 1
+    m_quotient = np.full(n_authors, np.nan)
+    np.divide(h, active_years, out=m_quotient, where=(first_year > 0) & (active_years > 0))
+
+    return {
+        "works": works,
+        "citations": np.bincount(owners, weights=citations, minlength=n_authors).astype(np.int64),
+        "h_index": h,
+        "i10_index": _per_author(citations >= 10),
+        "g_index": _per_author(top_totals >= ranks * ranks),
+        "m_quotient": m_quotient,
+        "first_year": first_year,
+    }
+
+
+def stack_works(per_author: Sequence[Optional[Tuple[Sequence[int], Sequence[int]]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flatten per-author (citations, publication years) into the parallel arrays `batch_metrics` takes.
+
+    Authors given as None (e.g. their works could not be fetched) contribute no works.
+    """
+    empty = np.zeros(0, dtype=np.int64)
+    pairs = [(i, works) for i, works in enumerate(per_author) if works is not None]
+    owners = [np.full(len(works[0]), i, dtype=np.int64) for i, works in pairs]
+    citations = [np.asarray(works[0], dtype=np.int64) for _, works in pairs]
+    years = [np.asarray(works[1], dtype=np.int64) for _, works in pairs]
+    return (
+        np.concatenate(owners) if owners else empty,
+        np.concatenate(citations) if citations else empty,
+        np.concatenate(years) if years else empty,
+    )
+
+
+def metrics_rows(metrics: Dict[str, np.ndarray]) -> List[Dict]:
+    """One JSON-ready dict per author from `batch_metrics` arrays."""
+    rows = []
+    for i in range(metrics["works"].size):
+        m = metrics["m_quotient"][i]
+        rows.append({
+            "works": int(metrics["works"][i]),
+            "citations": int(metrics["citations"][i]),
+            "h_index": int(metrics["h_index"][i]),
+            "i10_index": int(metrics["i10_index"][i]),
+            "g_index": int(metrics["g_index"][i]),
+            "m_quotient": round(float(m), 3) if not np.isnan(m) else None,
+            "first_year": int(metrics["first_year"][i]) or None,
+        })
+    return rows
+
+
+def yoy_growth(series: np.ndarray) -> List[Optional[float]]:
+    """
+    Year-over-year growth of a yearly series as fractions (0.25 = +25%).
+
+    The first year, and years following a zero, have no growth rate (None).
+    """
+    series = np.asarray(series, dtype=np.float64)
+    if series.size == 0:
+        return []
+    previous = series[:-1]
+    growth = np.divide(series[1:] - previous, previous, out=np.zeros_like(previous), where=previous > 0)
+    return [None] + [round(float(g), 4) if p > 0 else None for g, p in zip(growth, previous)]
+
+
+def citation_velocity(years: np.ndarray, citations: np.ndarray, current_year: int) -> Dict:
+    """
+    How fast citations are accruing, from complete years only (the current year is partial).
+
+    Returns:
+        last_year: Citations received in the last complete year
+        avg_last_3_years: Mean citations per year over the last three complete years
+        trend_per_year: Slope of a least-squares line through the last five complete years
+    """
+    complete = years < current_year
+    years, citations = years[complete], np.asarray(citations, dtype=np.float64)[complete]
+    if citations.size == 0:
+        return {"last_year": None, "avg_last_3_years": None, "trend_per_year": None}
+    recent = citations[-5:]
+    trend = np.polyfit(years[-5:], recent, 1)[0] if recent.size >= 2 else None
+    return {
+        "last_year": int(citations[-1]),
+        "avg_last_3_years": round(float(citations[-3:].mean()), 2),
+        "trend_per_year": round(float(trend), 2) if trend is not None else None,
+    }
+
+
+class CitationTrajectoryBuilder:
+    """
+    Accumulate an author's works page by page into compact per-work arrays.
+
+    Each page's `counts_by_year` is laid out as a works x years matrix, summed into the
+    yearly totals and reduced to per-work citation counts for each trailing window, so
+    only a few integers per work are kept however many pages are streamed through.
+
+    Args:
+        current_year: Last year of the trajectory (default: this year)
+        windows: Trailing windows, in years, for windowed h-indices
+    """
+
+    def __init__(self, current_year: Optional[int] = None, windows: Sequence[int] = DEFAULT_WINDOWS):
+        self.current_year = current_year or datetime.now().year
+        self.windows = tuple(windows)
+        self.span = max(self.windows)
+        self.years = np.arange(self.current_year - self.span + 1, self.current_year + 1)
+        self._yearly = np.zeros(self.span, dtype=np.int64)
+        self._totals: List[np.ndarray] = []
+        self._windowed: Dict[int, List[np.ndarray]] = {w: [] for w in self.windows}
+        self.works = 0
+
+    def add_works(self, works: List[Dict]) -> None:
+        """Add one page of OpenAlex works (cited_by_count and counts_by_year are read)."""
+        if not works:
+            return
+        counts = np.zeros((len(works), self.span), dtype=np.int64)
+        first_year = int(self.years[0])
+        for row, work in enumerate(works):
+            for entry in work.get("counts_by_year") or []:
+                column = (entry.get("year") or 0) - first_year
+                if 0 <= column < self.span:
+                    counts[row, column] = entry.get("cited_by_count") or 0
+
+        self._yearly += counts.sum(axis=0)
+        # Citations received in the last w years = suffix sums along the year axis
+        trailing = np.cumsum(counts[:, ::-1], axis=1)
+        for w in self.windows:
+            self._windowed[w].append(trailing[:, w - 1])
+        self._totals.append(np.fromiter((w.get("cited_by_count") or 0 for w in works), dtype=np.int64, count=len(works)))
+        self.works += len(works)
+
+    def result(self, author_counts_by_year: Optional[List[Dict]] = None) -> Dict:
+        """
+        Compute the trajectory.
+
+        Args:
+            author_counts_by_year: The author's own yearly counts; when given, they are the
+                yearly citation series (they cover works beyond any paging cap)
+
+        Returns:
+            years, citations, works (publications per year when the author counts are
+            given), yoy_growth, velocity and h_index ({"all_time", "last_5_years", ...})
+        """
+        citations = self._yearly
+        works_per_year = None
+        if author_counts_by_year:
+            by_year = {entry.get("year"): entry for entry in author_counts_by_year}
+            citations = np.array([(by_year.get(int(y)) or {}).get("cited_by_count") or 0 for y in self.years], dtype=np.int64)
+            works_per_year = [(by_year.get(int(y)) or {}).get("works_count") or 0 for y in self.years]
+
+        totals = np.concatenate(self._totals) if self._totals else np.zeros(0, dtype=np.int64)
+        h_indices = {"all_time": h_index(totals)}
+        for w in self.windows:
+            windowed = np.concatenate(self._windowed[w]) if self._windowed[w] else totals[:0]
+            h_indices[f"last_{w}_years"] = h_index(windowed)
+
+        return {
+            "years": self.years.tolist(),
+            "citations": citations.tolist(),
+            "works": works_per_year,
+            "yoy_growth": yoy_growth(citations),
+            "partial_year": self.current_year,
+            "velocity": citation_velocity(self.years, citations, self.current_year),
+            "h_index": h_indices,
+            "works_analyzed": self.works,
+        }
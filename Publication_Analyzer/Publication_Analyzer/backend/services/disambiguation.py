@@ -0,0 +1,140 @@
+"""
+Name Disambiguation Memory
+Remembers which author a user picked for an ambiguous roster name, per roster and
+institution, so later runs of the same roster resolve that name directly instead of
+searching and asking again.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+from backend.config import Config
+from backend.utils import normalize_name
+
+
+class DisambiguationStore:
+    """
+    Persistent (roster, institution, name) -> author choices, written through to a JSON file.
+
+    Args:
+        path: JSON file to persist to (None keeps choices in memory only)
+        clock: Wall-clock time source for the chosen_at timestamps
+    """
+
+    def __init__(self, path: Optional[Path], clock: Callable[[], float] = time.time):
+        self.path = Path(path) if path else None
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._scopes: Dict[str, Dict[str, Dict]] = {}
+        self._loaded = False
+
+    @staticmethod
+    def scope(roster: Optional[str] = None, institution: Optional[str] = None) -> str:
+        """Scope key for a roster (or department) within an institution; both optional."""
+        return f"{normalize_name(roster)}|{normalize_name(institution)}"
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return  # Unreadable store: start empty rather than fail batch lookups
+        if isinstance(data, dict):
+            self._scopes.update(data)
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._scopes), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # Persistence is best effort; choices still apply until restart
+
+    def get(self, scope: str, name: str) -> Optional[Dict]:
+        """The remembered choice for `name` in `scope`, or None."""
+        with self._lock:
+            self._load()
+            choice = self._scopes.get(scope, {}).get(normalize_name(name))
+            return dict(choice) if choice else None
+
+    def remember(
+        self,
+        scope: str,
+        name: str,
+        author_id: str,
+        display_name: Optional[str] = None,
+        institution: Optional[str] = None,
+    ) -> None:
+        """Store (or replace) the author chosen for `name` in `scope`."""
+        self.remember_many(scope, [{
+            "name": name,
+            "author_id": author_id,
+            "display_name": display_name,
+            "institution": institution,
+        }])
+
+    def remember_many(self, scope: str, choices: Iterable[Dict]) -> int:
+        """
+        Store several choices in `scope` with a single file write.
+
+        Args:
+            scope: Scope key from scope()
+            choices: Dicts with name and author_id, and optionally display_name and institution
+
+        Returns:
+            Number of choices stored (entries without a name or author_id are skipped)
+        """
+        with self._lock:
+            self._load()
+            now = self.clock()
+            stored = 0
+            for choice in choices:
+                key = normalize_name(choice.get("name"))
+                if not key or not choice.get("author_id"):
+                    continue
+                self._scopes.setdefault(scope, {})[key] = {
+                    "author_id": choice["author_id"],
+                    "display_name": choice.get("display_name"),
+                    "institution": choice.get("institution"),
+                    "chosen_at": now,
+                }
+                stored += 1
+            if stored:
+                self._save()
+            return stored
+
+    def forget(self, scope: str, name: Optional[str] = None) -> int:
+        """Drop one remembered name, or every choice in `scope`. Returns the number removed."""
+        with self._lock:
+            self._load()
+            choices = self._scopes.get(scope)
+            if not choices:
+                return 0
+            if name is None:
+                removed = len(choices)
+                del self._scopes[scope]
+            else:
+                removed = 1 if choices.pop(normalize_name(name), None) else 0
+                if not choices:
+                    del self._scopes[scope]
+            if removed:
+                self._save()
+            return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return sum(len(choices) for choices in self._scopes.values())
+
+
+disambiguation_memory = DisambiguationStore(Config.DISAMBIGUATION_FILE)
@@ -233,14 +233,31 @@ async def analyze_paper_integrity(paper: Dict) -> Dict:
     }
 
 
-async def batch_analyze_integrity(papers: List[Dict]) -> List[Dict]:
+async def batch_analyze_integrity(
+    papers: List[Dict],
+    max_concurrent: Optional[int] = None
+) -> List[Dict]:
     """
     Analyze integrity for multiple papers efficiently.
     Returns list of integrity results in same order as input.
+    
+    Args:
+        papers: List of paper dictionaries
+        max_concurrent: Optional cap on concurrent analyses (CrossRef lookups);
+            unbounded by default
     """
     import asyncio
     
-    tasks = [analyze_paper_integrity(paper) for paper in papers]
+    if max_concurrent:
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def analyze_with_semaphore(paper: Dict) -> Dict:
+            async with semaphore:
+                return await analyze_paper_integrity(paper)
+        
+        tasks = [analyze_with_semaphore(paper) for paper in papers]
+    else:
+        tasks = [analyze_paper_integrity(paper) for paper in papers]
     results = await asyncio.gather(*tasks, return_exceptions=True)
     
     # Handle any exceptions
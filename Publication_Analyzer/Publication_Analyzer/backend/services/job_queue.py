@@ -0,0 +1,268 @@
+"""
+Background Job Queue
+Runs large batch requests (e.g. 1,000-name faculty rosters) outside the HTTP request
+on a small pool of asyncio workers. Each job is persisted as a JSON metadata file plus
+a JSONL results file, so progress survives a restart and unfinished jobs resume where
+they stopped.
+"""
+import asyncio
+import itertools
+import json
+import os
+import secrets
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
+from backend.config import Config
+
+
+# A handler turns one chunk of job items (plus the job's context) into exactly one result per item
+JobHandler = Callable[[List[str], Dict], Awaitable[List[Dict]]]
+
+UNFINISHED = ("queued", "running")
+
+
+class JobQueue:
+    """
+    Persistent queue of chunked batch jobs.
+
+    Items are processed `chunk_size` at a time; after every chunk the results are
+    appended to the job's JSONL file and its progress is saved. The JSONL file is the
+    source of truth on resume, so at most one chunk is redone after a crash.
+
+    Args:
+        store_dir: Directory holding <job_id>.json and <job_id>.jsonl
+        workers: Jobs processed concurrently
+        chunk_size: Items handed to a handler per call
+        retention: Seconds finished jobs are kept (purged on start)
+        clock: Wall-clock time source (timestamps are persisted)
+    """
+
+    def __init__(
+        self,
+        store_dir: Path,
+        workers: int = 2,
+        chunk_size: int = 50,
+        retention: float = 7 * 86400,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store_dir = Path(store_dir)
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.retention = retention
+        self.clock = clock
+        self._handlers: Dict[str, JobHandler] = {}
+        self._jobs: Dict[str, Dict] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Register the handler for a job kind."""
+        self._handlers[kind] = handler
+
+    # Persistence
+
+    def _meta_path(self, job_id: str) -> Path:
+        return self.store_dir / f"{job_id}.json"
+
+    def _results_path(self, job_id: str) -> Path:
+        return self.store_dir / f"{job_id}.jsonl"
+
+    def _save(self, job: Dict) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        path = self._meta_path(job["id"])
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(job, default=str), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _append_results(self, job_id: str, results: List[Dict]) -> None:
+        lines = "".join(json.dumps(result, default=str) + "\n" for result in results)
+        with open(self._results_path(job_id), "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def _recover_progress(self, job: Dict) -> None:
+        """Count complete result lines, dropping a line cut off by a crash."""
+        path = self._results_path(job["id"])
+        if not path.exists():
+            job["completed"] = 0
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        complete = data[:data.rfind(b"\n") + 1]
+        if len(complete) != len(data):
+            with open(path, "wb") as f:
+                f.write(complete)
+        job["completed"] = complete.count(b"\n")
+
+    def _remove(self, job_id: str) -> None:
+        for path in (self._meta_path(job_id), self._results_path(job_id)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _load(self) -> None:
+        """Load persisted jobs, purging finished ones past retention."""
+        if not self.store_dir.exists():
+            return
+        now = self.clock()
+        for path in self.store_dir.glob("*.json"):
+            try:
+                job = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue  # Unreadable metadata: leave the files for inspection
+            if job["status"] not in UNFINISHED and now - job["updated_at"] > self.retention:
+                self._remove(job["id"])
+                continue
+            if job["status"] in UNFINISHED:
+                self._recover_progress(job)
+                job["status"] = "queued"
+            self._jobs.setdefault(job["id"], job)
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Load persisted jobs, start the workers and requeue unfinished jobs."""
+        if self._queue is not None:
+            return
+        self._load()
+        self._queue = asyncio.Queue()
+        for job in sorted(self._jobs.values(), key=lambda j: j["created_at"]):
+            if job["status"] in UNFINISHED:
+                self._queue.put_nowait(job["id"])
+        self._worker_tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers; running jobs stay resumable."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._queue = None
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        job = self._jobs.get(job_id)
+        if job is None or job["status"] not in UNFINISHED:
+            return
+        handler = self._handlers[job["kind"]]
+        job.update(status="running", started_at=job.get("started_at") or self.clock(), updated_at=self.clock())
+        self._save(job)
+
+        try:
+            while job["completed"] < job["total"]:
+                chunk = job["items"][job["completed"]:job["completed"] + self.chunk_size]
+                results = await handler(chunk, job.get("context") or {})
+                if len(results) != len(chunk):
+                    raise ValueError(f"Handler returned {len(results)} results for {len(chunk)} items")
+                self._append_results(job_id, results)
+                job["completed"] += len(chunk)
+                job["updated_at"] = self.clock()
+                if job["status"] == "cancelled":
+                    break
+                self._save(job)
+            else:
+                job["status"] = "done"
+                job["finished_at"] = self.clock()
+        except asyncio.CancelledError:
+            self._save(job)  # Shutdown: still "running", resumed on next start
+            raise
+        except Exception as e:
+            job.update(status="failed", error=str(e), finished_at=self.clock())
+        job["updated_at"] = self.clock()
+        self._save(job)
+
+    # API
+
+    def submit(self, kind: str, items: List[str], context: Optional[Dict] = None) -> Dict:
+        """
+        Create and enqueue a job.
+
+        Args:
+            kind: Registered job kind
+            items: Work items, processed in order
+            context: JSON-serializable options passed to every handler call
+
+        Raises:
+            ValueError: If `kind` has no handler or `items` is empty
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        if not items:
+            raise ValueError("Job has no items")
+        now = self.clock()
+        job = {
+            "id": secrets.token_urlsafe(12),
+            "kind": kind,
+            "status": "queued",
+            "items": list(items),
+            "context": context or {},
+            "total": len(items),
+            "completed": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        self._jobs[job["id"]] = job
+        self._save(job)
+        if self._queue is not None:
+            self._queue.put_nowait(job["id"])
+        return self.get(job["id"])
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Job status and progress (without its items), or None if unknown."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        status = {k: v for k, v in job.items() if k != "items"}
+        status["progress"] = round(job["completed"] / job["total"], 4) if job["total"] else 1.0
+        return status
+
+    def cancel(self, job_id: str) -> bool:
+        """Stop a queued or running job after its current chunk. Returns False if already finished."""
+        job = self._jobs.get(job_id)
+        if job is None or job["status"] not in UNFINISHED:
+            return False
+        job.update(status="cancelled", updated_at=self.clock())
+        self._save(job)
+        return True
+
+    def iter_results(self, job_id: str) -> Iterator[Dict]:
+        """Stream a job's results in item order."""
+        path = self._results_path(job_id)
+        if not path.exists():
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.endswith("\n"):
+                    yield json.loads(line)
+
+    def results(self, job_id: str, offset: int = 0, limit: int = 100) -> List[Dict]:
+        """One page of a job's results."""
+        return list(itertools.islice(self.iter_results(job_id), offset, offset + limit))
+
+    def snapshot(self) -> Dict:
+        """Job counts by status and queue depth for monitoring."""
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job["status"]] = counts.get(job["status"], 0) + 1
+        return {
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "jobs": counts,
+        }
+
+
+job_queue = JobQueue(
+    store_dir=Config.JOB_STORE_DIR,
+    workers=Config.JOB_WORKERS,
+    chunk_size=Config.JOB_CHUNK_SIZE,
+    retention=Config.JOB_RETENTION,
+)
@@ -1,15 +1,48 @@
 """
 LLM-based Quality Evaluation
-Uses SmolLM3 to evaluate paper quality, credibility, and relevance.
+Uses the "scoring" model route (SmolLM3 by default) to evaluate paper quality, credibility, and relevance.
+Requests schema-constrained JSON output and tracks how often parsing still fails.
 """
 import os
 import json
 import httpx
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 
+from backend.services.model_router import model_router
 
-HF_ROUTER_URL = "https://router.huggingface.co/v1/chat/completions"
-HF_SUMMARY_MODEL = os.environ.get("HF_SUMMARY_MODEL") or "HuggingFaceTB/SmolLM3-3B:hf-inference"
+
+# Compact JSON schema for structured output: short keys and a bounded reason keep
+# generations to a few dozen tokens instead of free-form prose.
+EVALUATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "quality": {"type": "integer", "minimum": 0, "maximum": 10},
+        "credibility": {"type": "integer", "minimum": 0, "maximum": 10},
+        "relevance": {"type": "integer", "minimum": 0, "maximum": 10},
+        "suspicious": {"type": "boolean"},
+        "reason": {"type": "string", "maxLength": 160},
+    },
+    "required": ["quality", "credibility", "relevance", "suspicious", "reason"],
+    "additionalProperties": False,
+}
+EVALUATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "paper_evaluation", "strict": True, "schema": EVALUATION_SCHEMA},
+}
+EVALUATION_MAX_TOKENS = 120
+
+# Running counters for evaluation outcomes (exposed via get_evaluation_stats)
+_EVAL_STATS = {
+    "requests": 0,
+    "parsed": 0,
+    "parse_failures": 0,
+    "request_failures": 0,
+    "schema_unsupported": 0,
+}
+
+# Models whose provider rejected response_format as unsupported; later calls to them
+# skip the wasted round-trip and prompt for plain JSON
+_structured_output_unsupported: Set[str] = set()
 
 
 def _get_hf_token() -> Optional[str]:
@@ -40,40 +73,31 @@ CITATIONS: {citations}"""
     
     prompt += """
 
-Return ONLY valid JSON with this exact structure (no markdown, no extra text):
-{
-  "quality_score": <0-10>,
-  "credibility_score": <0-10>,
-  "relevance_score": <0-10>,
-  "suspicious": <true or false>,
-  "reason": "<brief explanation>"
-}
+Return ONLY JSON: {"quality": 0-10, "credibility": 0-10, "relevance": 0-10, "suspicious": true|false, "reason": "<one sentence>"}
 
 Scoring guidelines:
-- quality_score: Research methodology, clarity, contribution (0=poor, 10=excellent)
-- credibility_score: Venue reputation, citation patterns, author credibility (0=low, 10=high)
-- relevance_score: Relevance to search query if provided, otherwise general relevance (0=irrelevant, 10=highly relevant)
+- quality: Research methodology, clarity, contribution (0=poor, 10=excellent)
+- credibility: Venue reputation, citation patterns, author credibility (0=low, 10=high)
+- relevance: Relevance to search query if provided, otherwise general relevance (0=irrelevant, 10=highly relevant)
 - suspicious: true if paper shows signs of predatory publishing or academic misconduct
 - reason: One sentence explaining the overall assessment"""
     
     return prompt
 
 
-def _parse_llm_response(response_text: str) -> Dict:
+def _score_field(data: Dict, short_key: str, long_key: str) -> float:
+    """Read a 0-10 score under its compact or legacy key, clamped to range."""
+    value = data.get(short_key, data.get(long_key, 5))
+    return max(0, min(10, float(value)))
+
+
+def _try_parse_llm_response(response_text: str) -> Optional[Dict]:
     """
-    Parse LLM response, handling various formats.
-    Returns structured dict with safe defaults on error.
+    Parse LLM response, handling schema-constrained JSON as well as fenced/prose output.
+    Returns None if no usable JSON object was found.
     """
-    default_response = {
-        "quality_score": 5,
-        "credibility_score": 5,
-        "relevance_score": 5,
-        "suspicious": False,
-        "reason": "Unable to evaluate",
-    }
-    
     if not response_text:
-        return default_response
+        return None
     
     try:
         # Try to find JSON in response
@@ -93,19 +117,52 @@ def _parse_llm_response(response_text: str) -> Dict:
             json_str = text[start:end]
             data = json.loads(json_str)
             
-            # Validate and normalize scores
-            result = {
-                "quality_score": max(0, min(10, float(data.get("quality_score", 5)))),
-                "credibility_score": max(0, min(10, float(data.get("credibility_score", 5)))),
-                "relevance_score": max(0, min(10, float(data.get("relevance_score", 5)))),
+            # Validate and normalize scores (compact schema keys, legacy *_score keys as fallback)
+            return {
+                "quality_score": _score_field(data, "quality", "quality_score"),
+                "credibility_score": _score_field(data, "credibility", "credibility_score"),
+                "relevance_score": _score_field(data, "relevance", "relevance_score"),
                 "suspicious": bool(data.get("suspicious", False)),
                 "reason": str(data.get("reason", "No reason provided"))[:200],
             }
-            return result
-    except (json.JSONDecodeError, ValueError, KeyError):
+    except (json.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError):
         pass
     
-    return default_response
+    return None
+
+
+def _parse_llm_response(response_text: str) -> Dict:
+    """
+    Parse LLM response, handling various formats.
+    Returns structured dict with safe defaults on error.
+    """
+    parsed = _try_parse_llm_response(response_text)
+    if parsed is not None:
+        return parsed
+    return {
+        "quality_score": 5,
+        "credibility_score": 5,
+        "relevance_score": 5,
+        "suspicious": False,
+        "reason": "Unable to evaluate",
+    }
+
+
+def _rejects_response_format(response: httpx.Response) -> bool:
+    """True if a 400/422 error says response_format itself is unsupported (not a prompt-specific error)."""
+    if response.status_code not in (400, 422):
+        return False
+    body = response.text.lower()
+    return "response_format" in body and "support" in body
+
+
+def get_evaluation_stats() -> Dict:
+    """Return evaluation counters and the parse-failure rate of completed responses."""
+    stats = dict(_EVAL_STATS)
+    answered = stats["parsed"] + stats["parse_failures"]
+    stats["parse_failure_rate"] = round(stats["parse_failures"] / answered, 4) if answered else 0.0
+    stats["structured_output_unsupported_models"] = sorted(_structured_output_unsupported)
+    return stats
 
 
 async def evaluate_paper_llm(
@@ -128,6 +185,8 @@ async def evaluate_paper_llm(
             - relevance_score (float): 0-10
             - suspicious (bool): True if paper appears suspicious
             - reason (str): Brief explanation
+            - evaluated (bool): Only present, as False, when the request failed and
+              neutral default scores were returned
     """
     token = _get_hf_token()
     
@@ -138,43 +197,56 @@ async def evaluate_paper_llm(
             "credibility_score": 5,
             "relevance_score": 5,
             "suspicious": False,
+            "evaluated": False,
             "reason": "LLM evaluation unavailable (no API token)",
         }
     
+    _EVAL_STATS["requests"] += 1
+    
     try:
         prompt = _build_evaluation_prompt(paper, query)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                HF_ROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
+        payload = {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an academic reviewer. Return only valid JSON, no markdown."
                 },
-                json={
-                    "model": HF_SUMMARY_MODEL,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are an academic reviewer. Return only valid JSON, no markdown."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "max_tokens": 500,
-                    "temperature": 0.3,  # Lower temperature for more consistent output
+                {
+                    "role": "user",
+                    "content": prompt
                 }
-            )
+            ],
+            "max_tokens": EVALUATION_MAX_TOKENS,
+            "temperature": 0.3,  # Lower temperature for more consistent output
+        }
+        
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            model = model_router.pick("scoring")
+            response = None
+            if model not in _structured_output_unsupported:
+                response = await model_router.post(
+                    client, "scoring", token, {**payload, "response_format": EVALUATION_RESPONSE_FORMAT}, model=model
+                )
+                # Retry this request with plain JSON prompting; only stop asking this model for
+                # structured output when its provider says response_format isn't supported
+                if response.status_code in (400, 422):
+                    if _rejects_response_format(response):
+                        _structured_output_unsupported.add(model)
+                        _EVAL_STATS["schema_unsupported"] += 1
+                    response = None
+            
+            if response is None:
+                response = await model_router.post(client, "scoring", token, payload, model=model)
             
             # Check for credit depletion or quota errors
             if response.status_code == 402 or response.status_code == 429:
+                _EVAL_STATS["request_failures"] += 1
                 return {
                     "quality_score": 5,
                     "credibility_score": 5,
                     "relevance_score": 5,
                     "suspicious": False,
+                    "evaluated": False,
                     "reason": "HuggingFace API credits depleted - purchase credits or subscribe to PRO",
                 }
             
@@ -184,9 +256,17 @@ async def evaluate_paper_llm(
                 
                 if choices and isinstance(choices[0].get("message"), dict):
                     content = choices[0]["message"].get("content", "")
+                    parsed = _try_parse_llm_response(content)
+                    if parsed is not None:
+                        _EVAL_STATS["parsed"] += 1
+                        return parsed
+                    _EVAL_STATS["parse_failures"] += 1
                     return _parse_llm_response(content)
+            
+            _EVAL_STATS["request_failures"] += 1
     
     except (httpx.TimeoutException, httpx.HTTPError) as e:
+        _EVAL_STATS["request_failures"] += 1
         # Check if error message mentions credits
         error_msg = str(e).lower()
         if "credit" in error_msg or "quota" in error_msg or "balance" in error_msg:
@@ -195,10 +275,11 @@ async def evaluate_paper_llm(
                 "credibility_score": 5,
                 "relevance_score": 5,
                 "suspicious": False,
+                "evaluated": False,
                 "reason": "HuggingFace API credits depleted",
             }
     except Exception:
-        pass  # Catch any other errors
+        _EVAL_STATS["request_failures"] += 1  # Catch any other errors
     
     # Return safe defaults on any error
     return {
@@ -206,6 +287,7 @@ async def evaluate_paper_llm(
         "credibility_score": 5,
         "relevance_score": 5,
         "suspicious": False,
+        "evaluated": False,
         "reason": "LLM evaluation failed",
     }
 
@@ -248,6 +330,7 @@ async def batch_evaluate_llm(
                 "credibility_score": 5,
                 "relevance_score": 5,
                 "suspicious": False,
+                "evaluated": False,
                 "reason": "Evaluation failed",
             })
         else:
@@ -0,0 +1,184 @@
+"""
+Latency-aware Model Router
+Routes each AI task (scoring, summary, chat) to its configured Hugging Face models,
+tracks live p50/p95 latency and error rate per model, and shifts traffic to the
+fastest healthy alternative when a model degrades.
+"""
+import math
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import httpx
+
+from backend.config import Config
+
+
+class ModelStats:
+    """Rolling latency and outcome window for one model."""
+
+    def __init__(self, window: int = 50):
+        self.latencies: deque = deque(maxlen=window)
+        self.outcomes: deque = deque(maxlen=window)
+        self.total_requests = 0
+
+    def record(self, latency: float, ok: bool) -> None:
+        self.total_requests += 1
+        self.outcomes.append(ok)
+        if ok:
+            self.latencies.append(latency)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank percentile of successful request latencies (None without samples)."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return 1 - sum(self.outcomes) / len(self.outcomes)
+
+    @property
+    def samples(self) -> int:
+        return len(self.outcomes)
+
+
+class ModelRouter:
+    """
+    Picks a model per task and records how each request went.
+
+    Args:
+        routes: Task name -> ordered model list (first entry is the preferred model)
+        p95_limits: Task name -> p95 latency threshold in seconds
+        error_rate_limit: Error rate above which a model is considered unhealthy
+        min_samples: Samples needed before a model's stats are trusted
+        probe_interval: Every Nth pick for a degraded task still goes to the preferred
+            model so its stats can recover
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, List[str]],
+        p95_limits: Dict[str, float],
+        error_rate_limit: float = 0.25,
+        min_samples: int = 5,
+        window: int = 50,
+        probe_interval: int = 10,
+    ):
+        self.routes = routes
+        self.p95_limits = p95_limits
+        self.error_rate_limit = error_rate_limit
+        self.min_samples = min_samples
+        self.window = window
+        self.probe_interval = probe_interval
+        self._stats: Dict[str, ModelStats] = {}
+        self._picks: Dict[str, int] = {}
+
+    def _stats_for(self, model: str) -> ModelStats:
+        if model not in self._stats:
+            self._stats[model] = ModelStats(self.window)
+        return self._stats[model]
+
+    def is_healthy(self, model: str, task: str) -> bool:
+        """A model is healthy until it has enough samples showing high p95 or error rate."""
+        stats = self._stats_for(model)
+        if stats.samples < self.min_samples:
+            return True
+        if stats.error_rate > self.error_rate_limit:
+            return False
+        p95 = stats.percentile(95)
+        limit = self.p95_limits.get(task)
+        return p95 is None or limit is None or p95 <= limit
+
+    def pick(self, task: str) -> str:
+        """Return the model to use for `task`."""
+        candidates = self.routes.get(task) or self.routes["summary"]
+        primary = candidates[0]
+        if len(candidates) == 1 or self.is_healthy(primary, task):
+            return primary
+
+        self._picks[task] = self._picks.get(task, 0) + 1
+        if self._picks[task] % self.probe_interval == 0:
+            return primary
+
+        def sort_key(model: str):
+            stats = self._stats_for(model)
+            p95 = stats.percentile(95)
+            return (stats.error_rate > self.error_rate_limit, p95 if p95 is not None else 0.0)
+
+        healthy = [m for m in candidates[1:] if self.is_healthy(m, task)]
+        return min(healthy or candidates, key=sort_key)
+
+    def record(self, model: str, latency: float, ok: bool) -> None:
+        """Record the outcome of one request to `model`."""
+        self._stats_for(model).record(latency, ok)
+
+    async def post(
+        self,
+        client: httpx.AsyncClient,
+        task: str,
+        token: str,
+        payload: Dict,
+        model: Optional[str] = None,
+    ) -> httpx.Response:
+        """
+        Send a chat-completions request for `task` to the routed model and record its latency.
+
+        The payload must not include "model"; it is filled in from the route, or from
+        `model` when the caller already picked one (e.g. to retry on the same model).
+        Timeouts and network errors are recorded as failures and re-raised.
+        """
+        model = model or self.pick(task)
+        started = time.perf_counter()
+        try:
+            response = await client.post(
+                Config.HF_ROUTER_URL,
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json",
+                },
+                json={**payload, "model": model},
+            )
+        except httpx.HTTPError:
+            self.record(model, time.perf_counter() - started, ok=False)
+            raise
+        # 5xx (model loading/overloaded) and 429 count against the model; 4xx client errors don't
+        ok = response.status_code < 500 and response.status_code != 429
+        self.record(model, time.perf_counter() - started, ok=ok)
+        return response
+
+    def snapshot(self) -> Dict:
+        """Per-task routes and per-model latency/error stats for monitoring."""
+        models = {}
+        for model, stats in self._stats.items():
+            p50 = stats.percentile(50)
+            p95 = stats.percentile(95)
+            models[model] = {
+                "requests": stats.total_requests,
+                "p50_seconds": round(p50, 3) if p50 is not None else None,
+                "p95_seconds": round(p95, 3) if p95 is not None else None,
+                "error_rate": round(stats.error_rate, 4),
+            }
+        return {
+            "routes": {
+                task: {
+                    "models": candidates,
+                    "healthy": [m for m in candidates if self.is_healthy(m, task)],
+                }
+                for task, candidates in self.routes.items()
+            },
+            "models": models,
+        }
+
+
+model_router = ModelRouter(
+    routes=Config.HF_MODEL_ROUTES,
+    p95_limits=Config.HF_MODEL_P95_LIMITS,
+    error_rate_limit=Config.HF_MODEL_ERROR_RATE_LIMIT,
+    min_samples=Config.HF_MODEL_MIN_SAMPLES,
+    window=Config.HF_MODEL_STATS_WINDOW,
+)
@@ -0,0 +1,244 @@
+"""
+PDF Report Rendering
+Builds accreditation report PDFs with ReportLab in a pool of worker processes, so
+CPU-bound layout never runs on the event loop. Paragraph styles are built once per
+worker, and requests beyond a fixed number in flight are rejected up front.
+"""
+import asyncio
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from io import BytesIO
+from typing import Dict, Optional
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from backend.config import Config
+
+
+class PdfBusy(RuntimeError):
+    """Raised when the in-flight report cap is reached."""
+
+
+_STYLES: Optional[Dict[str, ParagraphStyle]] = None
+
+
+def _report_styles() -> Dict[str, ParagraphStyle]:
+    """Report paragraph styles, built on first use in each process."""
+    global _STYLES
+    if _STYLES is None:
+        base = getSampleStyleSheet()
+        _STYLES = {
+            "title": ParagraphStyle(
+                'CustomTitle',
+                parent=base['Heading1'],
+                fontSize=24,
+                textColor=colors.HexColor('#3b82f6'),
+                spaceAfter=12,
+                alignment=TA_CENTER,
+                fontName='Helvetica-Bold'
+            ),
+            "heading": ParagraphStyle(
+                'CustomHeading',
+                parent=base['Heading2'],
+                fontSize=14,
+                textColor=colors.HexColor('#1e40af'),
+                spaceAfter=10,
+                spaceBefore=10,
+                fontName='Helvetica-Bold'
+            ),
+            "normal": ParagraphStyle(
+                'CustomNormal',
+                parent=base['Normal'],
+                fontSize=11,
+                spaceAfter=8,
+                alignment=TA_LEFT
+            ),
+            "footer": ParagraphStyle('footer', parent=base['Normal'], fontSize=9, textColor=colors.grey),
+        }
+    return _STYLES
+
+
+STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 11),
+])
+
+
+def build_accreditation_pdf(
+    author_id: str,
+    author_name: str,
+    works_count: int = 0,
+    cited_by_count: int = 0,
+    h_index: Optional[int] = None,
+) -> bytes:
+    """
+    Render the accreditation report for one faculty member.
+
+    Returns:
+        The PDF document as bytes
+    """
+    styles = _report_styles()
+    title_style, heading_style, normal_style = styles["title"], styles["heading"], styles["normal"]
+
+    pdf_buffer = BytesIO()
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    content = []
+
+    # Header
+    content.append(Paragraph("FACULTY ACCREDITATION REPORT", title_style))
+    content.append(Spacer(1, 0.3*inch))
+
+    # Faculty Info
+    content.append(Paragraph(f"<b>Faculty Member:</b> {author_name}", normal_style))
+    content.append(Paragraph(f"<b>Author ID:</b> {author_id}", normal_style))
+    content.append(Paragraph(f"<b>Report Generated:</b> {datetime.now().strftime('%B %d, %Y')}", normal_style))
+    content.append(Spacer(1, 0.2*inch))
+
+    # Research Statistics
+    content.append(Paragraph("RESEARCH STATISTICS", heading_style))
+    stats_data = [
+        ['Metric', 'Value'],
+        ['Total Publications', str(works_count)],
+        ['Citations Received', str(cited_by_count)],
+        ['H-Index', str(h_index) if h_index else 'N/A'],
+    ]
+    stats_table = Table(stats_data, colWidths=[2.5*inch, 2*inch])
+    stats_table.setStyle(STATS_TABLE_STYLE)
+    content.append(stats_table)
+    content.append(Spacer(1, 0.3*inch))
+
+    # Assessment Summary
+    content.append(Paragraph("ASSESSMENT SUMMARY", heading_style))
+    assessment_text = f"""
+    The faculty member {author_name} has demonstrated significant academic productivity with {works_count} publications
+    and {cited_by_count} total citations. This report provides a comprehensive overview of research impact and scholarly achievement
+    for use in hiring, promotion, tenure, and accreditation decisions.
+    """
+    content.append(Paragraph(assessment_text, normal_style))
+    content.append(Spacer(1, 0.2*inch))
+
+    # Footer
+    content.append(Paragraph("---", normal_style))
+    content.append(Spacer(1, 0.1*inch))
+    content.append(Paragraph(
+        "Data source: <i>OpenAlex</i>. Generated by Publications Summary System.",
+        styles["footer"]
+    ))
+
+    doc.build(content)
+    return pdf_buffer.getvalue()
+
+
+class PdfRenderer:
+    """
+    Bounded process pool for report rendering.
+
+    Worker processes are started on first use (spawned, so they don't inherit the
+    server's threads) and build their styles once in the pool initializer. A pool
+    broken by a crashed worker is replaced on the next request.
+
+    Args:
+        max_workers: Worker processes
+        max_in_flight: Queued plus rendering reports allowed before new ones are rejected
+    """
+
+    def __init__(self, max_workers: int = 2, max_in_flight: int = 8):
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_report_styles,
+                )
+            return self._executor
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._stats[outcome] += 1
+
+    def _finished(self, executor: ProcessPoolExecutor, future: Future) -> None:
+        """Release the in-flight slot once the worker is done with the report."""
+        if future.cancelled():
+            self._count("failed")
+            return
+        if isinstance(future.exception(), BrokenProcessPool):
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+        self._count("failed" if future.exception() is not None else "completed")
+
+    async def render(self, **report) -> bytes:
+        """
+        Render build_accreditation_pdf(**report) in a worker process.
+
+        The in-flight slot is held until the worker finishes, even if the caller is
+        cancelled (a report already handed to a worker can't be stopped).
+
+        Raises:
+            PdfBusy: If max_in_flight reports are already queued or rendering
+        """
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self._stats["rejected"] += 1
+                raise PdfBusy("Too many PDF reports in progress")
+            self._in_flight += 1
+            self._stats["submitted"] += 1
+
+        executor = self._pool()
+        try:
+            future = executor.submit(build_accreditation_pdf, **report)
+        except BaseException as e:
+            if isinstance(e, BrokenProcessPool):
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+            self._count("failed")
+            raise
+        future.add_done_callback(functools.partial(self._finished, executor))
+        return await asyncio.wrap_future(future)
+
+    def snapshot(self) -> Dict:
+        """Pool size, reports in flight and lifetime counters for monitoring."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                **self._stats,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (queued reports are dropped)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+pdf_renderer = PdfRenderer(max_workers=Config.PDF_WORKERS, max_in_flight=Config.PDF_MAX_IN_FLIGHT)
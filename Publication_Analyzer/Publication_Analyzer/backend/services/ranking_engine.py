@@ -1,11 +1,61 @@
 """
 Smart Ranking Engine
 Combines multiple signals to rank papers by quality and relevance.
+
+The scalar calculate_* functions document each signal; rank_papers applies the
+same formulas to whole result sets at once with NumPy arrays.
 """
 import math
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import numpy as np
+
+from backend.services.relevance import relevance_scores
+
+
+# Score components, in column order of the component matrix
+COMPONENTS = ("citation", "recency", "author", "integrity", "llm", "relevance")
+
+# Components describing the paper itself; their weights sum to 1.0
+QUALITY_COMPONENTS = COMPONENTS[:5]
+
+# "relevance" is the share of the final score given to local query relevance (BM25).
+# It only applies when the ranking has a query that matched something; the quality
+# weights are then scaled by (1 - share). Without a query, scores are the quality blend.
+DEFAULT_WEIGHTS = {
+    "citation": 0.20,
+    "recency": 0.10,
+    "author": 0.15,
+    "integrity": 0.25,
+    "llm": 0.30,
+    "relevance": 0.15,
+}
+
+# Named weight blends for committees; quality weights in each sum to 1.0
+WEIGHT_PROFILES = {
+    "balanced": DEFAULT_WEIGHTS,
+    "impact": {"citation": 0.40, "recency": 0.05, "author": 0.20, "integrity": 0.15, "llm": 0.20, "relevance": 0.10},
+    "integrity": {"citation": 0.10, "recency": 0.05, "author": 0.10, "integrity": 0.50, "llm": 0.25, "relevance": 0.10},
+    "quality": {"citation": 0.10, "recency": 0.05, "author": 0.10, "integrity": 0.20, "llm": 0.55, "relevance": 0.10},
+    "emerging": {"citation": 0.15, "recency": 0.30, "author": 0.05, "integrity": 0.20, "llm": 0.30, "relevance": 0.15},
+    "topical": {"citation": 0.15, "recency": 0.10, "author": 0.10, "integrity": 0.25, "llm": 0.40, "relevance": 0.50},
+}
+
+DEFAULT_INTEGRITY = {
+    "integrity_score": 50,
+    "risk_level": "MEDIUM",
+    "flags": []
+}
+
+DEFAULT_LLM = {
+    "quality_score": 5,
+    "credibility_score": 5,
+    "relevance_score": 5,
+    "suspicious": False,
+    "reason": "Not evaluated"
+}
+
 
 def calculate_citation_score(paper: Dict) -> float:
     """
@@ -115,6 +165,10 @@ def generate_rank_explanation(
     """
     explanations = []
     
+    # Query relevance (absent in components stored before it existed)
+    if components.get("relevance", 0) >= 70:
+        explanations.append("Strong match for query")
+    
     # Citation score
     citations = paper.get("cited_by_count") or paper.get("citationCount") or 0
     if components["citation"] > 70:
@@ -153,82 +207,281 @@ def generate_rank_explanation(
     return " • ".join(explanations[:3])  # Limit to top 3 reasons
 
 
-def rank_papers(
+def parse_weights(spec: str) -> Dict[str, float]:
+    """
+    Parse custom weights of the form "citation:0.4,llm:0.3".
+    
+    Raises:
+        ValueError: On unknown components, malformed entries or negative weights
+    """
+    weights = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, value = part.partition(":")
+        name = name.strip().lower()
+        if not sep or name not in COMPONENTS:
+            raise ValueError(f"Invalid weight '{part}'. Use component:value with components {', '.join(COMPONENTS)}")
+        try:
+            weight = float(value)
+        except ValueError:
+            raise ValueError(f"Invalid weight value for {name}: {value!r}")
+        if weight < 0 or math.isnan(weight) or math.isinf(weight):
+            raise ValueError(f"Weight for {name} must be a non-negative number")
+        weights[name] = weight
+    return weights
+
+
+def resolve_weights(
+    profile: Optional[str] = None,
+    custom: Optional[Dict[str, float]] = None
+) -> Dict[str, float]:
+    """
+    Resolve a named profile plus optional custom overrides into component weights.
+    
+    Custom weights override the profile's values; the quality weights are renormalized
+    to sum to 1 and the relevance share is capped at 1.
+    
+    Raises:
+        ValueError: On an unknown profile or quality weights that sum to zero
+    """
+    name = (profile or "balanced").lower()
+    if name not in WEIGHT_PROFILES:
+        raise ValueError(f"Unknown ranking profile '{profile}'. Available: {', '.join(WEIGHT_PROFILES)}")
+    weights = dict(WEIGHT_PROFILES[name])
+    if not custom:
+        return weights
+    
+    weights.update(custom)
+    total = sum(weights[component] for component in QUALITY_COMPONENTS)
+    if total <= 0:
+        raise ValueError("Ranking weights must not all be zero")
+    resolved = {component: weights[component] / total for component in QUALITY_COMPONENTS}
+    resolved["relevance"] = min(1.0, weights["relevance"])
+    return resolved
+
+
+def score_component_matrix(
     papers: List[Dict],
     author: Optional[Dict] = None,
+    current_year: Optional[int] = None,
     query: Optional[str] = None
+) -> np.ndarray:
+    """
+    Compute all score components for a list of papers in one vectorized pass.
+    
+    Same formulas as the calculate_* functions above; relevance is BM25 over the
+    papers' titles and abstracts, indexed once for the whole set.
+    
+    Args:
+        papers: Papers with integrity and llm fields attached
+        author: Optional author info for reputation scoring
+        current_year: Reference year for age-based components (defaults to now)
+        query: Optional search query for the relevance column (zeros without one)
+    
+    Returns:
+        Array of shape (len(papers), len(COMPONENTS)), columns in COMPONENTS order
+    """
+    n = len(papers)
+    if current_year is None:
+        current_year = datetime.now().year
+    
+    years = np.zeros(n)
+    citations = np.zeros(n)
+    integrity = np.zeros(n)
+    llm_fields = np.zeros((n, 3))
+    suspicious = np.zeros(n, dtype=bool)
+    
+    for i, paper in enumerate(papers):
+        years[i] = paper.get("year") or paper.get("publication_year") or 0
+        citations[i] = paper.get("cited_by_count") or paper.get("citationCount") or 0
+        integrity[i] = paper.get("integrity", DEFAULT_INTEGRITY).get("integrity_score", 50)
+        llm = paper.get("llm", DEFAULT_LLM)
+        llm_fields[i] = (
+            llm.get("quality_score", 5),
+            llm.get("credibility_score", 5),
+            llm.get("relevance_score", 5),
+        )
+        suspicious[i] = bool(llm.get("suspicious", False))
+    
+    has_year = years != 0
+    matrix = np.empty((n, len(COMPONENTS)))
+    
+    # Citation rate on a log scale (see calculate_citation_score)
+    age = np.maximum(1, current_year - years)
+    rate = citations / age
+    normalized = np.minimum(100, (np.log(rate + 1) / math.log(51)) * 100)
+    matrix[:, 0] = np.where(has_year, normalized, citations * 0.1)
+    
+    # Recency bonus (see calculate_recency_bonus)
+    raw_age = current_year - years
+    matrix[:, 1] = np.where(has_year, np.where(raw_age <= 2, 20, np.where(raw_age <= 5, 10, 0)), 0)
+    
+    # Author reputation is shared by every paper in the set
+    matrix[:, 2] = calculate_author_reputation(author)
+    
+    matrix[:, 3] = integrity
+    
+    # LLM assessment (see calculate_llm_weight)
+    quality, credibility, relevance = llm_fields[:, 0], llm_fields[:, 1], llm_fields[:, 2]
+    llm_score = (quality * 2 + credibility * 2 + relevance * 1.5) / 5.5
+    llm_score = llm_score * 10
+    llm_score = np.where(suspicious, llm_score * 0.5, llm_score)
+    matrix[:, 4] = np.minimum(100, llm_score)
+    
+    matrix[:, 5] = relevance_scores(papers, query)
+    
+    return matrix
+
+
+def weighted_scores(matrix: np.ndarray, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    Combine component columns into final scores.
+    
+    Quality columns are accumulated in COMPONENTS order so results are identical to
+    the scalar weighted sum. The relevance share is blended in only when the
+    relevance column has a match (see DEFAULT_WEIGHTS).
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    relevance = matrix[:, COMPONENTS.index("relevance")] if matrix.shape[1] > len(QUALITY_COMPONENTS) else None
+    share = min(1.0, weights.get("relevance", 0.0)) if relevance is not None and relevance.any() else 0.0
+    
+    scores = np.zeros(matrix.shape[0])
+    for column, name in enumerate(QUALITY_COMPONENTS):
+        scores = scores + matrix[:, column] * (weights.get(name, 0.0) * (1 - share))
+    if share:
+        scores = scores + relevance * share
+    return scores
+
+
+def top_k_order(scores: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of the highest scores, best first.
+    
+    Ties keep input order (like a stable descending sort). With top_k, argpartition
+    narrows the candidates first so only O(k) rows are fully sorted.
+    """
+    n = scores.shape[0]
+    if top_k is None or top_k >= n:
+        return np.argsort(-scores, kind="stable")
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    threshold = scores[np.argpartition(-scores, top_k - 1)[:top_k]].min()
+    # Every row tied with the threshold is a candidate; the stable sort keeps the earliest ones
+    candidates = np.flatnonzero(scores >= threshold)
+    order = np.argsort(-scores[candidates], kind="stable")
+    return candidates[order[:top_k]]
+
+
+def component_matrix_from_papers(papers: List[Dict]) -> np.ndarray:
+    """Rebuild the component matrix from papers that already carry score_components."""
+    matrix = np.zeros((len(papers), len(COMPONENTS)))
+    for i, paper in enumerate(papers):
+        components = paper.get("score_components") or {}
+        matrix[i] = [components.get(name, 0.0) for name in COMPONENTS]
+    return matrix
+
+
+def _component_dict(paper: Dict, row: np.ndarray, author_score: float) -> Dict[str, float]:
+    """Component scores for one paper, with the same value types the scalar functions return."""
+    return {
+        "citation": float(row[0]),
+        "recency": int(row[1]),
+        "author": author_score,
+        "integrity": calculate_integrity_weight(paper.get("integrity", DEFAULT_INTEGRITY)),
+        "llm": float(row[4]),
+        "relevance": float(row[5]),
+    }
+
+
+def rank_papers(
+    papers: List[Dict],
+    author: Optional[Dict] = None,
+    query: Optional[str] = None,
+    top_k: Optional[int] = None,
+    weights: Optional[Dict[str, float]] = None
 ) -> List[Dict]:
     """
     Rank papers using multi-factor scoring.
     
+    Components and weighted scores are computed for all papers at once; explanations
+    are only built for the papers that are returned.
+    
     Args:
         papers: List of papers with integrity and llm fields attached
         author: Optional author info for reputation scoring
-        query: Optional search query (used in LLM evaluation)
+        query: Optional search query (scored locally with BM25 as the relevance component)
+        top_k: Optional number of top papers to return (default: all)
+        weights: Optional component weights (default: DEFAULT_WEIGHTS)
     
     Returns:
         Sorted list of papers with final_score and rank_explanation attached
     """
-    scored_papers = []
-    
-    for paper in papers:
-        # Get analysis results (should already be attached)
-        integrity = paper.get("integrity", {
-            "integrity_score": 50,
-            "risk_level": "MEDIUM",
-            "flags": []
-        })
-        llm = paper.get("llm", {
-            "quality_score": 5,
-            "credibility_score": 5,
-            "relevance_score": 5,
-            "suspicious": False,
-            "reason": "Not evaluated"
-        })
-        
-        # Calculate component scores
-        citation_score = calculate_citation_score(paper)
-        recency_bonus = calculate_recency_bonus(paper)
-        author_score = calculate_author_reputation(author)
-        integrity_score = calculate_integrity_weight(integrity)
-        llm_score = calculate_llm_weight(llm)
-        
-        # Weighted final score
-        final_score = (
-            citation_score * 0.20 +
-            recency_bonus * 0.10 +
-            author_score * 0.15 +
-            integrity_score * 0.25 +
-            llm_score * 0.30
-        )
-        
-        # Store component scores for explanation
-        components = {
-            "citation": citation_score,
-            "recency": recency_bonus,
-            "author": author_score,
-            "integrity": integrity_score,
-            "llm": llm_score,
-        }
-        
-        # Generate explanation
-        explanation = generate_rank_explanation(paper, components, final_score)
+    if not papers:
+        return []
+    
+    matrix = score_component_matrix(papers, author, query=query)
+    scores = weighted_scores(matrix, weights)
+    
+    # Sort on the rounded score, as the displayed final_score is rounded
+    order = top_k_order(np.round(scores, 2), top_k)
+    author_score = calculate_author_reputation(author)
+    
+    ranked_papers = []
+    for rank, index in enumerate(order, 1):
+        paper = papers[index]
+        components = _component_dict(paper, matrix[index], author_score)
+        final_score = float(scores[index])
         
-        # Attach scores to paper
         paper["final_score"] = round(final_score, 2)
-        paper["rank_explanation"] = explanation
+        paper["rank_explanation"] = generate_rank_explanation(paper, components, final_score)
         paper["score_components"] = components
-        
-        scored_papers.append(paper)
+        paper["rank"] = rank
+        ranked_papers.append(paper)
+    
+    return ranked_papers
+
+
+def rerank_papers(
+    papers: List[Dict],
+    weights: Dict[str, float],
+    top_k: Optional[int] = None,
+    matrix: Optional[np.ndarray] = None
+) -> List[Dict]:
+    """
+    Re-rank already scored papers under different weights without re-running analysis.
     
-    # Sort by final score (descending)
-    scored_papers.sort(key=lambda p: p["final_score"], reverse=True)
+    Only arithmetic on the stored score_components is done. Returned papers are
+    shallow copies, so cached inputs keep their original scores and ranks.
     
-    # Add rank position
-    for i, paper in enumerate(scored_papers, 1):
-        paper["rank"] = i
+    Args:
+        papers: Papers carrying score_components (e.g. output of rank_papers)
+        weights: Component weights (see resolve_weights)
+        top_k: Optional number of top papers to return (default: all)
+        matrix: Optional precomputed component matrix for `papers` (skips rebuilding it)
+    
+    Returns:
+        Re-sorted copies of the top papers with final_score, rank and rank_explanation updated
+    """
+    if not papers:
+        return []
+    if matrix is None:
+        matrix = component_matrix_from_papers(papers)
+    scores = weighted_scores(matrix, weights)
+    order = top_k_order(np.round(scores, 2), top_k)
+    
+    reranked = []
+    for rank, index in enumerate(order, 1):
+        paper = dict(papers[index])
+        final_score = float(scores[index])
+        paper["final_score"] = round(final_score, 2)
+        paper["rank_explanation"] = generate_rank_explanation(paper, paper["score_components"], final_score)
+        paper["rank"] = rank
+        reranked.append(paper)
     
-    return scored_papers
+    return reranked
 
 
 def get_top_papers(
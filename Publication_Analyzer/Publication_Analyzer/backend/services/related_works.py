@@ -0,0 +1,132 @@
+"""
+Related Works Index
+Local TF-IDF index over the titles and abstracts of every work the app has fetched.
+Terms are hashed into a fixed feature space (no vocabulary to maintain), rows live in
+a sparse CSR matrix that grows as works are cached, and IDF weights are applied at
+query time, so related papers come back without calling any upstream.
+"""
+import math
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from backend.config import Config
+from backend.services.relevance import tokenize
+from backend.services.vector_index import SparseVectorIndex
+
+
+# Work fields returned with each related work
+WORK_FIELDS = ("title", "publication_year", "venue", "cited_by_count", "doi")
+
+
+def hashed_term_counts(text: str, n_features: int) -> Dict[int, float]:
+    """
+    Sublinear term frequencies (1 + log tf) of unigrams and bigrams, hashed into `n_features` columns.
+
+    crc32 is used rather than hash(), which is salted per process.
+    """
+    tokens = tokenize(text)
+    terms = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    counts: Counter = Counter(zlib.crc32(term.encode("utf-8")) % n_features for term in terms)
+    return {column: 1.0 + math.log(tf) for column, tf in counts.items()}
+
+
+class RelatedWorksIndex:
+    """
+    Hashing-vectorizer TF-IDF index of works, with cosine top-k queries.
+
+    Document frequencies are kept per hashed feature and updated as works are added,
+    replaced or evicted; IDF is smooth (log((1 + N) / (1 + df)) + 1).
+
+    Args:
+        n_features: Hashed feature columns
+        max_works: Works kept; the least recently added are evicted beyond this
+    """
+
+    def __init__(self, n_features: int = 2 ** 18, max_works: int = 50000):
+        self.n_features = n_features
+        self.max_works = max_works
+        self._lock = threading.Lock()
+        self._vectors = SparseVectorIndex(max_rows=max_works + 1)
+        self._df = np.zeros(n_features, dtype=np.int32)
+        self._works: "OrderedDict[str, Dict]" = OrderedDict()
+
+    def _remove(self, work_id: str) -> None:
+        row = self._vectors.get(work_id)
+        if row:
+            self._df[list(row)] -= 1
+        self._vectors.remove(work_id)
+        self._works.pop(work_id, None)
+
+    def add_work(self, work: Dict) -> bool:
+        """
+        Index a work dict (id, title, abstract and the fields in WORK_FIELDS).
+
+        A work already indexed is only replaced when the new text is longer (e.g. its
+        abstract arrived after a title-only listing). Returns True if the index changed.
+        """
+        work_id = (work.get("id") or "").replace("https://openalex.org/", "")
+        text = " ".join(part for part in (work.get("title"), work.get("abstract")) if part)
+        if not work_id or not text:
+            return False
+        with self._lock:
+            existing = self._works.get(work_id)
+            if existing is not None and existing["text_length"] >= len(text):
+                return False
+            counts = hashed_term_counts(text, self.n_features)
+            if not counts:
+                return False
+            if existing is not None:
+                self._remove(work_id)
+            self._vectors.add(work_id, counts, normalize=False)
+            self._df[list(counts)] += 1
+            self._works[work_id] = {
+                **{field: work.get(field) for field in WORK_FIELDS},
+                "text_length": len(text),
+            }
+            while len(self._works) > self.max_works:
+                self._remove(next(iter(self._works)))
+            return True
+
+    def add_works(self, works: List[Dict]) -> int:
+        """Index several works; returns how many were added or replaced."""
+        return sum(self.add_work(work) for work in works)
+
+    def _idf(self) -> np.ndarray:
+        n = len(self._works)
+        return (np.log((1 + n) / (1 + self._df)) + 1).astype(np.float32)
+
+    def related(self, work_id: str, k: int = 10) -> Optional[List[Dict]]:
+        """
+        The k indexed works closest (TF-IDF cosine) to `work_id`.
+
+        Returns:
+            [{"id", "similarity", "title", ...}, ...] best first, or None if the work isn't indexed
+        """
+        with self._lock:
+            if work_id not in self._works:
+                return None
+            vector = self._vectors.get(work_id)
+            neighbours = self._vectors.query(vector, k=k, exclude=work_id, column_weights=self._idf())
+            return [
+                {
+                    "id": other_id,
+                    "similarity": similarity,
+                    **{field: self._works[other_id][field] for field in WORK_FIELDS},
+                }
+                for other_id, similarity in neighbours
+            ]
+
+    def __contains__(self, work_id: str) -> bool:
+        with self._lock:
+            return work_id in self._works
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._works)
+
+
+related_works = RelatedWorksIndex(n_features=Config.RELATED_WORKS_FEATURES, max_works=Config.RELATED_WORKS_MAX_ENTRIES)
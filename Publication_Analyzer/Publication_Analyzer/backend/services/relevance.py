@@ -0,0 +1,102 @@
+"""
+Local Relevance Scoring
+In-process BM25 over paper titles and abstracts, so query relevance is available
+without the LLM (disabled, slow or throttled) and without any network cost.
+"""
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Common English words that carry no topical signal
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were will with we our their these those into using based via".split()
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens without stopwords or single characters."""
+    if not text:
+        return []
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Okapi BM25 inverted index over a fixed set of documents.
+
+    Built once per result set; scoring a query touches only the postings of its terms.
+
+    Args:
+        documents: Document texts (one per paper)
+        k1: Term-frequency saturation
+        b: Length normalization strength
+    """
+
+    def __init__(self, documents: List[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.size = len(documents)
+        self.doc_lengths = np.zeros(self.size)
+
+        postings: Dict[str, tuple] = {}
+        for doc_id, text in enumerate(documents):
+            counts = Counter(tokenize(text))
+            self.doc_lengths[doc_id] = sum(counts.values())
+            for term, tf in counts.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(doc_id)
+                postings[term][1].append(tf)
+
+        # Postings as arrays: term -> (doc ids, term frequencies)
+        self.postings = {
+            term: (np.array(ids, dtype=np.intp), np.array(tfs, dtype=float))
+            for term, (ids, tfs) in postings.items()
+        }
+        self.avg_length = float(self.doc_lengths.mean()) if self.size and self.doc_lengths.any() else 1.0
+        self._length_norm = self.k1 * (1 - self.b + self.b * self.doc_lengths / self.avg_length)
+
+    def idf(self, term: str) -> float:
+        """BM25 idf (the +1 variant, never negative)."""
+        df = len(self.postings[term][0]) if term in self.postings else 0
+        return math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document for `query` (zeros if nothing matches)."""
+        scores = np.zeros(self.size)
+        for term in set(tokenize(query)):
+            if term not in self.postings:
+                continue
+            ids, tfs = self.postings[term]
+            scores[ids] += self.idf(term) * tfs * (self.k1 + 1) / (tfs + self._length_norm[ids])
+        return scores
+
+
+def paper_document(paper: Dict) -> str:
+    """Text indexed for a paper; the title is repeated to weight it above the abstract."""
+    title = paper.get("title") or ""
+    abstract = paper.get("abstract") or ""
+    return f"{title} {title} {abstract}"
+
+
+def relevance_scores(papers: List[Dict], query: Optional[str]) -> np.ndarray:
+    """
+    Query relevance of each paper on a 0-100 scale (best match in the set = 100).
+
+    Returns zeros when there is no query or no paper matches it.
+    """
+    if not papers or not query or not tokenize(query):
+        return np.zeros(len(papers))
+
+    index = BM25Index([paper_document(p) for p in papers])
+    scores = index.scores(query)
+    best = scores.max()
+    if best <= 0:
+        return scores
+    return scores / best * 100
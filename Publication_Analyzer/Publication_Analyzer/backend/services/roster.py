@@ -0,0 +1,84 @@
+"""
+Faculty Roster Reader
+Parses uploaded roster CSVs row by row (optional header, configurable name column),
+yielding each distinct faculty name once, so large files are never held in memory.
+"""
+import csv
+import io
+from typing import BinaryIO, Iterator, List, Optional
+
+from backend.utils import normalize_name
+
+
+# Header cells that mark a column of faculty names
+NAME_HEADERS = ("name", "names", "full name", "faculty", "faculty name", "author", "author name", "researcher")
+
+
+class RosterReader:
+    """
+    Iterate the distinct faculty names in a roster CSV.
+
+    The header row is optional: it is detected when the name column's first cell is a
+    known header ("Name", "Faculty Name", ...). Names are deduplicated by normalized form.
+
+    Args:
+        stream: Binary file object (e.g. an uploaded file)
+        name_column: Header name or 0-based column index (default: a known name header, else column 0)
+        max_names: Stop after this many distinct names
+
+    Raises:
+        ValueError: If name_column is a header name and the file has no such column
+    """
+
+    def __init__(self, stream: BinaryIO, name_column: Optional[str] = None, max_names: int = 5000):
+        self.max_names = max_names
+        self.stats = {"rows": 0, "names": 0, "duplicates": 0, "blank": 0, "truncated": False}
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline="")
+        self._rows = csv.reader(text)
+        self._first: Optional[List[str]] = next(self._rows, None)
+        self.column = self._resolve_column(name_column)
+
+    def _resolve_column(self, name_column: Optional[str]) -> int:
+        header = [normalize_name(cell) for cell in self._first or []]
+        if name_column is not None and not name_column.strip().isdigit():
+            wanted = normalize_name(name_column)
+            if wanted not in header:
+                raise ValueError(f"Column '{name_column}' not found in CSV header")
+            self._first = None  # Header row is not a name
+            return header.index(wanted)
+
+        column = int(name_column) if name_column is not None else next(
+            (i for i, cell in enumerate(header) if cell in NAME_HEADERS), 0
+        )
+        if column < len(header) and header[column] in NAME_HEADERS:
+            self._first = None
+        return column
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        rows = self._rows if self._first is None else _prepend(self._first, self._rows)
+        try:
+            for row in rows:
+                self.stats["rows"] += 1
+                name = " ".join(row[self.column].split()) if self.column < len(row) else ""
+                key = normalize_name(name)
+                if not key:
+                    self.stats["blank"] += 1
+                    continue
+                if key in seen:
+                    self.stats["duplicates"] += 1
+                    continue
+                if len(seen) >= self.max_names:
+                    self.stats["truncated"] = True
+                    return
+                seen.add(key)
+                self.stats["names"] += 1
+                yield name
+        except csv.Error as e:
+            # Malformed input ends the roster; names read so far are still processed
+            self.stats["error"] = f"CSV parse error on row {self.stats['rows']}: {e}"
+
+
+def _prepend(first: List[str], rows) -> Iterator[List[str]]:
+    yield first
+    yield from rows
@@ -0,0 +1,184 @@
+"""
+Google Scholar Profile Cache
+Persists filled Scholar profiles per section (basics, indices, publications), each
+with its own TTL, so repeat views and searches don't refill profiles and only
+stale or missing sections are fetched again. Writes are batched: updates mark the
+cache dirty and a timer thread saves it shortly afterwards, off the event loop.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from backend.config import Config
+
+
+# scholarly fill sections and the author fields each one provides
+SECTION_FIELDS = {
+    "basics": ("scholar_id", "name", "affiliation", "email", "email_domain", "interests",
+               "url_picture", "homepage", "organization"),
+    "indices": ("citedby", "citedby5y", "hindex", "hindex5y", "i10index", "i10index5y"),
+    "publications": ("publications",),
+}
+SECTIONS = tuple(SECTION_FIELDS)
+
+# Publication fields kept (scholarly adds internal bookkeeping we don't need)
+PUBLICATION_FIELDS = ("bib", "num_citations", "author_pub_id", "pub_url", "citedby_url")
+
+
+def _compact_publication(pub: Dict) -> Dict:
+    compact = {key: pub[key] for key in PUBLICATION_FIELDS if key in pub}
+    compact["bib"] = dict(compact.get("bib") or {})
+    return compact
+
+
+class ScholarProfileCache:
+    """
+    Section-level Scholar profile cache, persisted to a JSON file.
+
+    The file is rewritten at most once per `save_delay` seconds however many profiles
+    are stored in between; call flush() on shutdown to save pending updates.
+
+    Args:
+        path: JSON file to persist to (None keeps the cache in memory only)
+        ttls: Section name -> TTL in seconds
+        max_profiles: Least recently updated profiles beyond this are evicted
+        clock: Wall-clock time source (persisted timestamps must survive restarts)
+        save_delay: Seconds between the first unsaved update and the write
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        ttls: Dict[str, float],
+        max_profiles: int = 2000,
+        clock: Callable[[], float] = time.time,
+        save_delay: float = 5.0,
+    ):
+        self.path = Path(path) if path else None
+        self.ttls = ttls
+        self.max_profiles = max_profiles
+        self.clock = clock
+        self.save_delay = save_delay
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._profiles: "OrderedDict[str, Dict]" = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return  # Unreadable cache is just a cold cache
+        if isinstance(data, dict):
+            self._profiles.update(data)
+
+    def _schedule_save(self) -> None:
+        """Mark the cache dirty and start the save timer unless one is pending (call with the lock held)."""
+        self._dirty = True
+        if self.path and self._timer is None:
+            self._timer = threading.Timer(self.save_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending updates to `path` (best effort; no-op when nothing changed)."""
+        with self._save_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self.path or not self._dirty:
+                    return
+                self._dirty = False
+                # Entries are replaced, never mutated, so a shallow copy is a consistent snapshot
+                snapshot = dict(self._profiles)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(snapshot, default=str), encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError:
+                pass  # Persistence is best effort; the in-memory cache still works
+
+    def _fresh(self, entry: Optional[Dict], section: str) -> bool:
+        if not entry or section not in entry:
+            return False
+        return self.clock() - entry[section]["fetched_at"] <= self.ttls.get(section, 0)
+
+    def missing(self, scholar_id: str, sections: List[str]) -> List[str]:
+        """Sections of `sections` that are not cached or have expired."""
+        with self._lock:
+            self._load()
+            entry = self._profiles.get(scholar_id)
+            return [section for section in sections if not self._fresh(entry, section)]
+
+    def get(self, scholar_id: str, sections: List[str]) -> Optional[Dict]:
+        """Merged author fields for `sections`, or None unless all of them are fresh."""
+        with self._lock:
+            self._load()
+            entry = self._profiles.get(scholar_id)
+            if not all(self._fresh(entry, section) for section in sections):
+                return None
+            author = {"scholar_id": scholar_id}
+            for section in sections:
+                author.update(entry[section]["data"])
+            return author
+
+    def put(self, scholar_id: str, author: Dict, sections: List[str]) -> None:
+        """Store the given sections of a filled scholarly author."""
+        if not scholar_id:
+            return
+        now = self.clock()
+        with self._lock:
+            self._load()
+            entry = dict(self._profiles.pop(scholar_id, {}))
+            for section in sections:
+                data = {field: author.get(field) for field in SECTION_FIELDS[section] if field in author}
+                if section == "publications":
+                    data["publications"] = [_compact_publication(p) for p in author.get("publications") or []]
+                entry[section] = {"fetched_at": now, "data": data}
+            self._profiles[scholar_id] = entry
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+            self._schedule_save()
+
+    def cached_authors(self) -> List[Dict]:
+        """Basics and indices of every cached profile, fresh or not (for building indexes)."""
+        with self._lock:
+            self._load()
+            authors = []
+            for scholar_id, entry in self._profiles.items():
+                author = {"scholar_id": scholar_id}
+                for section in ("basics", "indices"):
+                    if section in entry:
+                        author.update(entry[section]["data"])
+                authors.append(author)
+            return authors
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._profiles)
+
+
+scholar_profiles = ScholarProfileCache(
+    path=Config.SCHOLAR_CACHE_FILE,
+    ttls={
+        "basics": Config.SCHOLAR_TTL_BASICS,
+        "indices": Config.SCHOLAR_TTL_INDICES,
+        "publications": Config.SCHOLAR_TTL_PUBLICATIONS,
+    },
+    max_profiles=Config.SCHOLAR_CACHE_MAX_PROFILES,
+    save_delay=Config.SCHOLAR_CACHE_SAVE_DELAY,
+)
@@ -0,0 +1,170 @@
+"""
+Google Scholar Job Runner
+Runs blocking scholarly calls on a dedicated, bounded thread pool with cooperative
+cancellation, so callers that time out don't leave zombie threads holding executor
+slots, and overload is rejected up front instead of queueing without limit.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from backend.config import Config
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when its caller has given up on it."""
+
+
+class ScholarBusy(RuntimeError):
+    """Raised when the in-flight job cap is reached."""
+
+
+class ScholarJob:
+    """Handle passed to job functions so they can stop between blocking steps."""
+
+    def __init__(self):
+        self.cancel_event = threading.Event()
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished = False
+        self.abandoned = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def check(self) -> None:
+        """Raise JobCancelled if the caller abandoned this job."""
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+
+class ScholarJobRunner:
+    """
+    Bounded executor for blocking Scholar work.
+
+    Job functions take a ScholarJob as their first argument and should call
+    job.check() between network round-trips. A job whose caller times out is
+    flagged cancelled: if it has not started it never runs, otherwise it stops at
+    its next check and is counted as abandoned until its thread is free again.
+
+    Args:
+        max_workers: Threads in the dedicated pool
+        max_in_flight: Queued plus running jobs allowed before new ones are rejected
+    """
+
+    def __init__(self, max_workers: int = 4, max_in_flight: int = 16):
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scholar")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self._abandoned_running = 0
+        self._jobs: set = set()
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "abandoned": 0,
+            "cancelled_before_start": 0,
+        }
+
+    def _execute(self, job: ScholarJob, fn: Callable, args: tuple) -> Any:
+        with self._lock:
+            if job.cancelled:
+                raise JobCancelled()
+            job.started_at = time.monotonic()
+            self._running += 1
+        try:
+            return fn(job, *args)
+        finally:
+            with self._lock:
+                job.finished = True
+                self._running -= 1
+                if job.abandoned:
+                    self._abandoned_running -= 1
+
+    def _on_done(self, job: ScholarJob, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._jobs.discard(job)
+            if future.cancelled() or (job.cancelled and job.started_at is None):
+                self._stats["cancelled_before_start"] += 1
+            elif future.exception() is None:
+                self._stats["completed"] += 1
+            elif not isinstance(future.exception(), JobCancelled):
+                self._stats["failed"] += 1
+
+    def _abandon(self, job: ScholarJob, future: Future) -> None:
+        """Flag a job its caller gave up on; a queued job is dropped outright."""
+        if future.cancel():
+            job.cancel_event.set()
+            return
+        with self._lock:
+            job.cancel_event.set()
+            if job.started_at is not None and not job.finished:
+                job.abandoned = True
+                self._stats["abandoned"] += 1
+                self._abandoned_running += 1
+
+    async def run(self, fn: Callable, *args, timeout: float) -> Any:
+        """
+        Run fn(job, *args) on the Scholar pool and wait up to `timeout` seconds.
+
+        Raises:
+            ScholarBusy: If max_in_flight jobs are already queued or running
+            asyncio.TimeoutError: If the job did not finish in time (it is cancelled)
+        """
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self._stats["rejected"] += 1
+                raise ScholarBusy("Too many Google Scholar requests in flight")
+            self._in_flight += 1
+            self._stats["submitted"] += 1
+
+        job = ScholarJob()
+        with self._lock:
+            self._jobs.add(job)
+        future = self._executor.submit(self._execute, job, fn, args)
+        future.add_done_callback(lambda f: self._on_done(job, f))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._stats["timed_out"] += 1
+            self._abandon(job, future)
+            raise
+        except asyncio.CancelledError:
+            self._abandon(job, future)
+            raise
+
+    def snapshot(self) -> Dict:
+        """Queue depth, running/abandoned jobs and lifetime counters for monitoring."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                "running": self._running,
+                "queue_depth": max(0, self._in_flight - self._running),
+                "abandoned_running": self._abandoned_running,
+                **self._stats,
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work, drop queued jobs and signal running ones."""
+        with self._lock:
+            for job in self._jobs:
+                job.cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+scholar_jobs = ScholarJobRunner(
+    max_workers=Config.SCHOLAR_MAX_WORKERS,
+    max_in_flight=Config.SCHOLAR_MAX_IN_FLIGHT,
+)
@@ -0,0 +1,140 @@
+"""
+Search Result Cache
+Stale-while-revalidate cache for upstream search responses: fresh entries are
+served directly, stale ones are served immediately while a single background
+refresh replaces them, and concurrent misses for one key share one fetch.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from backend.config import Config
+from backend.services.ttl_cache import TTLCache
+
+
+class SearchResultCache:
+    """
+    Stale-while-revalidate cache keyed by normalized search parameters.
+
+    Args:
+        ttl: Seconds an entry is served as fresh
+        stale_ttl: Further seconds an expired entry may still be served while it is refreshed
+        max_entries: Least recently used entries beyond this are evicted
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float,
+        max_entries: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.clock = clock
+        # Entries live for the whole fresh + stale window; freshness is checked on read
+        self._entries = TTLCache(ttl=ttl + stale_ttl, max_entries=max_entries)
+        self._fetches: Dict[Hashable, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self._stats = {"fresh": 0, "stale": 0, "miss": 0, "refreshed": 0, "refresh_failed": 0, "uncached": 0}
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def _fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> asyncio.Task:
+        """Start (or join) the fetch for `key`; a successful result is stored unless `cacheable` rejects it."""
+        task = self._fetches.get(key)
+        if task is not None:
+            return task
+
+        async def _run():
+            try:
+                value = await fetch()
+                if cacheable is None or cacheable(value):
+                    self._entries.set(key, (self.clock(), value))
+                else:
+                    self._count("uncached")
+                return value
+            finally:
+                self._fetches.pop(key, None)
+
+        task = asyncio.ensure_future(_run())
+        self._fetches[key] = task
+        return task
+
+    def _on_refreshed(self, task: asyncio.Task) -> None:
+        # Retrieve the outcome so a failed background refresh isn't reported as unhandled;
+        # the stale entry stays until it ages out or a later refresh succeeds
+        if task.cancelled() or task.exception() is not None:
+            self._count("refresh_failed")
+        else:
+            self._count("refreshed")
+
+    async def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, str]:
+        """
+        Return the cached value for `key`, fetching it on a miss.
+
+        Args:
+            key: Normalized cache key
+            fetch: Zero-argument coroutine function producing a fresh value
+            cacheable: Predicate on a fetched value; values it rejects are returned but
+                not stored (a stale entry being refreshed is kept)
+
+        Returns:
+            (value, outcome) where outcome is "fresh", "stale" or "miss"
+
+        Raises:
+            Whatever `fetch` raises on a miss (failed fetches are not cached)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetched_at, value = entry
+            if self.clock() - fetched_at <= self.ttl:
+                self._count("fresh")
+                return value, "fresh"
+            if key not in self._fetches:
+                self._fetch(key, fetch, cacheable).add_done_callback(self._on_refreshed)
+            self._count("stale")
+            return value, "stale"
+
+        self._count("miss")
+        # Shield so one client disconnecting doesn't cancel a fetch other requests share
+        return await asyncio.shield(self._fetch(key, fetch, cacheable)), "miss"
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+    def snapshot(self) -> Dict:
+        """Entry count, refreshes in progress and hit/stale/miss counters for monitoring."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "refreshing": len(self._fetches),
+                **self._stats,
+            }
+
+
+author_search_cache = SearchResultCache(
+    ttl=Config.SEARCH_CACHE_TTL,
+    stale_ttl=Config.SEARCH_CACHE_STALE_TTL,
+    max_entries=Config.SEARCH_CACHE_MAX_ENTRIES,
+)
+topic_search_cache = SearchResultCache(
+    ttl=Config.SEARCH_CACHE_TTL,
+    stale_ttl=Config.SEARCH_CACHE_STALE_TTL,
+    max_entries=Config.SEARCH_CACHE_MAX_ENTRIES,
+)
@@ -0,0 +1,169 @@
+"""
+Similar Authors Index
+Topic profiles of every OpenAlex author the app has fetched, held as L2-normalized
+sparse vectors in memory, so researchers with a similar topic mix are found by one
+cosine top-k query without an upstream call.
+"""
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from backend.config import Config
+from backend.services.vector_index import SparseVectorIndex
+
+
+def _short_id(url_or_id: Optional[str]) -> str:
+    return (url_or_id or "").replace("https://openalex.org/", "")
+
+
+def author_topics(author: Dict) -> Dict[str, Dict]:
+    """
+    Topic id -> {"name", "weight"} for a raw OpenAlex author object.
+
+    Uses `topics` (weight log(1 + works in the topic)); authors without topics fall
+    back to the legacy `x_concepts` scores.
+    """
+    topics = {}
+    for topic in author.get("topics") or []:
+        topic_id = _short_id(topic.get("id"))
+        if topic_id and topic.get("count"):
+            topics[topic_id] = {"name": topic.get("display_name"), "weight": math.log1p(topic["count"])}
+    if not topics:
+        for concept in author.get("x_concepts") or []:
+            concept_id = _short_id(concept.get("id"))
+            if concept_id and concept.get("score"):
+                topics[concept_id] = {"name": concept.get("display_name"), "weight": concept["score"] / 100}
+    return topics
+
+
+class AuthorTopicIndex:
+    """
+    Author id -> topic vector, with cosine nearest-neighbour search.
+
+    Topics are mapped to columns as they are first seen. Author metadata and topic
+    weights are kept alongside the vectors so the index can be saved and reloaded.
+
+    Args:
+        path: JSON file the index is saved to and loaded from (None keeps it in memory only)
+        max_authors: Authors kept; the least recently added are evicted beyond this
+    """
+
+    def __init__(self, path: Optional[Path], max_authors: int = 20000):
+        self.path = Path(path) if path else None
+        self.max_authors = max_authors
+        self._lock = threading.Lock()
+        self._vectors = SparseVectorIndex(max_rows=max_authors)
+        self._columns: Dict[str, int] = {}
+        self._topic_names: Dict[str, str] = {}
+        self._authors: "OrderedDict[str, Dict]" = OrderedDict()
+        self._loaded = False
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return  # Unreadable index: rebuild it from authors fetched from now on
+        for author_id, entry in (data.get("authors") or {}).items():
+            self._add(author_id, entry)
+
+    def save(self) -> None:
+        """Write the index to `path` (best effort)."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._loaded:
+                return
+            data = json.dumps({"authors": self._authors})
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(data, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # The in-memory index keeps working; it is rebuilt as authors are fetched
+
+    def _add(self, author_id: str, entry: Dict) -> None:
+        vector = {}
+        for topic_id, topic in entry["topics"].items():
+            column = self._columns.setdefault(topic_id, len(self._columns))
+            self._topic_names[topic_id] = topic.get("name") or topic_id
+            vector[column] = topic["weight"]
+        self._vectors.add(author_id, vector)
+        self._authors.pop(author_id, None)
+        self._authors[author_id] = entry
+        while len(self._authors) > self.max_authors:
+            self._authors.popitem(last=False)
+
+    def add_author(self, author: Dict) -> bool:
+        """Index a raw OpenAlex author object. Returns False if it has no id or topics."""
+        author_id = _short_id(author.get("id"))
+        topics = author_topics(author)
+        if not author_id or not topics:
+            return False
+        institution = (author.get("last_known_institutions") or [{}])[0] or {}
+        entry = {
+            "display_name": author.get("display_name"),
+            "institution": institution.get("display_name"),
+            "works_count": author.get("works_count"),
+            "cited_by_count": author.get("cited_by_count"),
+            "topics": topics,
+        }
+        with self._lock:
+            self._load()
+            self._add(author_id, entry)
+        return True
+
+    def __contains__(self, author_id: str) -> bool:
+        with self._lock:
+            self._load()
+            return author_id in self._authors
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._authors)
+
+    def similar(self, author_id: str, k: int = 10) -> Optional[List[Dict]]:
+        """
+        The k authors whose topic vectors are closest (cosine) to `author_id`'s.
+
+        Returns:
+            [{"id", "display_name", "institution", "works_count", "cited_by_count",
+            "similarity", "shared_topics"}, ...] best first, or None if the author isn't indexed
+        """
+        with self._lock:
+            self._load()
+            entry = self._authors.get(author_id)
+            if entry is None:
+                return None
+            vector = self._vectors.get(author_id)
+            neighbours = self._vectors.query(vector, k=k, exclude=author_id)
+            results = []
+            for other_id, similarity in neighbours:
+                other = self._authors[other_id]
+                shared = sorted(
+                    set(entry["topics"]) & set(other["topics"]),
+                    key=lambda t: -min(entry["topics"][t]["weight"], other["topics"][t]["weight"]),
+                )
+                results.append({
+                    "id": other_id,
+                    "display_name": other.get("display_name"),
+                    "institution": other.get("institution"),
+                    "works_count": other.get("works_count"),
+                    "cited_by_count": other.get("cited_by_count"),
+                    "similarity": similarity,
+                    "shared_topics": [self._topic_names[t] for t in shared[:5]],
+                })
+            return results
+
+
+author_topic_index = AuthorTopicIndex(Config.AUTHOR_TOPICS_FILE, max_authors=Config.SIMILAR_AUTHORS_MAX_ENTRIES)
@@ -0,0 +1,157 @@
+"""
+Streaming Statistics
+Constant-memory summaries of a stream of numbers: count, mean, variance, min/max
+(Welford's algorithm) and quantile estimates (the P² algorithm), so department
+statistics for large rosters are updated as each result arrives without keeping it.
+"""
+import math
+from typing import Dict, List, Optional, Sequence
+
+
+class RunningStats:
+    """Count, mean, variance, min and max in one pass (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self.min = x if self.min is None else min(self.min, x)
+        self.max = x if self.max is None else max(self.max, x)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 for fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile from five markers (Jain & Chlamtac's P² algorithm).
+
+    Exact for the first five values; afterwards the markers are nudged toward their
+    desired positions with piecewise-parabolic interpolation.
+
+    Args:
+        p: Quantile in [0, 1] (0.5 for the median)
+    """
+
+    def __init__(self, p: float):
+        if not 0.0 <= p <= 1.0:
+            raise ValueError(f"Quantile must be between 0 and 1, got {p}")
+        self.p = p
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        q = self._heights
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        # Find the cell x falls in, widening the extreme markers if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers toward their desired positions
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                n[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current estimate (None before any value)."""
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            # Exact, with linear interpolation between order statistics
+            position = self.p * (self.count - 1)
+            lower = int(position)
+            upper = min(lower + 1, self.count - 1)
+            return self._heights[lower] + (position - lower) * (self._heights[upper] - self._heights[lower])
+        return self._heights[2]
+
+
+class StreamingSummary:
+    """
+    Running moments plus quantile sketches for one metric.
+
+    Args:
+        quantiles: Quantiles to estimate (reported as p10, p25, median, ...)
+    """
+
+    DEFAULT_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+    def __init__(self, quantiles: Sequence[float] = DEFAULT_QUANTILES):
+        self.stats = RunningStats()
+        self.quantiles = {p: P2Quantile(p) for p in quantiles}
+
+    def add(self, x: Optional[float]) -> None:
+        """Add a value (None is ignored, e.g. an unknown h-index)."""
+        if x is None:
+            return
+        self.stats.add(x)
+        for estimator in self.quantiles.values():
+            estimator.add(x)
+
+    @property
+    def count(self) -> int:
+        return self.stats.count
+
+    def summary(self, digits: int = 2) -> Dict:
+        """Count, mean, std, min, max and quantile estimates, rounded to `digits`."""
+        def _round(value):
+            return round(value, digits) if value is not None else None
+
+        result = {
+            "count": self.stats.count,
+            "mean": _round(self.stats.mean) if self.stats.count else None,
+            "std": _round(self.stats.std) if self.stats.count else None,
+            "min": self.stats.min,
+            "max": self.stats.max,
+        }
+        for p, estimator in self.quantiles.items():
+            result["median" if p == 0.5 else f"p{round(p * 100):g}"] = _round(estimator.value)
+        return result
@@ -0,0 +1,82 @@
+"""
+In-memory TTL Cache
+Small LRU-bounded cache with per-entry expiry, shared by the API services.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Dictionary-like cache whose entries expire after `ttl` seconds.
+
+    Args:
+        ttl: Default lifetime of an entry in seconds
+        max_entries: Maximum number of entries; the least recently used is evicted first
+        sliding: If True, every successful `get` extends the entry's lifetime (idle TTL)
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024, sliding: bool = False):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.sliding = sliding
+        self._data: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at, ttl = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                del self._data[key]
+                return default
+            if self.sliding:
+                entry[1] = now + ttl
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key`, optionally overriding the default TTL."""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._data[key] = [value, time.monotonic() + ttl, ttl]
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove `key` and return its value (expired entries return `default`)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None or entry[1] <= time.monotonic():
+            return default
+        return entry[0]
+
+    def purge_expired(self) -> int:
+        """Drop all expired entries. Returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, entry in self._data.items() if entry[1] <= now]
+            for key in expired:
+                del self._data[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
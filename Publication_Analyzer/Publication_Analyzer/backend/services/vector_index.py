@@ -0,0 +1,196 @@
+"""
+Sparse Vector Index
+In-memory nearest-neighbour index over sparse vectors (author topic profiles, hashed
+paper text), stored as a growable CSR matrix in NumPy arrays and queried for the
+top-k cosine neighbours with one sparse-dense product over all rows.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+
+class SparseVectorIndex:
+    """
+    Keyed sparse rows in CSR form (column indices, values, row pointers).
+
+    Rows are appended to arrays grown by doubling, so adding a vector is amortized
+    O(nnz). Re-adding a key tombstones its old row; tombstoned and evicted rows are
+    dropped by a compaction once they outnumber the live rows.
+
+    Similarity is cosine. Column weights (e.g. IDF) can be applied at query time, in
+    which case row norms are recomputed under those weights; otherwise rows are
+    stored L2-normalized.
+
+    Args:
+        max_rows: Live rows kept; the least recently added are evicted beyond this
+    """
+
+    def __init__(self, max_rows: int = 20000):
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._indices = np.zeros(1024, dtype=np.int32)
+        self._values = np.zeros(1024, dtype=np.float32)
+        self._indptr = np.zeros(257, dtype=np.int64)
+        self._keys: List[Optional[Hashable]] = []
+        self._alive = np.zeros(256, dtype=bool)
+        self._live: "OrderedDict[Hashable, int]" = OrderedDict()  # key -> row, oldest first
+        self._nnz = 0
+        self.n_columns = 0
+
+    # Storage
+
+    def _reserve(self, extra_nnz: int) -> None:
+        if self._nnz + extra_nnz > self._indices.size:
+            size = max(self._indices.size * 2, self._nnz + extra_nnz)
+            self._indices = np.resize(self._indices, size)
+            self._values = np.resize(self._values, size)
+        if len(self._keys) + 2 > self._indptr.size:
+            self._indptr = np.resize(self._indptr, self._indptr.size * 2)
+            self._alive = np.resize(self._alive, self._indptr.size)
+
+    def _tombstone(self, key: Hashable) -> None:
+        row = self._live.pop(key)
+        self._keys[row] = None
+        self._alive[row] = False
+
+    def _compact(self) -> None:
+        """Rewrite the arrays with live rows only."""
+        rows = list(self._live.items())
+        lengths = np.array([self._indptr[r + 1] - self._indptr[r] for _, r in rows], dtype=np.int64)
+        take = np.concatenate([np.arange(self._indptr[r], self._indptr[r + 1]) for _, r in rows]) if rows else np.zeros(0, dtype=np.int64)
+        self._indices = np.resize(self._indices[take], max(1024, take.size * 2))
+        self._values = np.resize(self._values[take], max(1024, take.size * 2))
+        self._nnz = int(take.size)
+        self._indptr = np.zeros(max(257, len(rows) * 2 + 1), dtype=np.int64)
+        self._indptr[1:len(rows) + 1] = np.cumsum(lengths)
+        self._alive = np.zeros(self._indptr.size, dtype=bool)
+        self._alive[:len(rows)] = True
+        self._keys = [key for key, _ in rows]
+        self._live = OrderedDict((key, i) for i, (key, _) in enumerate(rows))
+
+    def add(self, key: Hashable, vector: Dict[int, float], normalize: bool = True) -> None:
+        """
+        Add or replace the row for `key`.
+
+        Args:
+            key: Row identifier
+            vector: Column index -> value (non-positive values are dropped)
+            normalize: Store the row L2-normalized (leave False when querying with column weights)
+        """
+        items = sorted((int(c), float(v)) for c, v in vector.items() if v > 0)
+        if not items:
+            return
+        columns = np.fromiter((c for c, _ in items), dtype=np.int32, count=len(items))
+        values = np.fromiter((v for _, v in items), dtype=np.float32, count=len(items))
+        if normalize:
+            values /= np.linalg.norm(values)
+        with self._lock:
+            if key in self._live:
+                self._tombstone(key)
+            self._reserve(len(items))
+            row = len(self._keys)
+            self._indices[self._nnz:self._nnz + len(items)] = columns
+            self._values[self._nnz:self._nnz + len(items)] = values
+            self._nnz += len(items)
+            self._indptr[row + 1] = self._nnz
+            self._keys.append(key)
+            self._alive[row] = True
+            self._live[key] = row
+            self.n_columns = max(self.n_columns, int(columns[-1]) + 1)
+            while len(self._live) > self.max_rows:
+                self._tombstone(next(iter(self._live)))
+            if len(self._keys) > 2 * len(self._live) + 64:
+                self._compact()
+
+    def remove(self, key: Hashable) -> bool:
+        """Drop the row for `key`. Returns False if it isn't indexed."""
+        with self._lock:
+            if key not in self._live:
+                return False
+            self._tombstone(key)
+            if len(self._keys) > 2 * len(self._live) + 64:
+                self._compact()
+            return True
+
+    def get(self, key: Hashable) -> Optional[Dict[int, float]]:
+        """The stored row for `key` as column -> value, or None."""
+        with self._lock:
+            row = self._live.get(key)
+            if row is None:
+                return None
+            start, end = self._indptr[row], self._indptr[row + 1]
+            return dict(zip(self._indices[start:end].tolist(), self._values[start:end].tolist()))
+
+    # Queries
+
+    def query(
+        self,
+        vector: Dict[int, float],
+        k: int = 10,
+        exclude: Optional[Hashable] = None,
+        column_weights: Optional[np.ndarray] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Top-k rows by cosine similarity to `vector`.
+
+        Args:
+            vector: Column index -> value
+            k: Neighbours returned
+            exclude: Key to leave out (typically the query's own row)
+            column_weights: Per-column weights applied to rows and query (e.g. IDF)
+
+        Returns:
+            [(key, similarity), ...] best first, only rows with similarity > 0
+        """
+        with self._lock:
+            n_rows = len(self._keys)
+            if not n_rows or not vector:
+                return []
+            indices = self._indices[:self._nnz]
+            values = self._values[:self._nnz]
+            starts = self._indptr[:n_rows]
+            n_columns = max(self.n_columns, max(vector) + 1)
+            weights = None
+            if column_weights is not None:
+                weights = np.ones(n_columns, dtype=np.float32)
+                weights[:min(n_columns, column_weights.size)] = column_weights[:n_columns]
+                values = values * weights[indices]
+
+            dense = np.zeros(n_columns, dtype=np.float32)
+            for column, value in vector.items():
+                dense[column] = value
+            if weights is not None:
+                dense *= weights
+            norm = np.linalg.norm(dense)
+            if norm == 0:
+                return []
+            dense /= norm
+
+            # Sparse (rows x columns) @ dense query: per-row sums of value * query[column]
+            scores = np.add.reduceat(values * dense[indices], starts)
+            if weights is not None:
+                row_norms = np.sqrt(np.add.reduceat(values * values, starts))
+                np.divide(scores, row_norms, out=scores, where=row_norms > 0)
+            scores = np.where(self._alive[:n_rows], scores, -np.inf)
+            if exclude in self._live:
+                scores[self._live[exclude]] = -np.inf
+
+            k = min(k, n_rows)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(self._keys[i], round(float(scores[i]), 4)) for i in top if scores[i] > 0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._live
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._live)
+
+    def keys(self) -> List[Hashable]:
+        """Live keys, oldest first."""
+        with self._lock:
+            return list(self._live)
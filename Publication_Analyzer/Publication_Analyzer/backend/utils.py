@@ -2,6 +2,7 @@
 Utility functions for the Publication Analyzer application.
 """
 import re
+import unicodedata
 from typing import Optional
 
 
@@ -199,3 +200,104 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
         return text
     
     return text[:max_length - len(suffix)] + suffix
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """
+    Normalize a person or institution name for matching.
+    
+    Lowercases, strips accents and punctuation, and collapses whitespace.
+    
+    Args:
+        text: Raw name
+        
+    Returns:
+        Normalized name ("" for empty input)
+    """
+    if not text:
+        return ""
+    
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return " ".join(text.split())
+
+
+def normalize_query(text: Optional[str]) -> str:
+    """
+    Normalize a search query into a cache key.
+
+    Lowercases, collapses whitespace and sorts the words, so queries that differ
+    only in case, spacing or word order share a key. Punctuation is kept
+    ("C++" and "C" are different topics).
+
+    Args:
+        text: Raw query
+
+    Returns:
+        Normalized query ("" for empty input)
+    """
+    if not text:
+        return ""
+
+    return " ".join(sorted(text.lower().split()))
+
+
+def affiliations_match(first: Optional[str], second: Optional[str]) -> bool:
+    """
+    Check whether two affiliations may refer to the same institution.
+    
+    One normalized name must appear in the other as a run of whole words
+    (e.g. "MIT CSAIL, MIT" and "MIT", but not "UCLA" and "UCL"). An unknown
+    affiliation matches nothing, so namesakes without one are never merged.
+    """
+    first, second = normalize_name(first), normalize_name(second)
+    if not first or not second:
+        return False
+    first, second = f" {first} ", f" {second} "
+    return first in second or second in first
+
+
+def merge_author_results(*result_lists: list[dict]) -> list[dict]:
+    """
+    Merge author search results from several sources, dropping cross-source duplicates.
+    
+    Results are the same person when their normalized display names are equal and
+    their institutions are known and match. Earlier lists take precedence; empty fields are filled
+    from later duplicates, and every source's id is kept under "alternate_ids".
+    
+    Args:
+        result_lists: Search results per source, each with display_name, institution, id and source
+        
+    Returns:
+        Merged results in first-seen order
+    """
+    merged = []
+    by_name: dict[str, list[dict]] = {}
+    
+    for results in result_lists:
+        for result in results:
+            source = result.get("source")
+            key = normalize_name(result.get("display_name"))
+            match = next(
+                (
+                    entry for entry in by_name.get(key, [])
+                    if source not in entry["alternate_ids"]
+                    and affiliations_match(entry.get("institution"), result.get("institution"))
+                ),
+                None,
+            ) if key else None
+            
+            if match is None:
+                entry = dict(result)
+                entry["alternate_ids"] = {source: result.get("id")}
+                merged.append(entry)
+                by_name.setdefault(key, []).append(entry)
+                continue
+            
+            for field, value in result.items():
+                if match.get(field) in (None, "", []) and value not in (None, "", []):
+                    match[field] = value
+            match["alternate_ids"][source] = result.get("id")
+    
+    return merged
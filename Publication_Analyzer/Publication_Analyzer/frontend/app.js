@@ -27,6 +27,10 @@ const emptyWorks = document.getElementById("emptyWorks");
 const fingerprintSection = document.getElementById("fingerprintSection");
 const fingerprintLoading = document.getElementById("fingerprintLoading");
 const fingerprintChart = document.getElementById("fingerprintChart");
+const trajectoryLoading = document.getElementById("trajectoryLoading");
+const trajectoryChart = document.getElementById("trajectoryChart");
+const trajectorySummary = document.getElementById("trajectorySummary");
+const similarList = document.getElementById("similarList");
 const downloadPdfBtn = document.getElementById("downloadPdfBtn");
 const backToResults = document.getElementById("backToResults");
 const summaryModal = document.getElementById("summaryModal");
@@ -56,6 +60,7 @@ const rankYearFrom = document.getElementById("rankYearFrom");
 const rankYearTo = document.getElementById("rankYearTo");
 
 let currentChatWorkId = null;
+let currentChatSessionId = null;
 
 let currentAuthorId = null;
 let currentAuthorData = null;
@@ -63,6 +68,7 @@ let worksPage = 1;
 let worksTotal = 0;
 const perPage = 25;
 let fingerprintChartInstance = null;
+let trajectoryChartInstance = null;
 
 function getTheme() {
   return localStorage.getItem(STORAGE_THEME) || "light";
@@ -387,6 +393,107 @@ async function loadResearchFingerprint(authorId) {
   }
 }
 
+async function loadCitationTrajectory(authorId) {
+  if (!authorId) return;
+  
+  trajectoryLoading.textContent = "Analyzing citation history...";
+  trajectoryLoading.classList.remove("hidden");
+  
+  try {
+    const response = await fetch(`${API_BASE}/api/author/${encodeURIComponent(authorId)}/citation-trajectory`);
+    if (!response.ok) throw new Error("Failed to fetch citation trajectory");
+    
+    const data = await response.json();
+    trajectoryLoading.classList.add("hidden");
+    
+    const h = data.h_index || {};
+    const v = data.velocity || {};
+    const parts = [
+      `h-index ${h.all_time ?? "—"} (last 5 years: ${h.last_5_years ?? "—"}, last 10: ${h.last_10_years ?? "—"})`,
+      `${v.avg_last_3_years ?? "—"} citations/year over the last 3 years`,
+    ];
+    if (v.trend_per_year != null) {
+      parts.push(`trend ${v.trend_per_year >= 0 ? "+" : ""}${v.trend_per_year}/year`);
+    }
+    trajectorySummary.textContent = parts.join(" · ");
+    
+    if (trajectoryChartInstance) {
+      trajectoryChartInstance.destroy();
+    }
+    
+    const labels = data.years.map(y => (y === data.partial_year ? `${y}*` : String(y)));
+    trajectoryChartInstance = new Chart(trajectoryChart.getContext("2d"), {
+      type: "bar",
+      data: {
+        labels,
+        datasets: [{
+          label: "Citations",
+          data: data.citations,
+          backgroundColor: "#6366f1",
+          borderRadius: 6,
+        }]
+      },
+      options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        plugins: {
+          legend: { display: false },
+          tooltip: {
+            callbacks: {
+              afterLabel: (context) => {
+                const growth = data.yoy_growth[context.dataIndex];
+                return growth == null ? "" : `Year over year: ${(growth * 100).toFixed(1)}%`;
+              }
+            }
+          }
+        },
+        scales: { y: { beginAtZero: true } }
+      }
+    });
+  } catch (e) {
+    trajectoryLoading.textContent = "Unable to load citation trajectory";
+    console.error("Citation trajectory error:", e);
+  }
+}
+
+async function loadSimilarAuthors(authorId) {
+  if (!authorId) return;
+  similarList.innerHTML = `<p class="fingerprint-loading">Finding similar researchers...</p>`;
+  
+  try {
+    const response = await fetch(`${API_BASE}/api/author/${encodeURIComponent(authorId)}/similar?k=8`);
+    if (response.status === 422) {
+      similarList.innerHTML = `<p class="fingerprint-loading">This profile has no research topics to compare yet.</p>`;
+      return;
+    }
+    if (!response.ok) throw new Error("Failed to fetch similar researchers");
+    const data = await response.json();
+    
+    if (!data.similar.length) {
+      similarList.innerHTML = `<p class="fingerprint-loading">No similar researchers found yet — more appear as profiles are searched and analyzed.</p>`;
+      return;
+    }
+    similarList.innerHTML = data.similar
+      .map(
+        (a) => `
+      <button type="button" class="similar-item" data-author-id="${escapeHtml(a.id)}">
+        <span class="similar-name">${escapeHtml(a.display_name || a.id)}</span>
+        ${a.institution ? `<span class="similar-institution">${escapeHtml(a.institution)}</span>` : ""}
+        <span class="similar-score">${Math.round(a.similarity * 100)}% similar</span>
+        ${a.shared_topics.length ? `<span class="similar-topics">${a.shared_topics.slice(0, 3).map(t => `<span class="interest-tag">${escapeHtml(t)}</span>`).join("")}</span>` : ""}
+      </button>
+    `
+      )
+      .join("");
+    similarList.querySelectorAll(".similar-item").forEach((item) => {
+      item.addEventListener("click", () => openProfile(item.dataset.authorId));
+    });
+  } catch (e) {
+    similarList.innerHTML = `<p class="fingerprint-loading">Unable to load similar researchers</p>`;
+    console.error("Similar researchers error:", e);
+  }
+}
+
 async function doSearch() {
   const q = searchInput.value.trim();
   if (q.length < 2) return;
@@ -397,7 +504,7 @@ async function doSearch() {
   resultsTitle.textContent = `Researchers matching "${q}"`;
 
   try {
-    const r = await fetch(`${API_BASE}/api/search?q=${encodeURIComponent(q)}`);
+    const r = await fetch(`${API_BASE}/api/search?q=${encodeURIComponent(q)}&progressive=true`);
     if (!r.ok) throw new Error("Search failed");
     const data = await r.json();
     setLoading(resultsList, resultsLoading, false);
@@ -406,74 +513,8 @@ async function doSearch() {
       return;
     }
     
-    // Show source indicator
-    if (data.source) {
-      const sourceIndicator = document.createElement("div");
-      sourceIndicator.className = "search-source-indicator";
-      sourceIndicator.textContent = `Results from ${data.source}`;
-      resultsList.appendChild(sourceIndicator);
-    }
-    
-    data.results.forEach((author) => {
-      const card = document.createElement("div");
-      card.className = "author-card-wrap";
-      
-      // Build metadata
-      const meta = [
-        author.works_count != null && `${author.works_count} papers`,
-        author.cited_by_count != null && author.cited_by_count > 0 && `${author.cited_by_count} citations`,
-        author.h_index != null && `h-index ${author.h_index}`,
-        author.i10_index != null && `i10-index ${author.i10_index}`,
-        author.institution,
-      ].filter(Boolean);
-      
-      const saved = isAuthorSaved(author.id);
-      
-      // Build interests HTML
-      let interestsHtml = "";
-      if (author.interests && author.interests.length > 0) {
-        interestsHtml = `<div class="author-card-interests">${author.interests.slice(0, 5).map(i => `<span class="interest-tag">${escapeHtml(i)}</span>`).join("")}</div>`;
-      }
-      
-      // Build photo HTML
-      let photoHtml = "";
-      if (author.photo_url) {
-        photoHtml = `<img src="${escapeHtml(author.photo_url)}" alt="${escapeHtml(author.display_name)}" class="author-card-photo" onerror="this.style.display='none'">`;
-      } else {
-        photoHtml = `<div class="author-card-photo-placeholder">${escapeHtml(author.display_name.charAt(0).toUpperCase())}</div>`;
-      }
-      
-      // Build email HTML
-      let emailHtml = "";
-      if (author.email) {
-        emailHtml = `<div class="author-card-email">✉ ${escapeHtml(author.email)}</div>`;
-      }
-      
-      card.innerHTML = `
-        <button type="button" class="btn-view-profile" data-author-id="${escapeHtml(author.id)}" title="View profile">View profile</button>
-        <button type="button" class="author-card" data-id="${escapeHtml(author.id)}">
-          ${photoHtml}
-          <div class="author-card-content">
-            <span class="author-card-name">${escapeHtml(author.display_name)}</span>
-            <div class="author-card-meta">${escapeHtml(meta.join(" · "))}</div>
-            ${emailHtml}
-            ${interestsHtml}
-          </div>
-        </button>
-        <button type="button" class="btn-save btn-save-author ${saved ? "saved" : ""}" data-save-author-id="${escapeHtml(author.id)}" title="${saved ? "Remove from saved" : "Save author"}">${saved ? "Saved" : "Save"}</button>
-      `;
-      card.querySelector(".btn-view-profile").addEventListener("click", (e) => {
-        e.stopPropagation();
-        openProfile(author.id);
-      });
-      card.querySelector(".author-card").addEventListener("click", () => openProfile(author.id));
-      card.querySelector(".btn-save-author").addEventListener("click", (e) => {
-        e.stopPropagation();
-        if (isAuthorSaved(author.id)) removeSavedAuthor(author.id);
-        else saveAuthor(author);
-      });
-      resultsList.appendChild(card);
-    });
+    renderSearchResults(data);
+    if (data.enrichment_id) pollSearchEnrichment(data.enrichment_id, q);
   } catch (e) {
     setLoading(resultsList, resultsLoading, false);
     emptyState.classList.remove("hidden");
@@ -481,6 +522,98 @@ async function doSearch() {
   }
 }
 
+function renderSearchResults(data) {
+  resultsList.innerHTML = "";
+  // Show source indicator
+  if (data.source) {
+    const sourceIndicator = document.createElement("div");
+    sourceIndicator.className = "search-source-indicator";
+    sourceIndicator.textContent = `Results from ${data.source}`;
+    resultsList.appendChild(sourceIndicator);
+  }
+  
+  data.results.forEach((author) => {
+    const card = document.createElement("div");
+    card.className = "author-card-wrap";
+    
+    // Build metadata
+    const meta = [
+      author.works_count != null && `${author.works_count} papers`,
+      author.cited_by_count != null && author.cited_by_count > 0 && `${author.cited_by_count} citations`,
+      author.h_index != null && `h-index ${author.h_index}`,
+      author.i10_index != null && `i10-index ${author.i10_index}`,
+      author.institution,
+    ].filter(Boolean);
+    
+    const saved = isAuthorSaved(author.id);
+    
+    // Build interests HTML
+    let interestsHtml = "";
+    if (author.interests && author.interests.length > 0) {
+      interestsHtml = `<div class="author-card-interests">${author.interests.slice(0, 5).map(i => `<span class="interest-tag">${escapeHtml(i)}</span>`).join("")}</div>`;
+    }
+    
+    // Build photo HTML
+    let photoHtml = "";
+    if (author.photo_url) {
+      photoHtml = `<img src="${escapeHtml(author.photo_url)}" alt="${escapeHtml(author.display_name)}" class="author-card-photo" onerror="this.style.display='none'">`;
+    } else {
+      photoHtml = `<div class="author-card-photo-placeholder">${escapeHtml(author.display_name.charAt(0).toUpperCase())}</div>`;
+    }
+    
+    // Build email HTML
+    let emailHtml = "";
+    if (author.email) {
+      emailHtml = `<div class="author-card-email">✉ ${escapeHtml(author.email)}</div>`;
+    }
+    
+    card.innerHTML = `
+      <button type="button" class="btn-view-profile" data-author-id="${escapeHtml(author.id)}" title="View profile">View profile</button>
+      <button type="button" class="author-card" data-id="${escapeHtml(author.id)}">
+        ${photoHtml}
+        <div class="author-card-content">
+          <span class="author-card-name">${escapeHtml(author.display_name)}</span>
+          <div class="author-card-meta">${escapeHtml(meta.join(" · "))}</div>
+          ${emailHtml}
+          ${interestsHtml}
+        </div>
+      </button>
+      <button type="button" class="btn-save btn-save-author ${saved ? "saved" : ""}" data-save-author-id="${escapeHtml(author.id)}" title="${saved ? "Remove from saved" : "Save author"}">${saved ? "Saved" : "Save"}</button>
+    `;
+    card.querySelector(".btn-view-profile").addEventListener("click", (e) => {
+      e.stopPropagation();
+      openProfile(author.id);
+    });
+    card.querySelector(".author-card").addEventListener("click", () => openProfile(author.id));
+    card.querySelector(".btn-save-author").addEventListener("click", (e) => {
+      e.stopPropagation();
+      if (isAuthorSaved(author.id)) removeSavedAuthor(author.id);
+      else saveAuthor(author);
+    });
+    resultsList.appendChild(card);
+  });
+}
+
+// Progressive search: Scholar hits are shown first, then replaced once their profiles are filled
+async function pollSearchEnrichment(enrichmentId, q) {
+  for (let attempt = 0; attempt < 20; attempt++) {
+    await new Promise((resolve) => setTimeout(resolve, 1500));
+    if (searchInput.value.trim() !== q) return; // A newer search replaced these results
+    try {
+      const r = await fetch(`${API_BASE}/api/search/enrichment/${encodeURIComponent(enrichmentId)}`);
+      if (!r.ok) return;
+      const data = await r.json();
+      if (data.status === "pending") continue;
+      if (data.status === "done" && data.results && data.results.length) {
+        renderSearchResults({ results: data.results, source: data.source });
+      }
+      return;
+    } catch (e) {
+      return;
+    }
+  }
+}
+
 function escapeHtml(s) {
   const div = document.createElement("div");
   div.textContent = s;
@@ -575,6 +708,10 @@ async function openProfile(authorId) {
     const author = await authorRes.json();
     const worksData = await worksRes.json();
     worksTotal = worksData.meta?.count ?? 0;
+    // Scholar profiles are served without publications; the works request fills them
+    if (author.works_count == null && author.source === "Google Scholar" && !isQualityRank && !yearFrom && !yearTo && !minCit) {
+      author.works_count = worksTotal;
+    }
     currentAuthorData = {
       id: author.id,
       display_name: author.display_name,
@@ -664,6 +801,8 @@ async function openProfile(authorId) {
     }
 
     loadResearchFingerprint(authorId);
+    loadCitationTrajectory(authorId);
+    loadSimilarAuthors(authorId);
 
     setLoading(worksList, worksLoading, false);
     appendWorks(worksData.results, isQualityRank);
@@ -912,6 +1051,7 @@ function appendWorks(works, isRanked = false) {
 
 function openSummaryModal(workId, title) {
   currentChatWorkId = workId;
+  currentChatSessionId = null;
   summaryModal.classList.remove("hidden");
   summaryModal.setAttribute("aria-hidden", "false");
   summaryModalLoading.classList.remove("hidden");
@@ -939,11 +1079,14 @@ function openSummaryModal(workId, title) {
     .then(({ ok, data }) => {
       summaryModalLoading.classList.add("hidden");
       if (ok) {
+        currentChatSessionId = data.session_id || null;
         summaryModalContent.innerHTML = `
           <p class="modal-summary-title">${escapeHtml(data.title || title)}</p>
           <div class="modal-summary">${formatSummaryForDisplay(data.summary || "")}</div>
+          <div class="related-works hidden" id="relatedWorks"></div>
         `;
         summaryModalContentWrap.classList.remove("hidden");
+        loadRelatedWorks(workId);
       } else {
         const msg = Array.isArray(data.detail) ? data.detail.map((o) => o.msg || o).join(" ") : (data.detail || data.message || "Failed to generate summary.");
         summaryModalError.textContent = msg;
@@ -957,6 +1100,30 @@ function openSummaryModal(workId, title) {
     });
 }
 
+async function loadRelatedWorks(workId) {
+  const container = document.getElementById("relatedWorks");
+  if (!container) return;
+  try {
+    const r = await fetch(`${API_BASE}/api/works/${encodeURIComponent(workId)}/related?k=5`);
+    if (!r.ok) return; // Not indexed yet: nothing to show
+    const data = await r.json();
+    if (currentChatWorkId !== workId || !data.related.length) return;
+    container.innerHTML = `
+      <p class="related-works-title">Related papers</p>
+      <ul class="related-works-list">
+        ${data.related
+          .map(
+            (w) => `<li>${escapeHtml(w.title || "Untitled")}${w.publication_year ? ` <span class="related-works-meta">(${escapeHtml(String(w.publication_year))}${w.venue ? `, ${escapeHtml(w.venue)}` : ""})</span>` : ""}</li>`
+          )
+          .join("")}
+      </ul>
+    `;
+    container.classList.remove("hidden");
+  } catch (e) {
+    console.error("Related works error:", e);
+  }
+}
+
 function closeSummaryModal() {
   summaryModal.classList.add("hidden");
   summaryModal.setAttribute("aria-hidden", "true");
@@ -992,7 +1159,7 @@ function sendChatMessage() {
   fetch(`${API_BASE}/api/chat`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
-    body: JSON.stringify({ work_id: currentChatWorkId, message: text }),
+    body: JSON.stringify({ work_id: currentChatWorkId, session_id: currentChatSessionId, message: text }),
   })
     .then(async (r) => {
       let data;
@@ -1006,6 +1173,7 @@ function sendChatMessage() {
     .then(({ ok, data }) => {
       chatSendBtn.disabled = false;
       if (ok) {
+        currentChatSessionId = data.session_id || null;
         updateLastChatAnswer(data.answer || "No response.");
       } else {
         const msg = Array.isArray(data.detail) ? data.detail.map((o) => o.msg || o).join(" ") : (data.detail || data.message || "Failed to get answer.");
@@ -1151,6 +1319,7 @@ function openCompareModal() {
   let lastCompareAssessment = null;
   let lastCompareAuthor1Id = null;
   let lastCompareAuthor2Id = null;
+  let lastCompareSessionId = null;
 
   faculty1Label.textContent = "— Select —";
   faculty2Label.textContent = "— Select —";
@@ -1264,6 +1433,7 @@ function openCompareModal() {
         lastCompareAssessment = data.assessment;
         lastCompareAuthor1Id = faculty1.id;
         lastCompareAuthor2Id = faculty2.id;
+        lastCompareSessionId = data.session_id || null;
         const a1 = data.author_1;
         const a2 = data.author_2;
         compareGrid.innerHTML = `
@@ -1371,35 +1541,43 @@ function openCompareModal() {
     compareChatMessages.scrollTop = compareChatMessages.scrollHeight;
   }
 
+  function postCompareChat(text, withContext) {
+    // With a live session the server already holds the assessment; only resend it when starting over
+    const payload = { session_id: lastCompareSessionId, message: text };
+    if (withContext || !lastCompareSessionId) {
+      payload.author_id_1 = lastCompareAuthor1Id;
+      payload.author_id_2 = lastCompareAuthor2Id;
+      payload.assessment = lastCompareAssessment;
+    }
+    return fetch(`${API_BASE}/api/chat-compare`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(payload),
+    }).then(async (r) => {
+      if (r.status === 404 && !withContext) return postCompareChat(text, true);
+      let data;
+      try {
+        data = await r.json();
+      } catch (_) {
+        data = { detail: r.statusText || "Request failed" };
+      }
+      return { ok: r.ok, data };
+    });
+  }
+
   function sendCompareChat() {
     const text = (compareChatInput.value || "").trim();
     if (!text || !lastCompareAssessment) return;
     compareChatInput.value = "";
     appendCompareChatMessage(text, "", true);
     compareChatSend.disabled = true;
-    fetch(`${API_BASE}/api/chat-compare`, {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({
-        author_id_1: lastCompareAuthor1Id,
-        author_id_2: lastCompareAuthor2Id,
-        assessment: lastCompareAssessment,
-        message: text,
-      }),
-    })
-      .then(async (r) => {
-        let data;
-        try {
-          data = await r.json();
-        } catch (_) {
-          data = { detail: r.statusText || "Request failed" };
-        }
-        return { ok: r.ok, data };
-      })
+    postCompareChat(text, false)
       .then(({ ok, data }) => {
         compareChatSend.disabled = false;
-        if (ok) updateLastCompareChatAnswer(data.answer || "No response.");
-        else updateLastCompareChatAnswer("Error: " + (data.detail || data.message || "Failed."));
+        if (ok) {
+          lastCompareSessionId = data.session_id || lastCompareSessionId;
+          updateLastCompareChatAnswer(data.answer || "No response.");
+        } else updateLastCompareChatAnswer("Error: " + (data.detail || data.message || "Failed."));
       })
       .catch((err) => {
         compareChatSend.disabled = false;
@@ -1482,34 +1660,70 @@ document.getElementById("batchRunBtn").addEventListener("click", async () => {
   if (selectionEl) selectionEl.classList.add("hidden");
   
   try {
-    const r = await fetch(`${API_BASE}/api/batch-faculty`, {
+    const roster = document.getElementById("batchRosterInput").value.trim() || null;
+    const r = await fetch(`${API_BASE}/api/batch-faculty?stream=true`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ names }),
+      body: JSON.stringify({ names, roster }),
+    });
+    if (!r.ok) {
+      const data = await r.json().catch(() => ({}));
+      throw new Error(data.detail || "Request failed");
+    }
+    
+    // Rows arrive as each name resolves; keep them in the order the names were entered
+    const rowsByIndex = [];
+    const selectionsByIndex = [];
+    let resolved = 0;
+    await readNdjson(r, (line) => {
+      if (line.type === "result") rowsByIndex[line.index] = line.result;
+      else if (line.type === "needs_selection") selectionsByIndex[line.index] = line.needs_selection;
+      else return;
+      resolved += 1;
+      loadingEl.textContent = `Looking up faculty… ${resolved}/${names.length}`;
+      lastBatchResults = rowsByIndex.filter(Boolean);
+      displayBatchResults(lastBatchResults);
+      resultEl.classList.remove("hidden");
     });
-    const data = await r.json();
     loadingEl.classList.add("hidden");
-    if (!r.ok) throw new Error(data.detail || "Request failed");
+    loadingEl.textContent = "Looking up faculty…";
     
     // Check if there are names that need selection
-    if (data.needs_selection && data.needs_selection.length > 0) {
-      pendingSelections = data.needs_selection;
-      lastBatchResults = data.results || [];
-      showBatchSelectionUI(data.needs_selection, data.results);
+    const needsSelection = selectionsByIndex.filter(Boolean);
+    lastBatchResults = rowsByIndex.filter(Boolean);
+    if (needsSelection.length > 0) {
+      pendingSelections = needsSelection;
+      showBatchSelectionUI(needsSelection, lastBatchResults, roster);
       return;
     }
     
-    lastBatchResults = data.results || [];
     displayBatchResults(lastBatchResults);
     resultEl.classList.remove("hidden");
   } catch (e) {
     loadingEl.classList.add("hidden");
+    loadingEl.textContent = "Looking up faculty…";
     errorEl.textContent = e.message || "Request failed.";
     errorEl.classList.remove("hidden");
   }
 });
 
-function showBatchSelectionUI(needsSelection, confirmedResults) {
+/** Read an NDJSON response body, calling onLine with each parsed line as it arrives. */
+async function readNdjson(response, onLine) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffered += decoder.decode(value || new Uint8Array(), { stream: !done });
+    const lines = buffered.split("\n");
+    buffered = lines.pop();
+    lines.filter((l) => l.trim()).forEach((l) => onLine(JSON.parse(l)));
+    if (done) break;
+  }
+  if (buffered.trim()) onLine(JSON.parse(buffered));
+}
+
+function showBatchSelectionUI(needsSelection, confirmedResults, roster) {
   console.log("needsSelection:", needsSelection); // Debug log
   
   const selectionEl = document.getElementById("batchSelection");
@@ -1596,6 +1810,13 @@ function showBatchSelectionUI(needsSelection, confirmedResults) {
     
     lastBatchResults = [...confirmedResults, ...selectedResults];
     displayBatchResults(lastBatchResults);
+    
+    // Remember the choices so the next run of this roster doesn't ask again
+    fetch(`${API_BASE}/api/batch-faculty/selections`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ roster, selections: selectedResults }),
+    }).catch(() => {});
     selectionContainer.classList.add("hidden");
     document.getElementById("batchResult").classList.remove("hidden");
   });
@@ -1640,44 +1861,18 @@ async function handleCsvUpload(file) {
   if (!file) return;
   
   try {
-    let facultyNames = [];
-    
     // Check file type
     const fileName = file.name.toLowerCase();
     
-    if (fileName.endsWith('.csv') || fileName.endsWith('.txt')) {
-      // Handle CSV/TXT files
-      const text = await file.text();
-      const lines = text.trim().split(/\r?\n/).filter(l => l.trim());
-      
-      // Try to parse CSV (handle comma-separated values)
-      facultyNames = lines.map(line => {
-        // Split by comma and take first column
-        const parts = line.split(',');
-        return parts[0].trim();
-      }).filter(name => name && !name.toLowerCase().includes('name') && !name.toLowerCase().includes('faculty'));
-      
-    } else if (fileName.endsWith('.xlsx') || fileName.endsWith('.xls')) {
+    if (fileName.endsWith('.xlsx') || fileName.endsWith('.xls')) {
       // For Excel files, show instructions
       alert("Excel files are not directly supported. Please:\n\n1. Open your Excel file\n2. Copy the column with faculty names\n3. Paste it into a text editor (Notepad)\n4. Save as .txt or .csv file\n5. Upload that file\n\nOR\n\nIn Excel: File → Save As → Choose 'CSV (Comma delimited)' format");
       return;
-    } else {
+    } else if (!fileName.endsWith('.csv') && !fileName.endsWith('.txt')) {
       alert("Please upload a CSV or TXT file with faculty names (one per line).");
       return;
     }
     
-    if (facultyNames.length === 0) {
-      alert("No faculty names found in file. Make sure each name is on a separate line.");
-      return;
-    }
-    
-    if (facultyNames.length > 100) {
-      alert(`Found ${facultyNames.length} names. Maximum 100 allowed. Only the first 100 will be analyzed.`);
-      facultyNames = facultyNames.slice(0, 100);
-    }
-    
-    console.log("Found faculty names:", facultyNames); // Debug
-    
     const dashboardLoading = document.getElementById("dashboardLoading");
     const statsGrid = document.getElementById("statsGrid");
     
@@ -1685,12 +1880,13 @@ async function handleCsvUpload(file) {
     statsGrid.classList.add("hidden");
     dashboardStats.classList.remove("hidden");
     
-    console.log("Analyzing", facultyNames.length, "faculty members..."); // Debug
-    
-    const response = await fetch(`${API_BASE}/api/batch-faculty-analysis`, {
+    // The server parses the roster (header, name column, duplicates) and streams results
+    const form = new FormData();
+    form.append("file", file);
+    form.append("kind", "batch-faculty-analysis");
+    const response = await fetch(`${API_BASE}/api/batch-faculty/upload`, {
       method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ faculty_names: facultyNames }),
+      body: form,
     });
     
     console.log("Response status:", response.status); // Debug
@@ -1700,12 +1896,47 @@ async function handleCsvUpload(file) {
       throw new Error(errorData.detail || `Error: ${response.statusText}`);
     }
     
-    const data = await response.json();
-    console.log("Received data:", data); // Debug
+    // Faculty cards fill in as each name is analyzed (re-rendered at most once per frame);
+    // aggregates and roster counts come with the last line
+    const data = { faculty: [], department_stats: null };
+    const facultyByIndex = [];
+    let roster = null;
+    let analyzed = 0;
+    let renderQueued = false;
+    const render = () => {
+      renderQueued = false;
+      data.faculty = facultyByIndex.filter(Boolean);
+      populateDashboardStats(data);
+      statsGrid.classList.remove("hidden");
+    };
+    await readNdjson(response, (line) => {
+      if (line.type === "faculty") {
+        facultyByIndex[line.index] = line.faculty;
+        analyzed += 1;
+        dashboardLoading.textContent = `Analyzing department... ${analyzed} analyzed`;
+      } else if (line.type === "summary") {
+        data.department_stats = line.department_stats;
+        roster = line.roster;
+      } else {
+        return;
+      }
+      if (!renderQueued) {
+        renderQueued = true;
+        requestAnimationFrame(render);
+      }
+    });
+    render();
+    console.log("Received data:", data, roster); // Debug
     
     dashboardLoading.classList.add("hidden");
-    populateDashboardStats(data);
-    statsGrid.classList.remove("hidden");
+    dashboardLoading.textContent = "Analyzing department...";
+    if (!data.department_stats) throw new Error("Analysis stopped before it finished");
+    if (roster && roster.names === 0) {
+      alert("No faculty names found in file. Make sure each name is on a separate line.");
+      dashboardStats.classList.add("hidden");
+    } else if (roster && roster.truncated) {
+      alert(`Only the first ${roster.names} distinct names were analyzed.`);
+    }
     
   } catch (e) {
     console.error("CSV upload error:", e); // Debug
@@ -1719,8 +1950,13 @@ let lastDashboardData = null;
 
 function populateDashboardStats(data) {
   lastDashboardData = data; // Store for export
-  const stats = data.department_stats;
   const statsGrid = document.getElementById("statsGrid");
+  // Department aggregates arrive last when streaming; show placeholders until then
+  const stats = data.department_stats || {
+    faculty_found: "…", total_faculty: "…", total_publications: "…", total_citations: "…",
+    avg_publications: null, avg_citations: null, avg_h_index: null,
+  };
+  const fixed1 = (v) => (v == null ? "…" : v.toFixed(1));
   
   let html = `
     <div class="stat-card">
@@ -1736,19 +1972,34 @@ function populateDashboardStats(data) {
       <div class="stat-label">Total Citations</div>
     </div>
     <div class="stat-card">
-      <div class="stat-value">${stats.avg_publications.toFixed(1)}</div>
+      <div class="stat-value">${fixed1(stats.avg_publications)}</div>
       <div class="stat-label">Avg Publications/Faculty</div>
     </div>
     <div class="stat-card">
-      <div class="stat-value">${stats.avg_citations.toFixed(1)}</div>
+      <div class="stat-value">${fixed1(stats.avg_citations)}</div>
       <div class="stat-label">Avg Citations/Faculty</div>
     </div>
     <div class="stat-card">
-      <div class="stat-value">${stats.avg_h_index.toFixed(1)}</div>
+      <div class="stat-value">${fixed1(stats.avg_h_index)}</div>
       <div class="stat-label">Avg h-index</div>
     </div>
   `;
   
+  // Medians and spread (estimated server-side as rows stream in)
+  const dist = stats.distributions;
+  if (dist) {
+    const percentileCard = (d, label) => `
+      <div class="stat-card">
+        <div class="stat-value">${fixed1(d.median)}</div>
+        <div class="stat-label">Median ${label}</div>
+        <div style="font-size: 0.8em; color: var(--text-secondary); margin-top: 5px;">
+          IQR ${fixed1(d.p25)}–${fixed1(d.p75)} · p90 ${fixed1(d.p90)}
+        </div>
+      </div>
+    `;
+    html += percentileCard(dist.h_index, "h-index") + percentileCard(dist.citations, "Citations") + percentileCard(dist.works, "Publications");
+  }
+  
   // Add faculty detail cards
   if (data.faculty && data.faculty.length > 0) {
     html += `<div style="grid-column: 1/-1; margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--border);"><h3 style="margin: 0 0 15px 0;">Faculty Details</h3></div>`;
@@ -1780,6 +2031,38 @@ searchBtn.addEventListener("click", doSearch);
 searchInput.addEventListener("keydown", (e) => {
   if (e.key === "Enter") doSearch();
 });
+
+// Typeahead: suggestions from /api/autocomplete as the user types
+const searchSuggestions = document.getElementById("searchSuggestions");
+let suggestTimer = null;
+let suggestSeq = 0;
+searchInput.addEventListener("input", (e) => {
+  const q = searchInput.value.trim();
+  // Picking a suggestion replaces the input value; search for it right away
+  if ((!e.inputType || e.inputType === "insertReplacementText") &&
+      Array.from(searchSuggestions.options).some((o) => o.value === searchInput.value)) {
+    doSearch();
+    return;
+  }
+  clearTimeout(suggestTimer);
+  if (q.length < 2) {
+    searchSuggestions.innerHTML = "";
+    return;
+  }
+  suggestTimer = setTimeout(async () => {
+    const seq = ++suggestSeq;
+    try {
+      const r = await fetch(`${API_BASE}/api/autocomplete?q=${encodeURIComponent(q)}`);
+      if (!r.ok || seq !== suggestSeq) return;
+      const data = await r.json();
+      searchSuggestions.innerHTML = (data.results || [])
+        .map((a) => `<option value="${escapeHtml(a.display_name)}" label="${escapeHtml(a.institution || "")}"></option>`)
+        .join("");
+    } catch (err) {
+      // Suggestions are best effort
+    }
+  }, 150);
+});
 backToSearch.addEventListener("click", () => {
   goBackToResults();
 });
@@ -1827,7 +2110,7 @@ document.getElementById("backFromDashboard")?.addEventListener("click", () => {
 
 // Export dashboard report button
 document.getElementById("exportDashboardBtn")?.addEventListener("click", () => {
-  if (!lastDashboardData || !lastDashboardData.faculty) {
+  if (!lastDashboardData || !lastDashboardData.faculty || !lastDashboardData.department_stats) {
     alert("No dashboard data to export. Please upload a CSV file first.");
     return;
   }
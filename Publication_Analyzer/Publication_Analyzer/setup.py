@@ -24,6 +24,7 @@ def check_dependencies():
         "httpx",
         "pydantic",
         "reportlab",
+        "numpy",
     ]
     
     missing = []
@@ -0,0 +1,88 @@
+"""Tests for the author prefix index."""
+import asyncio
+
+from backend import main
+from backend.services.author_index import AuthorPrefixIndex
+
+
+def _index():
+    index = AuthorPrefixIndex()
+    index.add("A1", "Jane Doe", "MIT", cited_by_count=500)
+    index.add("A2", "John Doe", "Oxford", cited_by_count=9000)
+    index.add("A3", "Janet Döring", None, cited_by_count=40)
+    return index
+
+
+class TestAuthorPrefixIndex:
+    """Tests for AuthorPrefixIndex lookups."""
+
+    def test_prefix_of_any_name_token(self):
+        assert [r["id"] for r in _index().search("doe")] == ["A2", "A1"]
+
+    def test_multi_token_and_accents(self):
+        index = _index()
+        assert [r["id"] for r in index.search("jan do")] == ["A1", "A3"]
+        assert [r["id"] for r in index.search("j doring")] == ["A3"]
+
+    def test_refresh_replaces_entry(self):
+        index = _index()
+        index.add("A1", "Jane Smith", "MIT", cited_by_count=500)
+        assert [r["id"] for r in index.search("doe")] == ["A2"]
+        assert index.search("smi")[0]["display_name"] == "Jane Smith"
+
+    def test_node_capacity_keeps_most_cited(self):
+        index = AuthorPrefixIndex(node_capacity=2)
+        for i, citations in enumerate([5, 50, 500]):
+            index.add(f"A{i}", f"Lee {i}", cited_by_count=citations)
+        assert [r["id"] for r in index.search("lee")] == ["A2", "A1"]
+
+    def test_evicts_oldest(self):
+        index = AuthorPrefixIndex(max_entries=2)
+        for i in range(3):
+            index.add(f"A{i}", f"Kim {i}")
+        assert len(index) == 2
+        assert {r["id"] for r in index.search("kim")} == {"A1", "A2"}
+
+    def test_no_match(self):
+        assert _index().search("zzz") == []
+        assert _index().search("  ") == []
+
+    def test_multi_token_checks_every_token_node(self):
+        index = AuthorPrefixIndex(node_capacity=2)
+        index.add("J1", "John Smith", cited_by_count=10)
+        index.add("S1", "Ann Smith", cited_by_count=900)
+        index.add("S2", "Bob Smith", cited_by_count=800)  # "smith" nodes are now full without J1
+        assert [r["id"] for r in index.search("smith")] == ["S1", "S2"]
+        assert [r["id"] for r in index.search("john smith")] == ["J1"]
+
+    def test_evicted_prefixes_are_pruned(self):
+        index = AuthorPrefixIndex(max_entries=1)
+        index.add("A1", "Zed Quux")
+        index.add("A2", "Amy Bo")
+        assert set(index._root.children) == {"a", "b"}
+        assert index.search("zed") == []
+
+
+class TestAutocompleteFallthrough:
+    """Tests for /api/autocomplete when the local index misses."""
+
+    def test_crowded_multi_token_query_falls_through_to_openalex(self, monkeypatch):
+        index = AuthorPrefixIndex(node_capacity=1)
+        index.add("J1", "John Smith", cited_by_count=10)
+        index.add("J2", "John Adams", cited_by_count=500)
+        index.add("S1", "Ann Smith", cited_by_count=900)
+        assert index.search("john smith") == []  # J1 was pushed out of both token nodes
+
+        calls = []
+
+        async def openalex_autocomplete(q):
+            calls.append(q)
+            return [{"id": "J1", "display_name": "John Smith", "institution": None,
+                     "cited_by_count": 10, "source": "OpenAlex"}]
+
+        monkeypatch.setattr(main, "author_index", index)
+        monkeypatch.setattr(main, "_openalex_autocomplete", openalex_autocomplete)
+        response = asyncio.run(main.autocomplete_authors(q="john smith", limit=8))
+        assert calls == ["john smith"]
+        assert response["source"] == "openalex"
+        assert [r["id"] for r in response["results"]] == ["J1"]
@@ -0,0 +1,44 @@
+"""Tests for the hedged author search endpoint."""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from backend import main
+from backend.services.search_cache import SearchResultCache
+
+
+async def _slow_search(*args):
+    await asyncio.sleep(5)
+    return {"results": [{"id": "A1", "display_name": "Jane Doe", "source": "OpenAlex"}]}
+
+
+async def _empty_search(*args):
+    return {"results": []}
+
+
+@pytest.fixture
+def search_env(monkeypatch):
+    cache = SearchResultCache(ttl=300, stale_ttl=1800)
+    monkeypatch.setattr(main, "author_search_cache", cache)
+    monkeypatch.setattr(main.Config, "SEARCH_HEDGE_BUDGET", 0.05)
+    monkeypatch.setattr(main, "_search_openalex_authors", _slow_search)
+    return cache
+
+
+class TestAuthorSearchBudget:
+    """Tests for searches cut off by SEARCH_HEDGE_BUDGET."""
+
+    def test_no_source_in_time_is_an_uncached_504(self, search_env, monkeypatch):
+        monkeypatch.setattr(main, "GOOGLE_SCHOLAR_AVAILABLE", False)
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(main.search_authors(q="Jane Doe", progressive=False))
+        assert exc.value.status_code == 504
+        assert search_env.snapshot()["entries"] == 0
+
+    def test_empty_partial_response_is_not_cached(self, search_env, monkeypatch):
+        monkeypatch.setattr(main, "GOOGLE_SCHOLAR_AVAILABLE", True)
+        monkeypatch.setattr(main, "_search_scholar_authors", _empty_search)
+        response = asyncio.run(main.search_authors(q="Jane Doe", progressive=False))
+        assert response["count"] == 0 and response["partial"] is True
+        assert search_env.snapshot()["entries"] == 0
@@ -0,0 +1,82 @@
+"""Tests for batch faculty lookups with remembered choices."""
+import asyncio
+
+import httpx
+
+from backend import main
+from backend.services.disambiguation import DisambiguationStore
+
+
+def _author(author_id, name):
+    return {"id": f"https://openalex.org/{author_id}", "display_name": name, "works_count": 1, "cited_by_count": 0}
+
+
+class FakeOpenAlex:
+    """Mocked /authors endpoint: id filters resolve from `known`, searches return one author per name."""
+
+    def __init__(self, known=None):
+        self.known = known or {}
+        self.id_requests = []
+        self.searches = []
+
+    def __call__(self, request):
+        params = request.url.params
+        if "filter" in params:
+            ids = params["filter"].removeprefix("openalex:").split("|")
+            self.id_requests.append(ids)
+            return httpx.Response(200, json={"results": [self.known[i] for i in ids if i in self.known]})
+        name = params["search"]
+        self.searches.append(name)
+        return httpx.Response(200, json={"results": [_author("S" + name.split()[-1], name)]})
+
+
+def _run(names, scope, fake):
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(fake)) as client:
+            return [pair async for pair in main._iter_batch_lookups(client, names, scope)]
+    return asyncio.run(scenario())
+
+
+class TestIterBatchLookups:
+    """Tests for _iter_batch_lookups."""
+
+    def test_remembered_name_resolves_by_id_without_search(self, monkeypatch):
+        store = DisambiguationStore(None)
+        monkeypatch.setattr(main, "disambiguation_memory", store)
+        scope = store.scope("Roster")
+        store.remember(scope, "Jane Doe", "A1")
+        fake = FakeOpenAlex(known={"A1": _author("A1", "Jane Q. Doe")})
+
+        lookups = dict(_run(["Jane Doe", "John Roe"], scope, fake))
+        assert fake.id_requests == [["A1"]]
+        assert fake.searches == ["John Roe"]
+        assert lookups[0]["result"]["author_id"] == "A1"
+        assert lookups[0]["result"]["remembered"] is True
+        assert "remembered" not in lookups[1]["result"]
+
+    def test_unresolved_remembered_id_falls_back_to_search(self, monkeypatch):
+        store = DisambiguationStore(None)
+        monkeypatch.setattr(main, "disambiguation_memory", store)
+        scope = store.scope("Roster")
+        store.remember(scope, "Jane Doe", "A404")
+        fake = FakeOpenAlex()
+
+        lookups = dict(_run(["Jane Doe"], scope, fake))
+        assert fake.searches == ["Jane Doe"]
+        assert lookups[0]["result"]["author_id"] == "SDoe"
+        assert "remembered" not in lookups[0]["result"]
+
+    def test_indices_span_chunks(self, monkeypatch):
+        store = DisambiguationStore(None)
+        monkeypatch.setattr(main, "disambiguation_memory", store)
+        scope = store.scope("Roster")
+        names = [f"Person {i}" for i in range(120)]
+        store.remember(scope, "Person 75", "A75")
+        fake = FakeOpenAlex(known={"A75": _author("A75", "Person 75")})
+
+        lookups = _run(names, scope, fake)
+        assert sorted(index for index, _ in lookups) == list(range(120))
+        assert len(fake.id_requests) == 1  # Only the second chunk has a remembered name
+        for index, lookup in lookups:
+            assert lookup["result"]["name_requested"] == names[index]
+        assert dict(lookups)[75]["result"]["author_id"] == "A75"
@@ -0,0 +1,66 @@
+"""Tests for the TTL cache and chat session store."""
+import time
+
+from backend.services.chat_sessions import ChatSessionStore
+from backend.services.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_and_set(self):
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+
+    def test_expired_entry_is_missing(self):
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1, ttl=0)
+        assert cache.get("a", "missing") == "missing"
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(ttl=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+
+    def test_sliding_ttl_extends_on_get(self):
+        cache = TTLCache(ttl=0.2, sliding=True)
+        cache.set("a", 1)
+        time.sleep(0.12)
+        assert cache.get("a") == 1
+        time.sleep(0.12)
+        assert cache.get("a") == 1
+
+
+class TestChatSessionStore:
+    """Tests for ChatSessionStore."""
+
+    def test_create_and_get(self):
+        store = ChatSessionStore(ttl=60)
+        session = store.create("work", "context", meta={"work_id": "W1"})
+        assert store.get(session.id) is session
+        assert store.get(session.id, kind="work") is session
+
+    def test_wrong_kind_returns_none(self):
+        store = ChatSessionStore(ttl=60)
+        session = store.create("work", "context")
+        assert store.get(session.id, kind="compare") is None
+
+    def test_unknown_id_returns_none(self):
+        store = ChatSessionStore(ttl=60)
+        assert store.get("nope") is None
+        assert store.get(None) is None
+
+    def test_history_is_bounded(self):
+        store = ChatSessionStore(ttl=60, max_turns=2)
+        session = store.create("work", "context")
+        for i in range(5):
+            session.add_turn(f"q{i}", f"a{i}")
+        messages = session.build_messages("next")
+        assert messages[0] == {"role": "system", "content": "context"}
+        assert [m["content"] for m in messages[1:]] == ["q3", "a3", "q4", "a4", "next"]
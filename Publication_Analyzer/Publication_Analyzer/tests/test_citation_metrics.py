@@ -0,0 +1,121 @@
+"""Tests for citation metrics (h-index, growth, velocity, trajectories)."""
+import numpy as np
+import pytest
+
+from backend.services.citation_metrics import (
+    CitationTrajectoryBuilder,
+    batch_metrics,
+    citation_velocity,
+    h_index,
+    metrics_rows,
+    stack_works,
+    yoy_growth,
+)
+
+
+def _work(total, by_year):
+    return {
+        "cited_by_count": total,
+        "counts_by_year": [{"year": year, "cited_by_count": count} for year, count in by_year.items()],
+    }
+
+
+class TestHIndex:
+    """Tests for h_index."""
+
+    def test_classic_examples(self):
+        assert h_index([10, 8, 5, 4, 3]) == 4
+        assert h_index([25, 8, 5, 3, 3]) == 3
+        assert h_index([0, 0]) == 0
+        assert h_index([]) == 0
+
+
+class TestGrowthAndVelocity:
+    """Tests for yoy_growth and citation_velocity."""
+
+    def test_growth_skips_years_after_zero(self):
+        assert yoy_growth(np.array([0, 10, 15, 12])) == [None, None, 0.5, -0.2]
+
+    def test_velocity_ignores_partial_current_year(self):
+        years = np.arange(2020, 2026)
+        velocity = citation_velocity(years, np.array([10, 20, 30, 40, 50, 3]), current_year=2025)
+        assert velocity["last_year"] == 50
+        assert velocity["avg_last_3_years"] == 40
+        assert velocity["trend_per_year"] == pytest.approx(10)
+
+
+class TestCitationTrajectoryBuilder:
+    """Tests for CitationTrajectoryBuilder."""
+
+    def test_pages_accumulate_to_same_result(self):
+        works = [
+            _work(30, {2024: 10, 2023: 10, 2016: 10}),
+            _work(12, {2025: 2, 2022: 4, 2017: 6}),
+            _work(5, {2018: 5}),
+            _work(40, {2010: 40}),  # Cited only before the 10-year window
+        ]
+        whole = CitationTrajectoryBuilder(current_year=2025)
+        whole.add_works(works)
+        paged = CitationTrajectoryBuilder(current_year=2025)
+        paged.add_works(works[:1])
+        paged.add_works(works[1:])
+
+        result = paged.result()
+        assert result == whole.result()
+        assert result["years"][0] == 2016 and result["years"][-1] == 2025
+        assert result["citations"][result["years"].index(2024)] == 10
+        assert result["h_index"] == {"all_time": 4, "last_5_years": 2, "last_10_years": 3}
+        assert result["works_analyzed"] == 4
+
+    def test_author_counts_override_yearly_series(self):
+        builder = CitationTrajectoryBuilder(current_year=2025, windows=(5,))
+        builder.add_works([_work(3, {2025: 3})])
+        result = builder.result([{"year": 2024, "cited_by_count": 7, "works_count": 2}])
+        assert result["citations"] == [0, 0, 0, 7, 0]
+        assert result["works"] == [0, 0, 0, 2, 0]
+        assert result["yoy_growth"][-1] == -1.0
+
+
+def _reference(citations):
+    """Brute-force h, i10 and g for one author."""
+    ranked = sorted(citations, reverse=True)
+    h = max((r for r in range(1, len(ranked) + 1) if ranked[r - 1] >= r), default=0)
+    g = max((r for r in range(1, len(ranked) + 1) if sum(ranked[:r]) >= r * r), default=0)
+    return h, sum(c >= 10 for c in citations), g
+
+
+class TestBatchMetrics:
+    """Tests for batch_metrics."""
+
+    def test_matches_per_author_reference(self):
+        rng = np.random.default_rng(1)
+        owners = rng.integers(0, 6, 400)
+        citations = rng.poisson(rng.choice([2, 15, 60], 400))
+        years = rng.integers(2000, 2025, 400)
+        metrics = batch_metrics(owners, citations, years, n_authors=7, year_from=2010, year_to=2020, current_year=2025)
+
+        for author in range(7):
+            in_window = (owners == author) & (years >= 2010) & (years <= 2020)
+            h, i10, g = _reference(citations[in_window].tolist())
+            assert metrics["h_index"][author] == h
+            assert metrics["i10_index"][author] == i10
+            assert metrics["g_index"][author] == g
+            assert metrics["works"][author] == in_window.sum()
+        assert metrics["works"][6] == 0 and metrics["first_year"][6] == 0
+
+    def test_m_quotient_uses_career_start_within_window(self):
+        metrics = batch_metrics([0, 0, 0, 1], [5, 4, 3, 9], [2015, 2020, 2021, 0], n_authors=2, current_year=2024)
+        rows = metrics_rows(metrics)
+        assert rows[0]["h_index"] == 3 and rows[0]["first_year"] == 2015
+        assert rows[0]["m_quotient"] == 0.3  # 3 / (2024 - 2015 + 1)
+        assert rows[1]["m_quotient"] is None and rows[1]["first_year"] is None
+
+        windowed = metrics_rows(batch_metrics([0, 0, 0], [5, 4, 3], [2015, 2020, 2021], 1, year_from=2020, year_to=2021))
+        assert windowed[0]["works"] == 2 and windowed[0]["m_quotient"] == 1.0
+
+    def test_stack_works_skips_missing_authors(self):
+        owners, citations, years = stack_works([([3, 1], [2020, 2021]), None, ([7], [2019])])
+        assert owners.tolist() == [0, 0, 2]
+        assert citations.tolist() == [3, 1, 7]
+        assert years.tolist() == [2020, 2021, 2019]
+        assert stack_works([None])[0].size == 0
@@ -0,0 +1,48 @@
+"""Tests for the name disambiguation memory."""
+from backend.services import disambiguation
+from backend.services.disambiguation import DisambiguationStore
+
+
+class TestDisambiguationStore:
+    """Tests for DisambiguationStore scoping and persistence."""
+
+    def test_remembers_per_scope(self):
+        store = DisambiguationStore(None)
+        cs = store.scope("CS Dept", "MIT")
+        store.remember(cs, "Li  Wei", "A123", display_name="Wei Li")
+
+        assert store.get(store.scope("cs dept", "mit"), "li wei")["author_id"] == "A123"
+        assert store.get(store.scope("Physics", "MIT"), "Li Wei") is None
+        assert store.get(store.scope("CS Dept"), "Li Wei") is None
+
+    def test_persists_to_disk(self, tmp_path):
+        path = tmp_path / "choices.json"
+        scope = DisambiguationStore.scope("Roster A")
+        DisambiguationStore(path).remember(scope, "Jane Doe", "A1")
+        assert DisambiguationStore(path).get(scope, "Jane Doe")["author_id"] == "A1"
+
+    def test_forget(self):
+        store = DisambiguationStore(None)
+        scope = store.scope("Roster A")
+        store.remember(scope, "Jane Doe", "A1")
+        store.remember(scope, "John Roe", "A2")
+        assert store.forget(scope, "jane doe") == 1
+        assert store.get(scope, "Jane Doe") is None
+        assert store.forget(scope) == 1
+        assert len(store) == 0
+
+    def test_remember_many_writes_once(self, tmp_path, monkeypatch):
+        path = tmp_path / "choices.json"
+        store = DisambiguationStore(path)
+        writes = []
+        real_replace = disambiguation.os.replace
+        monkeypatch.setattr(disambiguation.os, "replace", lambda *args: writes.append(args) or real_replace(*args))
+        scope = store.scope("Roster A")
+        stored = store.remember_many(scope, [
+            {"name": "Jane Doe", "author_id": "A1"},
+            {"name": "John Roe", "author_id": "A2", "display_name": "John Q. Roe"},
+            {"name": "", "author_id": "A3"},
+        ])
+        assert stored == 2
+        assert len(writes) == 1
+        assert DisambiguationStore(path).get(scope, "john roe")["display_name"] == "John Q. Roe"
@@ -0,0 +1,36 @@
+"""Tests for OpenAlex group_by aggregation."""
+import asyncio
+
+import httpx
+
+from backend import main
+
+
+class TestOpenAlexGroupBy:
+    """Tests for _openalex_group_by."""
+
+    def test_groups_sorted_with_fallback_names(self):
+        payload = {
+            "meta": {"count": 42},
+            "group_by": [
+                {"key": "https://openalex.org/T1", "key_display_name": "Machine Learning", "count": 5},
+                {"key": "unknown", "key_display_name": "unknown", "count": 9},
+                {"key": "https://openalex.org/T2", "key_display_name": None, "count": 30},
+                {"key": "article", "key_display_name": "article", "count": 12},
+            ],
+        }
+        requests = []
+
+        def handler(request):
+            requests.append(dict(request.url.params))
+            return httpx.Response(200, json=payload)
+
+        async def scenario():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await main._openalex_group_by(client, "author.id:A1", "topics.id")
+
+        groups, total = asyncio.run(scenario())
+        assert requests == [{"filter": "author.id:A1", "group_by": "topics.id"}]
+        assert total == 42
+        assert [(g["name"], g["count"]) for g in groups] == [("T2", 30), ("article", 12), ("Machine Learning", 5)]
+        assert groups[0]["key"] == "https://openalex.org/T2"
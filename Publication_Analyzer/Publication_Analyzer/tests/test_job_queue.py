@@ -0,0 +1,98 @@
+"""Tests for the persistent background job queue."""
+import asyncio
+import json
+
+from backend.services.job_queue import JobQueue
+
+
+async def _upper(items, context):
+    return [{"name": item.upper()} for item in items]
+
+
+async def _wait_for(queue, job_id, statuses=("done", "failed", "cancelled"), timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while queue.get(job_id)["status"] not in statuses and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+    return queue.get(job_id)
+
+
+class TestJobQueue:
+    """Tests for JobQueue processing, persistence and resume."""
+
+    def test_processes_job_in_chunks(self, tmp_path):
+        queue = JobQueue(tmp_path, workers=1, chunk_size=2)
+        queue.register("upper", _upper)
+
+        async def scenario():
+            await queue.start()
+            job = queue.submit("upper", ["a", "b", "c"])
+            status = await _wait_for(queue, job["id"])
+            await queue.stop()
+            return job["id"], status
+
+        job_id, status = asyncio.run(scenario())
+        assert status["status"] == "done"
+        assert status["progress"] == 1.0
+        assert queue.results(job_id, offset=1, limit=5) == [{"name": "B"}, {"name": "C"}]
+
+    def test_resumes_unfinished_job_after_restart(self, tmp_path):
+        # A run that crashed mid-job: two results written, a third cut off mid-line
+        job = {
+            "id": "job1", "kind": "upper", "status": "running", "items": ["a", "b", "c", "d"],
+            "total": 4, "completed": 1, "created_at": 1.0, "updated_at": 1.0,
+        }
+        (tmp_path / "job1.json").write_text(json.dumps(job))
+        (tmp_path / "job1.jsonl").write_text('{"name": "A"}\n{"name": "B"}\n{"na')
+
+        queue = JobQueue(tmp_path, workers=1, chunk_size=10)
+        queue.register("upper", _upper)
+
+        async def scenario():
+            await queue.start()
+            status = await _wait_for(queue, "job1")
+            await queue.stop()
+            return status
+
+        assert asyncio.run(scenario())["status"] == "done"
+        assert [row["name"] for row in queue.iter_results("job1")] == ["A", "B", "C", "D"]
+
+    def test_cancel_before_start(self, tmp_path):
+        queue = JobQueue(tmp_path)
+        queue.register("upper", _upper)
+        job = queue.submit("upper", ["a"])  # Not started: stays queued
+        assert queue.cancel(job["id"])
+        assert queue.get(job["id"])["status"] == "cancelled"
+        assert not queue.cancel(job["id"])
+
+    def test_handler_error_fails_job(self, tmp_path):
+        async def broken(items, context):
+            raise RuntimeError("upstream down")
+
+        queue = JobQueue(tmp_path, workers=1)
+        queue.register("broken", broken)
+
+        async def scenario():
+            await queue.start()
+            job = queue.submit("broken", ["a"])
+            status = await _wait_for(queue, job["id"])
+            await queue.stop()
+            return status
+
+        status = asyncio.run(scenario())
+        assert status["status"] == "failed"
+        assert status["error"] == "upstream down"
+
+    def test_purges_expired_finished_jobs(self, tmp_path):
+        job = {"id": "old", "kind": "upper", "status": "done", "items": ["a"], "total": 1,
+               "completed": 1, "created_at": 1.0, "updated_at": 1.0}
+        (tmp_path / "old.json").write_text(json.dumps(job))
+        queue = JobQueue(tmp_path, retention=60, clock=lambda: 1000.0)
+
+        async def scenario():
+            await queue.start()
+            await queue.stop()
+
+        asyncio.run(scenario())
+        assert queue.get("old") is None
+        assert not (tmp_path / "old.json").exists()
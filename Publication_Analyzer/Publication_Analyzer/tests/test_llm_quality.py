@@ -0,0 +1,94 @@
+"""Tests for LLM evaluation response parsing."""
+import asyncio
+import json
+
+import httpx
+
+from backend.services import llm_quality
+from backend.services.llm_quality import (
+    _parse_llm_response,
+    _try_parse_llm_response,
+    get_evaluation_stats,
+)
+from backend.services.model_router import ModelRouter
+
+
+class TestParseLlmResponse:
+    """Tests for schema-constrained and legacy response parsing."""
+
+    def test_parses_compact_schema(self):
+        text = '{"quality": 8, "credibility": 7, "relevance": 9, "suspicious": false, "reason": "Solid"}'
+        result = _try_parse_llm_response(text)
+        assert result["quality_score"] == 8
+        assert result["credibility_score"] == 7
+        assert result["relevance_score"] == 9
+        assert result["suspicious"] is False
+        assert result["reason"] == "Solid"
+
+    def test_parses_legacy_keys_in_markdown_fence(self):
+        text = '```json\n{"quality_score": 6, "credibility_score": 4, "relevance_score": 5, "suspicious": true}\n```'
+        result = _try_parse_llm_response(text)
+        assert result["quality_score"] == 6
+        assert result["suspicious"] is True
+
+    def test_clamps_scores(self):
+        result = _try_parse_llm_response('{"quality": 14, "credibility": -2, "relevance": 5}')
+        assert result["quality_score"] == 10
+        assert result["credibility_score"] == 0
+
+    def test_unparseable_returns_none(self):
+        assert _try_parse_llm_response("no json here") is None
+        assert _try_parse_llm_response("") is None
+
+    def test_parse_falls_back_to_defaults(self):
+        result = _parse_llm_response("garbage")
+        assert result["quality_score"] == 5
+        assert result["reason"] == "Unable to evaluate"
+
+
+def test_evaluation_stats_has_failure_rate():
+    stats = get_evaluation_stats()
+    assert "parse_failure_rate" in stats
+    assert 0.0 <= stats["parse_failure_rate"] <= 1.0
+
+
+AsyncClient = httpx.AsyncClient
+ANSWER = {"choices": [{"message": {"content": '{"quality": 8, "credibility": 7, "relevance": 6, "suspicious": false, "reason": "ok"}'}}]}
+
+
+class TestStructuredOutputFallback:
+    """Tests for per-model structured output fallback."""
+
+    def _evaluate(self, monkeypatch, model, error_body):
+        """Evaluate one paper against a fake provider that rejects response_format with `error_body`."""
+        requests = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            requests.append((body["model"], "response_format" in body))
+            if "response_format" in body:
+                return httpx.Response(400, json={"error": error_body})
+            return httpx.Response(200, json=ANSWER)
+
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(llm_quality.httpx, "AsyncClient", lambda **kwargs: AsyncClient(transport=transport, **kwargs))
+        monkeypatch.setattr(llm_quality, "model_router", ModelRouter({"scoring": [model], "summary": [model]}, {}))
+        result = asyncio.run(llm_quality.evaluate_paper_llm({"title": "A paper"}))
+        assert result["quality_score"] == 8
+        return requests
+
+    def test_prompt_error_retries_without_disabling(self, monkeypatch):
+        monkeypatch.setenv("HF_TOKEN", "token")
+        monkeypatch.setattr(llm_quality, "_structured_output_unsupported", set())
+        requests = self._evaluate(monkeypatch, "m1", "Input validation error: prompt too long")
+        assert requests == [("m1", True), ("m1", False)]
+        assert llm_quality._structured_output_unsupported == set()
+
+    def test_unsupported_response_format_disables_only_that_model(self, monkeypatch):
+        monkeypatch.setenv("HF_TOKEN", "token")
+        monkeypatch.setattr(llm_quality, "_structured_output_unsupported", set())
+        self._evaluate(monkeypatch, "m1", "response_format is not supported by this model")
+        assert llm_quality._structured_output_unsupported == {"m1"}
+
+        assert self._evaluate(monkeypatch, "m1", "")[0] == ("m1", False)
+        assert self._evaluate(monkeypatch, "m2", "")[0] == ("m2", True)
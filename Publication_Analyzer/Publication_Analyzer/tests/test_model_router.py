@@ -0,0 +1,65 @@
+"""Tests for the latency-aware model router."""
+from backend.services.model_router import ModelRouter, ModelStats
+
+
+def _router(**kwargs):
+    return ModelRouter(
+        routes={"scoring": ["slow", "fast"], "summary": ["big"]},
+        p95_limits={"scoring": 5.0, "summary": 30.0},
+        min_samples=3,
+        **kwargs,
+    )
+
+
+class TestModelStats:
+    """Tests for ModelStats percentiles and error rate."""
+
+    def test_percentiles(self):
+        stats = ModelStats()
+        for latency in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
+            stats.record(latency, ok=True)
+        assert stats.percentile(50) == 5
+        assert stats.percentile(95) == 10
+
+    def test_error_rate(self):
+        stats = ModelStats()
+        stats.record(1.0, ok=True)
+        stats.record(1.0, ok=False)
+        assert stats.error_rate == 0.5
+        assert stats.percentile(50) == 1.0
+
+
+class TestModelRouter:
+    """Tests for ModelRouter model selection."""
+
+    def test_prefers_primary_without_samples(self):
+        assert _router().pick("scoring") == "slow"
+
+    def test_shifts_when_p95_exceeds_limit(self):
+        router = _router(probe_interval=1000)
+        for _ in range(3):
+            router.record("slow", 9.0, ok=True)
+        assert router.pick("scoring") == "fast"
+
+    def test_shifts_when_error_rate_exceeds_limit(self):
+        router = _router(probe_interval=1000)
+        for _ in range(3):
+            router.record("slow", 1.0, ok=False)
+        assert router.pick("scoring") == "fast"
+
+    def test_probes_primary_periodically(self):
+        router = _router(probe_interval=2)
+        for _ in range(3):
+            router.record("slow", 9.0, ok=True)
+        picks = [router.pick("scoring") for _ in range(4)]
+        assert picks.count("slow") == 2
+
+    def test_unknown_task_uses_summary_route(self):
+        assert _router().pick("unknown") == "big"
+
+    def test_snapshot_reports_latency(self):
+        router = _router()
+        router.record("slow", 2.0, ok=True)
+        snap = router.snapshot()
+        assert snap["models"]["slow"]["p50_seconds"] == 2.0
+        assert snap["routes"]["scoring"]["models"] == ["slow", "fast"]
@@ -0,0 +1,77 @@
+"""Tests for PDF report rendering and the PDF worker pool."""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.services import pdf_report
+from backend.services.pdf_report import PdfBusy, PdfRenderer, _report_styles, build_accreditation_pdf
+
+
+class TestBuildAccreditationPdf:
+    """Tests for build_accreditation_pdf."""
+
+    def test_renders_pdf_bytes(self):
+        pdf = build_accreditation_pdf("A1", "Jane Doe", works_count=12, cited_by_count=340, h_index=9)
+        assert pdf.startswith(b"%PDF")
+
+    def test_styles_built_once(self):
+        assert _report_styles() is _report_styles()
+
+
+class TestPdfRenderer:
+    """Tests for PdfRenderer."""
+
+    def test_renders_in_worker_process(self):
+        renderer = PdfRenderer(max_workers=1, max_in_flight=4)
+        try:
+            pdfs = asyncio.run(self._render_many(renderer, 3))
+        finally:
+            renderer.shutdown()
+        assert all(pdf.startswith(b"%PDF") for pdf in pdfs)
+        snapshot = renderer.snapshot()
+        assert snapshot["completed"] == 3 and snapshot["in_flight"] == 0
+
+    def test_rejects_beyond_in_flight_cap(self):
+        renderer = PdfRenderer(max_workers=1, max_in_flight=0)
+        with pytest.raises(PdfBusy):
+            asyncio.run(renderer.render(author_id="A1", author_name="Jane Doe"))
+        assert renderer.snapshot()["rejected"] == 1
+
+    def test_cancelled_render_holds_slot_until_worker_finishes(self, monkeypatch):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_build(**report):
+            started.set()
+            release.wait(5)
+            return b"%PDF"
+
+        monkeypatch.setattr(pdf_report, "build_accreditation_pdf", slow_build)
+        renderer = PdfRenderer(max_workers=1, max_in_flight=1)
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(renderer, "_pool", lambda: executor)
+
+        async def scenario():
+            task = asyncio.ensure_future(renderer.render(author_id="A1", author_name="Jane Doe"))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert renderer.snapshot()["in_flight"] == 1
+            with pytest.raises(PdfBusy):
+                await renderer.render(author_id="A2", author_name="John Roe")
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+        snapshot = renderer.snapshot()
+        assert snapshot["in_flight"] == 0 and snapshot["completed"] == 1
+
+    @staticmethod
+    async def _render_many(renderer, n):
+        return await asyncio.gather(*(
+            renderer.render(author_id=f"A{i}", author_name=f"Author {i}") for i in range(n)
+        ))
@@ -0,0 +1,67 @@
+"""Tests for ranked-corpus builds (LLM cap and caching)."""
+import asyncio
+
+import httpx
+import pytest
+
+from backend import main
+from backend.services.ttl_cache import TTLCache
+
+AsyncClient = httpx.AsyncClient
+
+
+def _work(i):
+    return {
+        "id": f"https://openalex.org/W{i}",
+        "title": f"Paper {i}",
+        "publication_year": 2020,
+        "cited_by_count": 100 - i,
+    }
+
+
+def _openalex(request):
+    if request.url.path == "/works":
+        return httpx.Response(200, json={"results": [_work(i) for i in range(8)], "meta": {"count": 8}})
+    return httpx.Response(404, json={})
+
+
+@pytest.fixture
+def corpus_env(monkeypatch):
+    monkeypatch.setenv("HF_TOKEN", "token")
+    monkeypatch.setattr(main.Config, "RANKED_CORPUS_LLM_TOP_N", 3)
+    monkeypatch.setattr(main, "_ranked_corpus_cache", TTLCache(ttl=3600))
+    transport = httpx.MockTransport(_openalex)
+    monkeypatch.setattr(main.httpx, "AsyncClient", lambda **kwargs: AsyncClient(transport=transport, **kwargs))
+
+    evaluated = []
+
+    def evaluate(results):
+        async def batch_evaluate_llm(papers, query=None, max_concurrent=5):
+            evaluated.extend(paper["id"] for paper in papers)
+            return [dict(results) for _ in papers]
+        monkeypatch.setattr(main, "batch_evaluate_llm", batch_evaluate_llm)
+
+    return evaluated, evaluate
+
+
+class TestRankedCorpus:
+    """Tests for _get_ranked_corpus."""
+
+    def test_llm_evaluates_only_top_n_and_caches(self, corpus_env):
+        evaluated, evaluate = corpus_env
+        evaluate({"quality_score": 9, "credibility_score": 9, "relevance_score": 9, "suspicious": False, "reason": "ok"})
+        corpus = asyncio.run(main._get_ranked_corpus("A1", ["author.id:A1"], True, None))
+
+        assert len(corpus["works"]) == 8
+        assert len(evaluated) == 3 and corpus["llm_evaluated"] == 3
+        assert not corpus["llm_degraded"]
+        assert len(main._ranked_corpus_cache) == 1
+
+    def test_failed_evaluations_are_not_cached(self, corpus_env):
+        _, evaluate = corpus_env
+        evaluate({"quality_score": 5, "credibility_score": 5, "relevance_score": 5, "suspicious": False,
+                  "evaluated": False, "reason": "HuggingFace API credits depleted"})
+        corpus = asyncio.run(main._get_ranked_corpus("A1", ["author.id:A1"], True, None))
+
+        assert corpus["llm_degraded"] is True
+        assert len(main._ranked_corpus_cache) == 0
@@ -0,0 +1,174 @@
+"""Tests for the vectorized ranking engine."""
+import copy
+import random
+
+import pytest
+
+from backend.services.ranking_engine import (
+    calculate_author_reputation,
+    calculate_citation_score,
+    calculate_integrity_weight,
+    calculate_llm_weight,
+    calculate_recency_bonus,
+    rank_papers,
+    top_k_order,
+)
+
+
+def _scalar_rank(papers, author=None):
+    """Reference implementation: per-paper scalar scoring and a stable sort."""
+    scored = []
+    for paper in papers:
+        integrity = paper.get("integrity", {"integrity_score": 50})
+        llm = paper.get("llm", {})
+        components = {
+            "citation": calculate_citation_score(paper),
+            "recency": calculate_recency_bonus(paper),
+            "author": calculate_author_reputation(author),
+            "integrity": calculate_integrity_weight(integrity),
+            "llm": calculate_llm_weight(llm),
+        }
+        final = (
+            components["citation"] * 0.20 +
+            components["recency"] * 0.10 +
+            components["author"] * 0.15 +
+            components["integrity"] * 0.25 +
+            components["llm"] * 0.30
+        )
+        scored.append((round(final, 2), paper["id"], components))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return scored
+
+
+def _random_papers(n, seed=7):
+    rng = random.Random(seed)
+    papers = []
+    for i in range(n):
+        paper = {
+            "id": f"W{i}",
+            "title": f"Paper {i}",
+            "year": rng.choice([None, 1995, 2010, 2019, 2022, 2024, 2025, 2026]),
+            "cited_by_count": rng.choice([0, 1, 5, 40, 300, 5000]),
+        }
+        if rng.random() > 0.2:
+            paper["integrity"] = {"integrity_score": rng.choice([20, 50, 65, 80, 100]), "risk_level": "LOW"}
+        if rng.random() > 0.2:
+            paper["llm"] = {
+                "quality_score": rng.randint(0, 10),
+                "credibility_score": rng.randint(0, 10),
+                "relevance_score": rng.randint(0, 10),
+                "suspicious": rng.random() < 0.1,
+            }
+        papers.append(paper)
+    return papers
+
+
+class TestRankPapers:
+    """rank_papers must match the scalar scoring functions."""
+
+    @pytest.mark.parametrize("author", [None, {"cited_by_count": 1200, "h_index": 18}])
+    def test_matches_scalar_implementation(self, author):
+        papers = _random_papers(200)
+        expected = _scalar_rank(copy.deepcopy(papers), author)
+        ranked = rank_papers(papers, author=author)
+
+        assert [p["id"] for p in ranked] == [item[1] for item in expected]
+        assert [p["final_score"] for p in ranked] == [item[0] for item in expected]
+        for paper, (_, _, components) in zip(ranked, expected):
+            for name, value in components.items():
+                assert paper["score_components"][name] == pytest.approx(value, rel=1e-12)
+        assert [p["rank"] for p in ranked] == list(range(1, 201))
+
+    def test_top_k_matches_full_ranking_prefix(self):
+        papers = _random_papers(300, seed=11)
+        full = [p["id"] for p in rank_papers(copy.deepcopy(papers))]
+        top = rank_papers(papers, top_k=25)
+        assert [p["id"] for p in top] == full[:25]
+
+    def test_top_k_only_annotates_returned_rows(self):
+        papers = _random_papers(50)
+        top = rank_papers(papers, top_k=5)
+        returned = {p["id"] for p in top}
+        for paper in papers:
+            assert ("rank_explanation" in paper) == (paper["id"] in returned)
+
+    def test_empty_input(self):
+        assert rank_papers([]) == []
+
+
+class TestTopKOrder:
+    """Tests for top_k_order tie handling."""
+
+    def test_ties_keep_input_order(self):
+        import numpy as np
+        scores = np.array([5.0, 7.0, 7.0, 1.0, 7.0])
+        assert list(top_k_order(scores)) == [1, 2, 4, 0, 3]
+        assert list(top_k_order(scores, 2)) == [1, 2]
+
+
+class TestWeightProfiles:
+    """Tests for weight profiles and re-ranking over stored components."""
+
+    def test_profiles_sum_to_one(self):
+        from backend.services.ranking_engine import QUALITY_COMPONENTS, WEIGHT_PROFILES
+        for weights in WEIGHT_PROFILES.values():
+            assert sum(weights[name] for name in QUALITY_COMPONENTS) == pytest.approx(1.0)
+            assert 0 <= weights["relevance"] <= 1
+
+    def test_parse_weights(self):
+        from backend.services.ranking_engine import parse_weights
+        assert parse_weights("citation:0.4, LLM:0.6") == {"citation": 0.4, "llm": 0.6}
+
+    @pytest.mark.parametrize("spec", ["foo:1", "citation", "citation:x", "citation:-1"])
+    def test_parse_weights_rejects_invalid(self, spec):
+        from backend.services.ranking_engine import parse_weights
+        with pytest.raises(ValueError):
+            parse_weights(spec)
+
+    def test_resolve_weights_normalizes_custom(self):
+        from backend.services.ranking_engine import resolve_weights
+        weights = resolve_weights("balanced", {"citation": 1.0, "recency": 0, "author": 0, "integrity": 0, "llm": 0})
+        assert weights["citation"] == pytest.approx(1.0)
+        assert weights["integrity"] == 0
+        assert weights["relevance"] == pytest.approx(0.15)
+
+    def test_resolve_weights_rejects_unknown_profile(self):
+        from backend.services.ranking_engine import resolve_weights
+        with pytest.raises(ValueError):
+            resolve_weights("nope")
+
+    def test_rerank_matches_full_rank_with_same_weights(self):
+        from backend.services.ranking_engine import WEIGHT_PROFILES, rerank_papers
+        papers = _random_papers(120, seed=3)
+        impact = WEIGHT_PROFILES["impact"]
+        direct = rank_papers(copy.deepcopy(papers), weights=impact)
+        balanced = rank_papers(papers)
+        # papers keeps input order (so ties break the same way) and now carries score_components
+        reranked = rerank_papers(papers, impact)
+        assert [p["id"] for p in reranked] == [p["id"] for p in direct]
+        assert [p["final_score"] for p in reranked] == [p["final_score"] for p in direct]
+        # Inputs keep their balanced ranking
+        assert [p["rank"] for p in balanced] == list(range(1, 121))
+
+
+class TestQueryRelevance:
+    """Tests for the BM25 relevance component."""
+
+    def test_matching_papers_rank_first(self):
+        papers = [
+            {"id": "W1", "title": "Protein folding with molecular dynamics", "year": 2020},
+            {"id": "W2", "title": "Graph neural networks for drug discovery", "year": 2020,
+             "abstract": "We train graph neural networks on molecules."},
+            {"id": "W3", "title": "Survey of neural networks", "year": 2020},
+        ]
+        ranked = rank_papers(papers, query="graph neural networks")
+        assert [p["id"] for p in ranked] == ["W2", "W3", "W1"]
+        assert ranked[0]["score_components"]["relevance"] == pytest.approx(100.0)
+        assert ranked[-1]["score_components"]["relevance"] == 0
+        assert "Strong match for query" in ranked[0]["rank_explanation"]
+
+    def test_unmatched_query_keeps_quality_ranking(self):
+        papers = _random_papers(60, seed=5)
+        plain = rank_papers(copy.deepcopy(papers))
+        queried = rank_papers(papers, query="zebrafish")
+        assert [p["final_score"] for p in queried] == [p["final_score"] for p in plain]
@@ -0,0 +1,53 @@
+"""Tests for the hashing TF-IDF related-works index."""
+from backend.services.related_works import RelatedWorksIndex, hashed_term_counts
+
+
+def _work(work_id, title, abstract=""):
+    return {"id": f"https://openalex.org/{work_id}", "title": title, "abstract": abstract, "publication_year": 2020}
+
+
+class TestHashedTermCounts:
+    """Tests for hashed_term_counts."""
+
+    def test_stable_sublinear_counts(self):
+        counts = hashed_term_counts("graph graph networks", 1024)
+        assert counts == hashed_term_counts("Graph graph networks.", 1024)
+        assert sorted(counts.values()) == [1.0, 1.0, 1.0, 1.6931471805599454]  # 2 unigrams, 2 bigrams
+
+
+class TestRelatedWorksIndex:
+    """Tests for RelatedWorksIndex."""
+
+    def test_related_by_shared_terms(self):
+        index = RelatedWorksIndex(n_features=4096)
+        index.add_works([
+            _work("W1", "Graph neural networks for molecules", "message passing on molecular graphs"),
+            _work("W2", "Molecular property prediction with graph networks"),
+            _work("W3", "Protein folding with deep learning"),
+            _work("W4", "A survey of medieval poetry"),
+        ])
+        related = index.related("W1", k=3)
+        assert related[0]["id"] == "W2"
+        assert "W4" not in [r["id"] for r in related]
+        assert related[0]["publication_year"] == 2020
+        assert index.related("W9") is None
+
+    def test_rare_terms_weigh_more(self):
+        index = RelatedWorksIndex(n_features=4096)
+        index.add_works([_work(f"W{i}", f"learning study {i}") for i in range(10)])
+        index.add_works([
+            _work("Wq", "learning study of transformers"),
+            _work("Wa", "transformers"),
+            _work("Wb", "learning study"),
+        ])
+        assert index.related("Wq", k=1)[0]["id"] == "Wa"
+
+    def test_longer_text_replaces_and_eviction_keeps_df(self):
+        index = RelatedWorksIndex(n_features=4096, max_works=2)
+        assert index.add_work(_work("W1", "graph networks"))
+        assert not index.add_work(_work("W1", "graph"))  # Shorter text is ignored
+        assert index.add_work(_work("W1", "graph networks", "with an abstract"))
+        index.add_work(_work("W2", "graph networks"))
+        index.add_work(_work("W3", "poetry"))
+        assert len(index) == 2 and "W1" not in index
+        assert index._df.sum() == sum(len(index._vectors.get(w)) for w in ("W2", "W3"))
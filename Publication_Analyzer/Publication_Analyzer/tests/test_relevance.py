@@ -0,0 +1,42 @@
+"""Tests for the local BM25 relevance scorer."""
+import pytest
+
+from backend.services.relevance import BM25Index, relevance_scores, tokenize
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_drops_stopwords_and_punctuation(self):
+        assert tokenize("The Role of CRISPR-Cas9 in a Cell") == ["role", "crispr", "cas9", "cell"]
+
+    def test_empty(self):
+        assert tokenize(None) == []
+
+
+class TestBM25Index:
+    """Tests for BM25Index scoring."""
+
+    def test_rare_terms_weigh_more(self):
+        index = BM25Index(["deep learning", "deep learning models", "deep sea ecology"])
+        scores = index.scores("learning ecology")
+        assert scores[2] > scores[0]
+
+    def test_shorter_documents_score_higher_for_same_match(self):
+        index = BM25Index(["quantum", "quantum error correction codes hardware", "biology"])
+        scores = index.scores("quantum")
+        assert scores[0] > scores[1] > scores[2] == 0
+
+
+class TestRelevanceScores:
+    """Tests for relevance_scores normalization."""
+
+    def test_best_match_is_100(self):
+        papers = [{"title": "Solar cells"}, {"title": "Perovskite solar cells", "abstract": "perovskite"}]
+        scores = relevance_scores(papers, "perovskite solar")
+        assert scores[1] == pytest.approx(100.0)
+        assert 0 < scores[0] < 100
+
+    @pytest.mark.parametrize("query", [None, "", "the of"])
+    def test_no_query_gives_zeros(self, query):
+        assert list(relevance_scores([{"title": "Solar cells"}], query)) == [0.0]
@@ -0,0 +1,38 @@
+"""Tests for the roster CSV reader."""
+import io
+
+import pytest
+
+from backend.services.roster import RosterReader
+
+
+def _names(text, name_column=None, max_names=5000):
+    reader = RosterReader(io.BytesIO(text.encode("utf-8")), name_column, max_names)
+    return list(reader), reader.stats
+
+
+class TestRosterReader:
+    """Tests for RosterReader header detection, columns and deduplication."""
+
+    def test_headerless_single_column(self):
+        names, stats = _names("Marie Curie\nAlbert Einstein\n\nmarie  curie\n")
+        assert names == ["Marie Curie", "Albert Einstein"]
+        assert stats["duplicates"] == 1
+        assert stats["blank"] == 1
+
+    def test_detects_name_header(self):
+        names, _ = _names("﻿Department,Faculty Name\nPhysics,Marie Curie\nPhysics,\"Feynman, Richard\"\n")
+        assert names == ["Marie Curie", "Feynman, Richard"]
+
+    def test_named_column(self):
+        names, _ = _names("email,Full Name\na@x.edu,Ada Lovelace\n", name_column="full name")
+        assert names == ["Ada Lovelace"]
+
+    def test_missing_named_column(self):
+        with pytest.raises(ValueError):
+            _names("email,name\n", name_column="Faculty")
+
+    def test_column_index_and_limit(self):
+        names, stats = _names("1,Ada\n2,Grace\n3,Alan\n", name_column="1", max_names=2)
+        assert names == ["Ada", "Grace"]
+        assert stats["truncated"]
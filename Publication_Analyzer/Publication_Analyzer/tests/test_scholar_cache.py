@@ -0,0 +1,109 @@
+"""Tests for the Google Scholar profile cache."""
+import time
+
+from backend.services.scholar_cache import ScholarProfileCache
+
+
+TTLS = {"basics": 100, "indices": 10, "publications": 50}
+
+AUTHOR = {
+    "scholar_id": "abc123",
+    "name": "Ada Lovelace",
+    "affiliation": "University of London",
+    "interests": ["computing"],
+    "citedby": 1200,
+    "hindex": 18,
+    "i10index": 25,
+    "filled": ["basics", "indices", "publications"],
+    "publications": [
+        {"bib": {"title": "Notes", "pub_year": "1843"}, "num_citations": 500, "author_pub_id": "abc123:x", "filled": False},
+    ],
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestScholarProfileCache:
+    """Tests for ScholarProfileCache sections, TTLs and persistence."""
+
+    def test_sections_are_cached_independently(self):
+        clock = FakeClock()
+        cache = ScholarProfileCache(None, TTLS, clock=clock)
+        cache.put("abc123", AUTHOR, ["basics", "indices"])
+
+        profile = cache.get("abc123", ["basics", "indices"])
+        assert profile["name"] == "Ada Lovelace"
+        assert profile["hindex"] == 18
+        assert "filled" not in profile
+        assert cache.missing("abc123", ["basics", "publications"]) == ["publications"]
+
+    def test_section_ttls(self):
+        clock = FakeClock()
+        cache = ScholarProfileCache(None, TTLS, clock=clock)
+        cache.put("abc123", AUTHOR, ["basics", "indices"])
+        clock.now += 20
+        assert cache.missing("abc123", ["basics", "indices"]) == ["indices"]
+        assert cache.get("abc123", ["basics", "indices"]) is None
+        assert cache.get("abc123", ["basics"])["name"] == "Ada Lovelace"
+
+    def test_refill_keeps_other_sections(self):
+        clock = FakeClock()
+        cache = ScholarProfileCache(None, TTLS, clock=clock)
+        cache.put("abc123", AUTHOR, ["basics", "indices"])
+        cache.put("abc123", AUTHOR, ["publications"])
+        profile = cache.get("abc123", ["basics", "publications"])
+        assert profile["publications"] == [
+            {"bib": {"title": "Notes", "pub_year": "1843"}, "num_citations": 500, "author_pub_id": "abc123:x"}
+        ]
+
+    def test_persists_to_disk(self, tmp_path):
+        path = tmp_path / "scholar.json"
+        clock = FakeClock()
+        cache = ScholarProfileCache(path, TTLS, clock=clock)
+        cache.put("abc123", AUTHOR, ["basics"])
+        cache.flush()
+
+        reloaded = ScholarProfileCache(path, TTLS, clock=clock)
+        assert reloaded.get("abc123", ["basics"])["affiliation"] == "University of London"
+
+    def test_puts_are_batched_into_one_write(self, tmp_path):
+        path = tmp_path / "scholar.json"
+        cache = ScholarProfileCache(path, TTLS, save_delay=60)
+        for scholar_id in ("a", "b", "c"):
+            cache.put(scholar_id, {**AUTHOR, "scholar_id": scholar_id}, ["basics"])
+        assert not path.exists()
+
+        cache.flush()
+        assert len(ScholarProfileCache(path, TTLS)) == 3
+        mtime = path.stat().st_mtime_ns
+        cache.flush()  # Nothing pending: no rewrite
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_timer_saves_after_delay(self, tmp_path):
+        path = tmp_path / "scholar.json"
+        cache = ScholarProfileCache(path, TTLS, save_delay=0.01)
+        cache.put("abc123", AUTHOR, ["basics"])
+        deadline = time.monotonic() + 2
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(ScholarProfileCache(path, TTLS)) == 1
+
+    def test_corrupt_file_is_a_cold_cache(self, tmp_path):
+        path = tmp_path / "scholar.json"
+        path.write_text("{not json")
+        cache = ScholarProfileCache(path, TTLS)
+        assert cache.get("abc123", ["basics"]) is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_profiles(self):
+        cache = ScholarProfileCache(None, TTLS, max_profiles=2)
+        for scholar_id in ("a", "b", "c"):
+            cache.put(scholar_id, {**AUTHOR, "scholar_id": scholar_id}, ["basics"])
+        assert len(cache) == 2
+        assert cache.missing("a", ["basics"]) == ["basics"]
@@ -0,0 +1,81 @@
+"""Tests for the Google Scholar job runner."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.services.scholar_jobs import ScholarBusy, ScholarJobRunner
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestScholarJobRunner:
+    """Tests for ScholarJobRunner cancellation, caps and metrics."""
+
+    def test_runs_job_and_counts_completion(self):
+        runner = ScholarJobRunner(max_workers=2)
+        result = asyncio.run(runner.run(lambda job, x: x * 2, 21, timeout=1.0))
+        assert result == 42
+        assert _wait_until(lambda: runner.snapshot()["completed"] == 1)
+        assert runner.snapshot()["in_flight"] == 0
+
+    def test_timeout_cancels_running_job_cooperatively(self):
+        runner = ScholarJobRunner(max_workers=1)
+        stopped = threading.Event()
+
+        def slow(job):
+            while True:
+                try:
+                    job.check()
+                except Exception:
+                    stopped.set()
+                    raise
+                time.sleep(0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(runner.run(slow, timeout=0.05))
+        assert runner.snapshot()["abandoned"] == 1
+        assert stopped.wait(1.0)
+        assert _wait_until(lambda: runner.snapshot()["in_flight"] == 0)
+        snap = runner.snapshot()
+        assert snap["abandoned_running"] == 0
+        assert snap["timed_out"] == 1
+
+    def test_queued_job_is_dropped_when_caller_gives_up(self):
+        runner = ScholarJobRunner(max_workers=1)
+        release = threading.Event()
+        ran = []
+
+        async def scenario():
+            blocker = asyncio.ensure_future(runner.run(lambda job: release.wait(2.0), timeout=2.0))
+            await asyncio.sleep(0.05)
+            with pytest.raises(asyncio.TimeoutError):
+                await runner.run(lambda job: ran.append(1), timeout=0.05)
+            assert runner.snapshot()["queue_depth"] == 0
+            release.set()
+            await blocker
+
+        asyncio.run(scenario())
+        assert ran == []
+        assert runner.snapshot()["cancelled_before_start"] == 1
+
+    def test_rejects_beyond_in_flight_cap(self):
+        runner = ScholarJobRunner(max_workers=1, max_in_flight=1)
+        release = threading.Event()
+
+        async def scenario():
+            first = asyncio.ensure_future(runner.run(lambda job: release.wait(2.0), timeout=2.0))
+            await asyncio.sleep(0.05)
+            with pytest.raises(ScholarBusy):
+                await runner.run(lambda job: None, timeout=1.0)
+            release.set()
+            await first
+
+        asyncio.run(scenario())
+        assert runner.snapshot()["rejected"] == 1
@@ -0,0 +1,108 @@
+"""Tests for the stale-while-revalidate search result cache."""
+import asyncio
+
+import pytest
+
+from backend.services.search_cache import SearchResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Fetcher:
+    """Counts calls and returns an increasing version number."""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return self.calls
+
+
+class TestSearchResultCache:
+    """Tests for SearchResultCache freshness, revalidation and deduplication."""
+
+    def test_fresh_hit_skips_fetch(self):
+        cache = SearchResultCache(ttl=10, stale_ttl=60, clock=FakeClock())
+        fetch = Fetcher()
+
+        async def scenario():
+            assert await cache.get("q", fetch) == (1, "miss")
+            assert await cache.get("q", fetch) == (1, "fresh")
+
+        asyncio.run(scenario())
+        assert fetch.calls == 1
+
+    def test_stale_entry_is_served_while_refreshing(self):
+        clock = FakeClock()
+        cache = SearchResultCache(ttl=10, stale_ttl=60, clock=clock)
+        fetch = Fetcher()
+
+        async def scenario():
+            await cache.get("q", fetch)
+            clock.now += 20
+            assert await cache.get("q", fetch) == (1, "stale")
+            assert await cache.get("q", fetch) == (1, "stale")  # Refresh already running
+            await asyncio.sleep(0.05)
+            assert await cache.get("q", fetch) == (2, "fresh")
+
+        asyncio.run(scenario())
+        assert fetch.calls == 2
+        assert cache.snapshot()["refreshed"] == 1
+
+    def test_failed_refresh_keeps_stale_entry(self):
+        clock = FakeClock()
+        cache = SearchResultCache(ttl=10, stale_ttl=60, clock=clock)
+
+        async def scenario():
+            await cache.get("q", Fetcher())
+            clock.now += 20
+            assert await cache.get("q", Fetcher(fail=True)) == (1, "stale")
+            await asyncio.sleep(0.05)
+            assert cache.snapshot()["refresh_failed"] == 1
+            assert await cache.get("q", Fetcher()) == (1, "stale")
+
+        asyncio.run(scenario())
+
+    def test_concurrent_misses_share_one_fetch(self):
+        cache = SearchResultCache(ttl=10, stale_ttl=60)
+        fetch = Fetcher()
+
+        async def scenario():
+            return await asyncio.gather(*(cache.get("q", fetch) for _ in range(5)))
+
+        assert [value for value, _ in asyncio.run(scenario())] == [1] * 5
+        assert fetch.calls == 1
+
+    def test_failed_miss_raises_and_is_not_cached(self):
+        cache = SearchResultCache(ttl=10, stale_ttl=60)
+        with pytest.raises(RuntimeError):
+            asyncio.run(cache.get("q", Fetcher(fail=True)))
+        assert cache.snapshot()["entries"] == 0
+
+    def test_rejected_value_is_returned_but_not_stored(self):
+        clock = FakeClock()
+        cache = SearchResultCache(ttl=10, stale_ttl=60, clock=clock)
+
+        async def scenario():
+            assert await cache.get("q", Fetcher(), cacheable=lambda v: False) == (1, "miss")
+            assert cache.snapshot()["entries"] == 0
+            await cache.get("q", Fetcher())
+            clock.now += 20
+            # A rejected refresh leaves the stale entry in place
+            assert await cache.get("q", Fetcher(), cacheable=lambda v: False) == (1, "stale")
+            await asyncio.sleep(0.05)
+            assert await cache.get("q", Fetcher()) == (1, "stale")
+
+        asyncio.run(scenario())
+        assert cache.snapshot()["uncached"] == 2
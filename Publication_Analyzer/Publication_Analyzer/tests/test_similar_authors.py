@@ -0,0 +1,80 @@
+"""Tests for the similar-author topic index."""
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from backend import main
+from backend.services.similar_authors import AuthorTopicIndex, author_topics
+from backend.services.ttl_cache import TTLCache
+
+AsyncClient = httpx.AsyncClient
+
+
+def _author(author_id, topics, name=None):
+    return {
+        "id": f"https://openalex.org/{author_id}",
+        "display_name": name or author_id,
+        "last_known_institutions": [{"display_name": "MIT"}],
+        "topics": [
+            {"id": f"https://openalex.org/{t}", "display_name": f"Topic {t}", "count": count}
+            for t, count in topics.items()
+        ],
+    }
+
+
+class TestAuthorTopicIndex:
+    """Tests for AuthorTopicIndex."""
+
+    def test_similar_ranks_by_topic_overlap(self):
+        index = AuthorTopicIndex(path=None)
+        index.add_author(_author("A1", {"T1": 20, "T2": 10}))
+        index.add_author(_author("A2", {"T1": 15, "T2": 12, "T3": 1}))
+        index.add_author(_author("A3", {"T3": 30}))
+        index.add_author(_author("A4", {"T9": 5}))
+
+        similar = index.similar("A1", k=5)
+        assert [s["id"] for s in similar] == ["A2"]  # A3 and A4 share no topic with A1
+        assert [s["id"] for s in index.similar("A3")] == ["A2"]
+        assert similar[0]["shared_topics"] == ["Topic T1", "Topic T2"]
+        assert similar[0]["institution"] == "MIT"
+        assert index.similar("A99") is None
+
+    def test_concepts_fallback_and_no_topics(self):
+        author = {"id": "A5", "x_concepts": [{"id": "C1", "display_name": "Physics", "score": 80}]}
+        assert author_topics(author) == {"C1": {"name": "Physics", "weight": 0.8}}
+        assert AuthorTopicIndex(path=None).add_author({"id": "A6"}) is False
+
+    def test_save_and_reload(self, tmp_path):
+        path = tmp_path / "topics.json"
+        index = AuthorTopicIndex(path)
+        index.add_author(_author("A1", {"T1": 5}))
+        index.add_author(_author("A2", {"T1": 3, "T2": 3}))
+        index.save()
+
+        reloaded = AuthorTopicIndex(path)
+        assert len(reloaded) == 2
+        assert reloaded.similar("A1")[0]["id"] == "A2"
+
+
+class TestSimilarAuthorsEndpoint:
+    """Tests for GET /api/author/{id}/similar."""
+
+    def test_author_without_topics_is_422_and_not_refetched(self, monkeypatch):
+        fetches = []
+
+        def handler(request):
+            fetches.append(request.url.path)
+            return httpx.Response(200, json={"id": "https://openalex.org/A9", "display_name": "No Topics"})
+
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(main.httpx, "AsyncClient", lambda **kwargs: AsyncClient(transport=transport, **kwargs))
+        monkeypatch.setattr(main, "author_topic_index", AuthorTopicIndex(None))
+        monkeypatch.setattr(main, "_authors_without_topics", TTLCache(ttl=600))
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc:
+                asyncio.run(main.get_similar_authors("A9", k=10))
+            assert exc.value.status_code == 422
+        assert fetches == ["/authors/A9"]
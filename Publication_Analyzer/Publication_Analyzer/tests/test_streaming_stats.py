@@ -0,0 +1,57 @@
+"""Tests for streaming statistics (Welford moments and P² quantiles)."""
+import numpy as np
+import pytest
+
+from backend.services.streaming_stats import P2Quantile, RunningStats, StreamingSummary
+
+
+class TestRunningStats:
+    """Tests for RunningStats."""
+
+    def test_matches_numpy(self):
+        data = np.random.default_rng(0).normal(50, 10, 1000)
+        stats = RunningStats()
+        for x in data:
+            stats.add(float(x))
+        assert stats.count == 1000
+        assert stats.mean == pytest.approx(data.mean())
+        assert stats.variance == pytest.approx(data.var(ddof=1))
+        assert (stats.min, stats.max) == (data.min(), data.max())
+
+
+class TestP2Quantile:
+    """Tests for P2Quantile estimates."""
+
+    def test_exact_for_few_values(self):
+        median = P2Quantile(0.5)
+        for x in (5, 1, 3, 2):
+            median.add(x)
+        assert median.value == 2.5
+
+    @pytest.mark.parametrize("p", [0.1, 0.5, 0.9])
+    def test_close_to_true_quantile(self, p):
+        data = np.random.default_rng(1).lognormal(3, 1, 5000)
+        estimator = P2Quantile(p)
+        for x in data:
+            estimator.add(float(x))
+        assert estimator.value == pytest.approx(np.quantile(data, p), rel=0.05)
+
+    def test_rejects_invalid_quantile(self):
+        with pytest.raises(ValueError):
+            P2Quantile(1.5)
+
+
+class TestStreamingSummary:
+    """Tests for StreamingSummary."""
+
+    def test_summary_keys_and_missing_values(self):
+        summary = StreamingSummary()
+        for x in (1, None, 2, 3):
+            summary.add(x)
+        result = summary.summary()
+        assert result["count"] == 3
+        assert result["median"] == 2
+        assert set(result) == {"count", "mean", "std", "min", "max", "p10", "p25", "median", "p75", "p90"}
+
+    def test_empty(self):
+        assert StreamingSummary().summary()["median"] is None
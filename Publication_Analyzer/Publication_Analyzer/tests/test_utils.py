@@ -8,6 +8,10 @@ from backend.utils import (
     format_institution_names,
     safe_int,
     truncate_text,
+    normalize_name,
+    normalize_query,
+    affiliations_match,
+    merge_author_results,
 )
 
 
@@ -148,3 +152,79 @@ class TestTruncateText:
         text = "a" * 200
         result = truncate_text(text, 50, suffix="…")
         assert result.endswith("…")
+
+
+class TestNormalizeName:
+    """Tests for normalize_name function."""
+    
+    def test_case_accents_punctuation(self):
+        assert normalize_name("  José  García-Márquez ") == "jose garcia marquez"
+    
+    def test_empty(self):
+        assert normalize_name(None) == ""
+
+
+class TestNormalizeQuery:
+    """Tests for normalize_query function."""
+    
+    def test_case_spacing_and_order(self):
+        assert normalize_query("  Machine   LEARNING ") == normalize_query("learning machine")
+    
+    def test_keeps_punctuation(self):
+        assert normalize_query("C++") != normalize_query("C")
+    
+    def test_empty(self):
+        assert normalize_query(None) == ""
+
+
+class TestAffiliationsMatch:
+    """Tests for affiliations_match function."""
+    
+    def test_containment(self):
+        assert affiliations_match("MIT", "CSAIL, MIT")
+    
+    def test_unknown_never_matches(self):
+        assert not affiliations_match(None, "Stanford University")
+        assert not affiliations_match("", None)
+    
+    def test_whole_words_only(self):
+        assert not affiliations_match("UCL", "UCLA")
+        assert not affiliations_match("MIT", "Smith College")
+        assert affiliations_match("University College London", "UCL, University College London")
+    
+    def test_different(self):
+        assert not affiliations_match("Stanford University", "Harvard University")
+
+
+class TestMergeAuthorResults:
+    """Tests for merge_author_results function."""
+    
+    def test_merges_across_sources(self):
+        scholar = [{"id": "abc", "display_name": "Jane Doe", "institution": "MIT", "works_count": None, "source": "Google Scholar"}]
+        openalex = [
+            {"id": "A1", "display_name": "jane doe", "institution": "MIT", "works_count": 40, "source": "OpenAlex"},
+            {"id": "A2", "display_name": "Jane Doe", "institution": "Oxford", "works_count": 3, "source": "OpenAlex"},
+        ]
+        merged = merge_author_results(scholar, openalex)
+        assert [m["id"] for m in merged] == ["abc", "A2"]
+        assert merged[0]["works_count"] == 40
+        assert merged[0]["alternate_ids"] == {"Google Scholar": "abc", "OpenAlex": "A1"}
+    
+    def test_keeps_same_source_namesakes(self):
+        openalex = [
+            {"id": "A1", "display_name": "Li Wei", "institution": None, "source": "OpenAlex"},
+            {"id": "A2", "display_name": "Li Wei", "institution": None, "source": "OpenAlex"},
+        ]
+        assert len(merge_author_results(openalex)) == 2
+    
+    def test_missing_affiliation_kept_separate(self):
+        scholar = [{"id": "s1", "display_name": "Wei Wang", "institution": None, "works_count": None, "source": "Google Scholar"}]
+        openalex = [{"id": "A1", "display_name": "Wei Wang", "institution": "Tsinghua University", "works_count": 900, "source": "OpenAlex"}]
+        merged = merge_author_results(scholar, openalex)
+        assert [m["id"] for m in merged] == ["s1", "A1"]
+        assert merged[0]["works_count"] is None
+    
+    def test_ucl_not_merged_with_ucla(self):
+        scholar = [{"id": "s1", "display_name": "Jane Doe", "institution": "UCL", "source": "Google Scholar"}]
+        openalex = [{"id": "A1", "display_name": "Jane Doe", "institution": "UCLA", "source": "OpenAlex"}]
+        assert len(merge_author_results(scholar, openalex)) == 2
@@ -0,0 +1,70 @@
+"""Tests for the sparse cosine nearest-neighbour index."""
+import numpy as np
+import pytest
+
+from backend.services.vector_index import SparseVectorIndex
+
+
+def _dense(vector, n_columns, weights=None):
+    row = np.zeros(n_columns)
+    for column, value in vector.items():
+        row[column] = value
+    if weights is not None:
+        row *= weights
+    return row / np.linalg.norm(row)
+
+
+class TestSparseVectorIndex:
+    """Tests for SparseVectorIndex."""
+
+    @pytest.fixture
+    def vectors(self):
+        rng = np.random.default_rng(3)
+        return {
+            f"k{i}": dict(zip(rng.choice(50, 6, replace=False).tolist(), rng.random(6).tolist()))
+            for i in range(200)
+        }
+
+    def test_matches_dense_cosine(self, vectors):
+        index = SparseVectorIndex()
+        for key, vector in vectors.items():
+            index.add(key, vector)
+        matrix = np.array([_dense(v, 50) for v in vectors.values()])
+        scores = matrix @ matrix[0]
+        scores[0] = -1
+        expected = [list(vectors)[i] for i in np.argsort(-scores)[:5]]
+
+        result = index.query(vectors["k0"], k=5, exclude="k0")
+        assert [key for key, _ in result] == expected
+        assert result[0][1] == pytest.approx(scores.max(), abs=1e-4)
+
+    def test_column_weights_match_weighted_cosine(self, vectors):
+        weights = np.linspace(0.5, 3.0, 50)
+        index = SparseVectorIndex()
+        for key, vector in vectors.items():
+            index.add(key, vector, normalize=False)
+        matrix = np.array([_dense(v, 50, weights) for v in vectors.values()])
+        scores = matrix @ matrix[1]
+        scores[1] = -1
+
+        result = index.query(vectors["k1"], k=3, exclude="k1", column_weights=weights)
+        assert [key for key, _ in result] == [list(vectors)[i] for i in np.argsort(-scores)[:3]]
+
+    def test_replace_remove_evict_and_compact(self):
+        index = SparseVectorIndex(max_rows=3)
+        for i in range(200):
+            index.add(f"k{i % 5}", {i % 7: 1.0, 7: 0.5})
+        assert len(index) == 3
+        assert index.keys() == ["k2", "k3", "k4"]
+        assert len(index._keys) < 100  # Tombstoned rows were compacted away
+        assert index.get("k4") == pytest.approx({199 % 7: 1 / np.sqrt(1.25), 7: 0.5 / np.sqrt(1.25)})
+        assert "k0" not in index
+        assert {key for key, _ in index.query({7: 1.0}, k=10)} == {"k2", "k3", "k4"}
+        assert index.remove("k3") and not index.remove("k3")
+        assert {key for key, _ in index.query({7: 1.0}, k=10)} == {"k2", "k4"}
+
+    def test_empty_vectors_are_ignored(self):
+        index = SparseVectorIndex()
+        index.add("a", {})
+        assert len(index) == 0
+        assert index.query({1: 1.0}) == []